@@ -0,0 +1,3 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
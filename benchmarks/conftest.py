@@ -0,0 +1,244 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+from pydantic import HttpUrl
+
+from ikigai import Ikigai
+from ikigai.components import App
+from ikigai.specs import FacetType
+from tests.standin import StandInPlatform, StandInServer
+
+NUM_FACET_GROUPS = 10
+NUM_FACETS_PER_GROUP = 20
+NUM_MODEL_TYPES = 20
+NUM_SUB_MODEL_TYPES = 5
+
+
+def _argument_spec(
+    name: str,
+    argument_type: str = "TEXT",
+    *,
+    children: list[dict[str, Any]] | None = None,
+    is_list: bool = False,
+    is_required: bool = False,
+    options: list | None = None,
+) -> dict[str, Any]:
+    return {
+        "name": name,
+        "argument_type": argument_type,
+        "default_value": None,
+        "children": {child["name"]: child for child in children or []},
+        "have_sub_arguments": bool(children),
+        "is_deprecated": False,
+        "is_hidden": False,
+        "is_list": is_list,
+        "is_required": is_required,
+        "options": options,
+    }
+
+
+def _facet_spec(
+    facet_uid: str, chain_group: str, facet_group: str, facet_type: str
+) -> dict[str, Any]:
+    """
+    Facet spec shaped like the larger platform facets (e.g. aggregate, join),
+    with scalar, option, list and nested map arguments.
+    """
+    column_spec = [
+        _argument_spec("column", is_required=True),
+        _argument_spec(
+            "operation", options=["sum", "mean", "min", "max", "count", "median"]
+        ),
+        _argument_spec("alias"),
+        _argument_spec("ignore_nulls", "BOOLEAN"),
+        _argument_spec("precision", "NUMBER"),
+    ]
+    facet_arguments = [
+        _argument_spec("columns", "MAP", children=column_spec, is_list=True),
+        _argument_spec("group_by", is_list=True),
+        _argument_spec("sort", options=["asc", "desc"]),
+        _argument_spec("limit", "NUMBER"),
+        _argument_spec("drop_duplicates", "BOOLEAN"),
+        _argument_spec(
+            "options",
+            "MAP",
+            children=[
+                _argument_spec("engine", options=["default", "fast"]),
+                _argument_spec("partitions", "NUMBER"),
+                _argument_spec("labels", is_list=True),
+            ],
+        ),
+    ]
+    return {
+        "facet_info": {
+            "facet_uid": facet_uid,
+            "chain_group": chain_group,
+            "facet_group": facet_group,
+            "facet_type": facet_type,
+        },
+        "is_deprecated": False,
+        "is_hidden": False,
+        "facet_requirement": {
+            "max_child_count": 1,
+            "min_child_count": 1,
+            "max_parent_count": 1,
+            "min_parent_count": 1,
+        },
+        "facet_arguments": facet_arguments,
+        "in_arrow_arguments": [],
+        "out_arrow_arguments": [],
+    }
+
+
+def _hyperparameter_spec(
+    name: str, hyperparameter_type: str = "NUMBER", *, options: list | None = None
+) -> dict[str, Any]:
+    return {
+        "name": name,
+        "default_value": None,
+        "have_options": options is not None,
+        "have_sub_hyperparameters": False,
+        "hyperparameter_group": None,
+        "hyperparameter_type": hyperparameter_type,
+        "is_deprecated": False,
+        "is_required": False,
+        "is_hidden": False,
+        "is_list": False,
+        "children": {},
+        "options": options,
+        "sub_hyperparameter_requirements": [],
+    }
+
+
+def _sub_model_spec(name: str) -> dict[str, Any]:
+    hyperparameters = [_hyperparameter_spec(f"alpha_{idx}") for idx in range(10)] + [
+        _hyperparameter_spec("solver", "TEXT", options=["auto", "lbfgs", "sgd"]),
+        _hyperparameter_spec("use_scaling", "BOOLEAN"),
+    ]
+    return {
+        "name": name,
+        "is_deprecated": False,
+        "is_hidden": False,
+        "keywords": [name.lower()],
+        "metrics": {"rmse": {}, "mae": {}, "r2": {}},
+        "parameters": {
+            "target_column": {
+                "name": "target_column",
+                "default_value": None,
+                "have_options": False,
+                "is_deprecated": False,
+                "is_required": True,
+                "is_hidden": False,
+                "is_list": False,
+                "options": [],
+                "parameter_type": "TEXT",
+            }
+        },
+        "hyperparameters": {
+            hyperparameter["name"]: hyperparameter for hyperparameter in hyperparameters
+        },
+    }
+
+
+@pytest.fixture(scope="session")
+def facet_type() -> FacetType:
+    return FacetType.model_validate(
+        _facet_spec(
+            facet_uid="B_000",
+            chain_group="MID",
+            facet_group="TRANSFORMATION",
+            facet_type="AGGREGATE",
+        )
+    )
+
+
+@pytest.fixture(scope="session")
+def facet_specs() -> dict[str, Any]:
+    """Facet specs in the shape returned by the platform, ~600 facet types."""
+    return {
+        chain_group: {
+            f"GROUP_{group_idx}": {
+                f"{chain_group}_{group_idx}_{idx}": _facet_spec(
+                    facet_uid=f"{chain_group[0]}_{group_idx:02d}{idx:02d}",
+                    chain_group=chain_group,
+                    facet_group=f"GROUP_{group_idx}",
+                    facet_type=f"{chain_group}_{group_idx}_{idx}",
+                )
+                for idx in range(NUM_FACETS_PER_GROUP)
+            }
+            for group_idx in range(NUM_FACET_GROUPS)
+        }
+        for chain_group in ("INPUT", "MID", "OUTPUT")
+    }
+
+
+@pytest.fixture(scope="session")
+def model_specs() -> dict[str, Any]:
+    """Model specs in the shape returned by the platform, keyed by model type."""
+    return {
+        f"MODEL_{idx}": {
+            "name": f"MODEL_{idx}",
+            "is_deprecated": False,
+            "is_hidden": False,
+            "keywords": [],
+            "sub_model_types": [
+                _sub_model_spec(f"SUB_MODEL_{idx}_{sub_idx}")
+                for sub_idx in range(NUM_SUB_MODEL_TYPES)
+            ],
+        }
+        for idx in range(NUM_MODEL_TYPES)
+    }
+
+
+@pytest.fixture()
+def standin() -> Generator[StandInServer, None, None]:
+    with StandInServer() as server:
+        yield server
+
+
+@pytest.fixture()
+def standin_platform(standin: StandInServer) -> StandInPlatform:
+    return StandInPlatform(server=standin)
+
+
+@pytest.fixture()
+def ikigai(
+    standin: StandInServer, standin_platform: StandInPlatform
+) -> Generator[Ikigai, None, None]:
+    with Ikigai(
+        user_email=standin_platform.user_email,
+        api_key="api-key",
+        base_url=HttpUrl(standin.base_url),
+    ) as ikigai:
+        yield ikigai
+
+
+@pytest.fixture()
+def app(ikigai: Ikigai) -> App:
+    return ikigai.app.new("benchmark-app").build()
+
+
+@pytest.fixture(scope="session")
+def facet_arguments() -> dict[str, Any]:
+    return {
+        "columns": [
+            {
+                "column": f"column_{idx}",
+                "operation": "sum",
+                "alias": f"total_{idx}",
+                "ignore_nulls": True,
+                "precision": 2,
+            }
+            for idx in range(50)
+        ],
+        "group_by": ["region", "store", "week"],
+        "sort": "asc",
+        "limit": 1000,
+        "drop_duplicates": False,
+        "options": {"engine": "fast", "partitions": 8, "labels": ["a", "b"]},
+    }
@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from ikigai.components import App
+from tests.standin import StandInPlatform
+
+NUM_ROWS = 200_000
+NUM_LISTED_DATASETS = 2_000
+
+
+@pytest.fixture(scope="module")
+def df() -> pd.DataFrame:
+    rng = np.random.default_rng(seed=0)
+    return pd.DataFrame(
+        {
+            "id": np.arange(NUM_ROWS),
+            "store": rng.choice(["north", "south", "east", "west"], size=NUM_ROWS),
+            "week": rng.integers(1, 53, size=NUM_ROWS),
+            "units": rng.integers(0, 1_000, size=NUM_ROWS),
+            "price": rng.random(size=NUM_ROWS).round(4),
+        }
+    )
+
+
+def test_dataset_upload(
+    benchmark: BenchmarkFixture,
+    app: App,
+    standin_platform: StandInPlatform,
+    df: pd.DataFrame,
+) -> None:
+    names = (f"upload-{idx}" for idx in itertools.count())
+
+    dataset = benchmark.pedantic(
+        lambda: app.dataset.new(next(names)).df(df).build(), rounds=5
+    )
+    benchmark.extra_info["bytes"] = dataset.size
+    benchmark.extra_info["parts"] = standin_platform.upload_parts
+    assert dataset.size == len(standin_platform.data[dataset.dataset_id])
+
+
+def test_dataset_download(
+    benchmark: BenchmarkFixture, app: App, df: pd.DataFrame
+) -> None:
+    dataset = app.dataset.new("download").df(df).build()
+
+    downloaded_df = benchmark.pedantic(dataset.df, rounds=5)
+    benchmark.extra_info["bytes"] = dataset.size
+    assert len(downloaded_df) == NUM_ROWS
+
+
+def test_dataset_listing(
+    benchmark: BenchmarkFixture, app: App, standin_platform: StandInPlatform
+) -> None:
+    for idx in range(NUM_LISTED_DATASETS):
+        dataset_id = f"listed-{idx:06d}"
+        standin_platform.datasets[dataset_id] = {
+            "project_id": app.app_id,
+            "dataset_id": dataset_id,
+            "name": f"dataset-{idx}",
+            "filename": f"dataset-{idx}.csv",
+            "data_types": {},
+            "directory": {},
+            "is_optimized": False,
+            "file_extension": "csv",
+            "size": 1024,
+            "is_visible": True,
+            "created_at": "1700000000",
+            "modified_at": "1700000000",
+        }
+
+    datasets = benchmark(app.datasets.search, "")
+    assert len(datasets) == NUM_LISTED_DATASETS
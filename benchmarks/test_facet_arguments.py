@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+from typing import Any
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from ikigai.components import FlowDefinitionBuilder
+from ikigai.specs import FacetType
+
+
+def test_facet_builder_arguments(
+    benchmark: BenchmarkFixture,
+    facet_type: FacetType,
+    facet_arguments: dict[str, Any],
+) -> None:
+    def set_arguments() -> None:
+        FlowDefinitionBuilder().facet(facet_type=facet_type).arguments(
+            **facet_arguments
+        )
+
+    benchmark(set_arguments)
+
+
+def test_facet_builder_arguments_many_facets(
+    benchmark: BenchmarkFixture,
+    facet_type: FacetType,
+    facet_arguments: dict[str, Any],
+) -> None:
+    def build_facets() -> None:
+        builder = FlowDefinitionBuilder()
+        for _ in range(1_000):
+            builder.facet(facet_type=facet_type, args=facet_arguments)
+
+    benchmark.pedantic(build_facets, rounds=5)
@@ -0,0 +1,47 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from ikigai.components import FlowDefinitionBuilder
+from ikigai.components.flow_definition import FlowDefinition
+from ikigai.specs import FacetType
+
+NUM_FACETS = 10_000
+
+
+def _build_flow_definition(facet_type: FacetType) -> FlowDefinition:
+    builder = FlowDefinitionBuilder()
+    facet = builder.facet(facet_type=facet_type, name="facet-0")
+    for idx in range(1, NUM_FACETS):
+        facet = (
+            facet.facet(facet_type=facet_type, name=f"facet-{idx}")
+            .arguments(
+                columns=[{"column": f"column_{idx}", "operation": "sum"}],
+                group_by=["region"],
+            )
+            .arguments(sort="asc", options={"engine": "fast"})
+            .arguments(limit=idx, options={"partitions": 4})
+            .variables(**{f"limit_{idx}": "limit"})
+        )
+    return builder.build()
+
+
+def test_flow_definition_builder_10k_facets(
+    benchmark: BenchmarkFixture, facet_type: FacetType
+) -> None:
+    flow_definition = benchmark.pedantic(
+        _build_flow_definition, args=(facet_type,), rounds=3
+    )
+    assert len(flow_definition.facets) == NUM_FACETS
+    assert len(flow_definition.arrows) == NUM_FACETS - 1
+    assert len(flow_definition.variables) == NUM_FACETS - 1
+
+
+def test_flow_definition_to_dict_10k_facets(
+    benchmark: BenchmarkFixture, facet_type: FacetType
+) -> None:
+    flow_definition = _build_flow_definition(facet_type)
+    flow_definition_dict = benchmark.pedantic(flow_definition.to_dict, rounds=3)
+    assert len(flow_definition_dict["facets"]) == NUM_FACETS
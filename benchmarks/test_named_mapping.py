@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+from dataclasses import dataclass
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from ikigai.typing import NamedMapping
+
+NUM_ITEMS = 10_000
+
+
+@dataclass(frozen=True)
+class _Component:
+    component_id: str
+    name: str
+
+
+@pytest.fixture(scope="module")
+def components() -> dict[str, _Component]:
+    return {
+        f"{idx:08d}": _Component(component_id=f"{idx:08d}", name=f"component-{idx}")
+        for idx in range(NUM_ITEMS)
+    }
+
+
+def test_named_mapping_construction(
+    benchmark: BenchmarkFixture, components: dict[str, _Component]
+) -> None:
+    named_mapping = benchmark(NamedMapping, components)
+    assert len(named_mapping) == NUM_ITEMS
+
+
+def test_named_mapping_getitem(
+    benchmark: BenchmarkFixture, components: dict[str, _Component]
+) -> None:
+    named_mapping = NamedMapping(components)
+    name = f"component-{NUM_ITEMS - 1}"
+    component = benchmark(named_mapping.__getitem__, name)
+    assert component.name == name
+
+
+def test_named_mapping_contains(
+    benchmark: BenchmarkFixture, components: dict[str, _Component]
+) -> None:
+    named_mapping = NamedMapping(components)
+    assert benchmark(named_mapping.__contains__, f"component-{NUM_ITEMS - 1}")
+
+
+def test_named_mapping_get_id(
+    benchmark: BenchmarkFixture, components: dict[str, _Component]
+) -> None:
+    named_mapping = NamedMapping(components)
+    component_id = f"{NUM_ITEMS - 1:08d}"
+    component = benchmark(named_mapping.get_id, component_id)
+    assert component.component_id == component_id
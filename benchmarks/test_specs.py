@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+from typing import Any, cast
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from benchmarks.conftest import (
+    NUM_FACET_GROUPS,
+    NUM_FACETS_PER_GROUP,
+    NUM_MODEL_TYPES,
+)
+from ikigai import Ikigai
+from ikigai.client import datax
+from ikigai.specs import FacetTypes, ModelTypes
+from tests.standin import StandInPlatform
+
+
+def test_facet_types_from_dict(
+    benchmark: BenchmarkFixture, facet_specs: dict[str, Any]
+) -> None:
+    facet_types = benchmark(
+        FacetTypes.from_dict, cast(datax.FacetSpecsDict, facet_specs)
+    )
+    assert len(facet_types.MID.root) == NUM_FACET_GROUPS * NUM_FACETS_PER_GROUP
+
+
+def test_facet_types_find_by_uid(
+    benchmark: BenchmarkFixture, facet_specs: dict[str, Any]
+) -> None:
+    facet_types = FacetTypes.from_dict(cast(datax.FacetSpecsDict, facet_specs))
+    last_uid = f"O_{NUM_FACET_GROUPS - 1:02d}{NUM_FACETS_PER_GROUP - 1:02d}"
+    facet_type = benchmark(facet_types.find_by_uid, last_uid)
+    assert facet_type.facet_uid == last_uid
+
+
+def test_model_types_from_list(
+    benchmark: BenchmarkFixture, model_specs: dict[str, Any]
+) -> None:
+    model_types = benchmark(ModelTypes.from_list, list(model_specs.values()))
+    assert len(model_types) == NUM_MODEL_TYPES
+
+
+def test_ikigai_facet_types(
+    benchmark: BenchmarkFixture,
+    ikigai: Ikigai,
+    standin_platform: StandInPlatform,
+    facet_specs: dict[str, Any],
+) -> None:
+    standin_platform.facet_specs = facet_specs
+    facet_types = benchmark(lambda: ikigai.facet_types)
+    assert len(facet_types.INPUT.root) == NUM_FACET_GROUPS * NUM_FACETS_PER_GROUP
@@ -3,15 +3,21 @@
 # SPDX-License-Identifier: MIT
 
 from ikigai.ikigai import Ikigai
+from ikigai.pool import IkigaiPool
 from ikigai.utils import (
     AppAccessLevel,
+    BaseUrlValidation,
     CustomFacetAccessLevel,
     FlowStatus,
+    RequestCompression,
 )
 
 __all__ = [
     "AppAccessLevel",
+    "BaseUrlValidation",
     "CustomFacetAccessLevel",
     "FlowStatus",
     "Ikigai",
+    "IkigaiPool",
+    "RequestCompression",
 ]
@@ -3,7 +3,42 @@
 # SPDX-License-Identifier: MIT
 
 from ikigai.client import datax
+from ikigai.client.cache import SpecsCache
 from ikigai.client.client import Client
+from ikigai.client.hooks import ErrorEvent, RequestEvent, ResponseEvent, SessionHooks
+from ikigai.client.metrics import MetricsCollector
 from ikigai.client.session import SSLConfig
+from ikigai.client.tracing import (
+    FileSpanExporter,
+    OTLPSpanExporter,
+    Span,
+    SpanExporter,
+    Tracer,
+)
+from ikigai.client.transport import (
+    Cassette,
+    RecordingTransport,
+    ReplayTransport,
+    Transport,
+)
 
-__all__ = ["Client", "SSLConfig", "datax"]
+__all__ = [
+    "Cassette",
+    "Client",
+    "ErrorEvent",
+    "FileSpanExporter",
+    "MetricsCollector",
+    "OTLPSpanExporter",
+    "RecordingTransport",
+    "ReplayTransport",
+    "RequestEvent",
+    "ResponseEvent",
+    "SSLConfig",
+    "SessionHooks",
+    "Span",
+    "SpanExporter",
+    "SpecsCache",
+    "Tracer",
+    "Transport",
+    "datax",
+]
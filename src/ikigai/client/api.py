@@ -5,14 +5,15 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from dataclasses import InitVar
-from functools import cache
 from typing import Any, cast
 
-from pydantic import Field
+from pydantic import ConfigDict, Field
 from pydantic.dataclasses import dataclass
 
+from ikigai.client import codec
+from ikigai.client.cache import SpecsCache
 from ikigai.client.datax import (
     AppDict,
     CustomFacetArgumentDict,
@@ -55,26 +56,37 @@ class AccessAPI:
     def generate_rootkit_token(self, script: str) -> str:
         # This is a weird endpoint, technically it should be under ComponentAPI
         # but it is more about giving privileges to a user to run arbitrary code.
-        resp = self.__session.post(
+        resp = self.__session.post_json(
             path="/component/generate-rootkit-token",
             json={"script": script},
-        ).json()
+        )
         return resp["token"]
 
 
-@dataclass
+@dataclass(config=ConfigDict(arbitrary_types_allowed=True))
 class ComponentAPI:
     # Init only vars
     session: InitVar[Session]
+    specs_cache: InitVar[SpecsCache | None] = None
 
     __session: Session = Field(init=False)
+    __specs_cache: SpecsCache = Field(init=False)
 
-    def __post_init__(self, session: Session) -> None:
+    def __post_init__(
+        self, session: Session, specs_cache: SpecsCache | None = None
+    ) -> None:
         self.__session = session
-
-    def __hash__(self) -> int:
-        # Enable the usage of @cache on specs related apis
-        return hash(id(self))
+        self.__specs_cache = specs_cache if specs_cache is not None else SpecsCache()
+
+    def __iter_listing(
+        self, path: str, params: dict[str, Any], key: str
+    ) -> Iterator[Any]:
+        envelope: dict[str, Any] = {}
+        yield from self.__session.stream_json_items(
+            path=path, params=params, key=key, envelope=envelope
+        )
+        if warning := envelope.get("limit_warning"):
+            logger.warning(warning)
 
     """
     App APIs
@@ -89,7 +101,7 @@ class ComponentAPI:
         directory_dict = (
             cast(dict, directory.to_dict()) if directory is not None else {}
         )
-        resp = self.__session.post(
+        resp = self.__session.post_json(
             path="/component/create-project",
             json={
                 "project": {
@@ -98,20 +110,20 @@ class ComponentAPI:
                     "directory": directory_dict,
                 },
             },
-        ).json()
+        )
         return resp["project_id"]
 
     def get_app(self, app_id: str) -> AppDict:
-        app_dict = self.__session.get(
+        app_dict = self.__session.get_json(
             path="/component/get-project", params={"project_id": app_id}
-        ).json()["project"]
+        )["project"]
 
         return cast(AppDict, app_dict)
 
     def get_app_by_name(self, name: str) -> AppDict:
-        app_dict = self.__session.get(
+        app_dict = self.__session.get_json(
             path="/component/get-project", params={"name": name}
-        ).json()["project"]
+        )["project"]
 
         return cast(AppDict, app_dict)
 
@@ -122,9 +134,9 @@ class ComponentAPI:
         if directory_id is not MISSING:
             params["directory_id"] = directory_id
 
-        response: dict = self.__session.get(
+        response: dict = self.__session.get_json(
             path="/component/get-projects-for-user", params=params
-        ).json()
+        )
 
         app_dicts = response["projects"]
         if warning := response["limit_warning"]:
@@ -132,11 +144,22 @@ class ComponentAPI:
 
         return cast(list[AppDict], app_dicts)
 
+    def iter_apps_for_user(
+        self, directory_id: str | MissingType = MISSING
+    ) -> Iterator[AppDict]:
+        params: dict[str, Any] = {"fetch_all": directory_id is MISSING}
+        if directory_id is not MISSING:
+            params["directory_id"] = directory_id
+
+        return self.__iter_listing(
+            path="/component/get-projects-for-user", params=params, key="projects"
+        )
+
     def get_components_for_app(self, app_id: str) -> GetComponentsForProjectResponse:
-        resp = self.__session.get(
+        resp = self.__session.get_json(
             path="/component/get-components-for-project",
             params={"project_id": app_id},
-        ).json()["project_components"][app_id]
+        )["project_components"][app_id]
 
         return cast(GetComponentsForProjectResponse, resp)
 
@@ -156,37 +179,37 @@ class ComponentAPI:
         if description is not MISSING:
             app["description"] = description
 
-        resp = self.__session.post(
+        resp = self.__session.post_json(
             path="/component/edit-project",
             json={"project": app},
-        ).json()
+        )
 
         return resp["project_id"]
 
     def delete_app(self, app_id: str) -> str:
-        resp = self.__session.post(
+        resp = self.__session.post_json(
             path="/component/delete-project",
             json={"project": {"project_id": app_id}},
-        ).json()
+        )
 
         return resp["project_id"]
 
     def grant_app_access(
         self, app_id: str, email: str, access_level: AppAccessLevel
     ) -> str:
-        resp = self.__session.post(
+        resp = self.__session.post_json(
             path="/component/share-project",
             json={
                 "project": {"project_id": app_id},
                 "user": {"email": email, "project_access_level": access_level},
             },
-        ).json()
+        )
         return resp["project_id"]
 
     def update_app_access(
         self, app_id: str, email: str, access_level: AppAccessLevel
     ) -> str:
-        resp = self.__session.post(
+        resp = self.__session.post_json(
             path="/component/edit-project-access-level-for-user",
             json={
                 "project": {
@@ -194,17 +217,17 @@ class ComponentAPI:
                 },
                 "user": {"email": email, "project_access_level": access_level},
             },
-        ).json()
+        )
         return resp["project_id"]
 
     def revoke_app_access(self, app_id: str, email: str) -> str:
-        resp = self.__session.post(
+        resp = self.__session.post_json(
             path="/component/unshare-project",
             json={
                 "project": {"project_id": app_id},
                 "user": {"email": email},
             },
-        ).json()
+        )
         return resp["project_id"]
 
     """
@@ -222,7 +245,7 @@ class ComponentAPI:
         rootkit_token: str,
         arguments: list[CustomFacetArgumentDict],
     ) -> str:
-        resp = self.__session.post(
+        resp = self.__session.post_json(
             path="/component/create-custom-facet",
             json={
                 "custom_facet": {
@@ -236,28 +259,28 @@ class ComponentAPI:
                     "arguments": arguments,
                 }
             },
-        ).json()
+        )
         return resp["custom_facet_id"]
 
     def get_custom_facet(self, custom_facet_id: str) -> CustomFacetDict:
-        custom_facet_dict = self.__session.get(
+        custom_facet_dict = self.__session.get_json(
             path="/component/get-custom-facet",
             params={"custom_facet_id": custom_facet_id},
-        ).json()["custom_facet"]
+        )["custom_facet"]
 
         return cast(CustomFacetDict, custom_facet_dict)
 
     def get_custom_facet_by_name(self, name: str) -> CustomFacetDict:
-        custom_facet_dict = self.__session.get(
+        custom_facet_dict = self.__session.get_json(
             path="/component/get-custom-facet", params={"name": name}
-        ).json()["custom_facet"]
+        )["custom_facet"]
 
         return cast(CustomFacetDict, custom_facet_dict)
 
     def get_custom_facets_for_user(self) -> list[CustomFacetDict]:
-        custom_facet_dicts = self.__session.get(
+        custom_facet_dicts = self.__session.get_json(
             path="/component/get-custom-facets-for-user",
-        ).json()["custom_facets"]
+        )["custom_facets"]
 
         return cast(list[CustomFacetDict], custom_facet_dicts)
 
@@ -293,21 +316,21 @@ class ComponentAPI:
         if arguments is not MISSING:
             custom_facet["arguments"] = arguments
 
-        resp = self.__session.post(
+        resp = self.__session.post_json(
             path="/component/edit-custom-facet",
             json={
                 "custom_facet": custom_facet,
                 "save_as_version": False,
             },
-        ).json()
+        )
 
         return resp["custom_facet_id"]
 
     def delete_custom_facet(self, custom_facet_id: str) -> None:
-        self.__session.post(
+        self.__session.post_json(
             path="/component/delete-custom-facet",
             json={"custom_facet": {"custom_facet_id": custom_facet_id}},
-        ).json()
+        )
         return None
 
     """
@@ -317,19 +340,19 @@ class ComponentAPI:
     def get_custom_facet_version(
         self, custom_facet_id: str, version_id: str
     ) -> CustomFacetVersionDict:
-        resp = self.__session.get(
+        resp = self.__session.get_json(
             path="/component/get-version-for-custom-facet",
             params={"custom_facet_id": custom_facet_id, "version_id": version_id},
-        ).json()
+        )
         return cast(CustomFacetVersionDict, resp["custom_facet_version"])
 
     def get_custom_facet_versions(
         self, custom_facet_id: str
     ) -> list[CustomFacetVersionDict]:
-        response = self.__session.get(
+        response = self.__session.get_json(
             path="/component/get-versions-for-custom-facet",
             params={"custom_facet_id": custom_facet_id},
-        ).json()
+        )
         if warning := response["limit_warning"]:
             logger.warning(warning)
 
@@ -346,7 +369,7 @@ class ComponentAPI:
         rootkit_token: str,
         arguments: list[CustomFacetArgumentDict],
     ) -> str:
-        response = self.__session.post(
+        response = self.__session.post_json(
             path="/component/edit-custom-facet",
             json={
                 "save_as_version": True,
@@ -360,7 +383,7 @@ class ComponentAPI:
                     "description": description,
                 },
             },
-        ).json()
+        )
 
         if warning := response["limit_warning"]:
             logger.warning(warning)
@@ -370,38 +393,38 @@ class ComponentAPI:
     def grant_custom_facet_access(
         self, custom_facet_id: str, email: str, access_level: CustomFacetAccessLevel
     ) -> str:
-        resp = self.__session.post(
+        resp = self.__session.post_json(
             path="/component/share-custom-facet",
             json={
                 "custom_facet": {"custom_facet_id": custom_facet_id},
                 "user": {"email": email},
                 "access_level": access_level,
             },
-        ).json()
+        )
         return cast(str, resp["custom_facet_id"])
 
     def update_custom_facet_access(
         self, custom_facet_id: str, email: str, access_level: CustomFacetAccessLevel
     ) -> str:
-        resp = self.__session.post(
+        resp = self.__session.post_json(
             path="/component/edit-custom-facet-access-level",
             json={
                 "custom_facet": {"custom_facet_id": custom_facet_id},
                 "user": {"email": email},
                 "access_level": access_level,
             },
-        ).json()
+        )
         return cast(str, resp["custom_facet_id"])
 
     def revoke_custom_facet_access(self, custom_facet_id: str, email: str) -> str:
-        resp = self.__session.post(
+        resp = self.__session.post_json(
             path="/component/edit-custom-facet-access-level",
             json={
                 "custom_facet": {"custom_facet_id": custom_facet_id},
                 "user": {"email": email},
                 "access_level": "NO_ACCESS",
             },
-        ).json()
+        )
         return cast(str, resp["custom_facet_id"])
 
     """
@@ -414,7 +437,7 @@ class ComponentAPI:
         directory_dict = (
             cast(dict, directory.to_dict()) if directory is not None else {}
         )
-        resp = self.__session.post(
+        resp = self.__session.post_json(
             path="/component/create-dataset",
             json={
                 "dataset": {
@@ -423,35 +446,37 @@ class ComponentAPI:
                     "directory": directory_dict,
                 },
             },
-        ).json()
+        )
         return resp["dataset_id"]
 
     def initialize_dataset_download(
         self, app_id: str, dataset_id: str
     ) -> InitializeDatasetDownloadResponse:
-        resp = self.__session.get(
+        resp = self.__session.get_json(
             path="/component/get-dataset-download-url",
             params={
                 "project_id": app_id,
                 "dataset_id": dataset_id,
             },
-        ).json()
+        )
         return cast(InitializeDatasetDownloadResponse, resp)
 
     def get_dataset(self, app_id: str, dataset_id: str) -> DatasetDict:
-        resp = self.__session.get(
+        resp = self.__session.get_json(
             path="/component/get-dataset",
             params={"project_id": app_id, "dataset_id": dataset_id},
-        ).json()
+            conditional=True,
+        )
         dataset = resp["dataset"]
 
         return cast(DatasetDict, dataset)
 
     def get_dataset_by_name(self, app_id: str, name: str) -> DatasetDict:
-        resp = self.__session.get(
+        resp = self.__session.get_json(
             path="/component/get-dataset",
             params={"project_id": app_id, "name": name},
-        ).json()
+            conditional=True,
+        )
         dataset = resp["dataset"]
 
         return cast(DatasetDict, dataset)
@@ -463,20 +488,31 @@ class ComponentAPI:
         if directory_id is not MISSING:
             params["directory_id"] = directory_id
 
-        response = self.__session.get(
+        response = self.__session.get_json(
             path="/component/get-datasets-for-project",
             params=params,
-        ).json()
+        )
         datasets = response["datasets"]
         if warning := response["limit_warning"]:
             logger.warning(warning)
 
         return cast(list[DatasetDict], datasets)
 
+    def iter_datasets_for_app(
+        self, app_id: str, directory_id: str | MissingType = MISSING
+    ) -> Iterator[DatasetDict]:
+        params = {"project_id": app_id, "fetch_all": directory_id is MISSING}
+        if directory_id is not MISSING:
+            params["directory_id"] = directory_id
+
+        return self.__iter_listing(
+            path="/component/get-datasets-for-project", params=params, key="datasets"
+        )
+
     def get_dataset_multipart_upload_urls(
         self, dataset_id: str, app_id: str, filename: str, file_size: int
     ) -> GetDatasetMultipartUploadUrlsResponse:
-        resp = self.__session.get(
+        resp = self.__session.get_json(
             path="/component/get-dataset-multipart-upload-urls",
             params={
                 "dataset_id": dataset_id,
@@ -484,7 +520,7 @@ class ComponentAPI:
                 "filename": filename,
                 "file_size": file_size,
             },
-        ).json()
+        )
 
         return GetDatasetMultipartUploadUrlsResponse(
             upload_id=resp["upload_id"],
@@ -498,10 +534,10 @@ class ComponentAPI:
     def get_dataset_log(
         self, app_id: str, dataset_id: str, limit: int = 5
     ) -> list[DatasetLogDict]:
-        dataset_log = self.__session.get(
+        dataset_log = self.__session.get_json(
             path="/component/get-dataset-log",
             params={"dataset_id": dataset_id, "project_id": app_id, "limit": limit},
-        ).json()["dataset_log"]
+        )["dataset_log"]
 
         return cast(list[DatasetLogDict], dataset_log)
 
@@ -522,12 +558,12 @@ class ComponentAPI:
         if directory is not MISSING:
             dataset["directory"] = directory.to_dict()
 
-        resp = self.__session.post(
+        resp = self.__session.post_json(
             path="/component/edit-dataset",
             json={
                 "dataset": dataset,
             },
-        ).json()
+        )
 
         return resp["dataset_id"]
 
@@ -545,10 +581,10 @@ class ComponentAPI:
         return None
 
     def confirm_dataset_upload(self, app_id: str, dataset_id: str) -> str:
-        resp = self.__session.get(
+        resp = self.__session.get_json(
             path="/component/confirm-dataset-upload",
             params={"project_id": app_id, "dataset_id": dataset_id},
-        ).json()
+        )
         return resp["status"]
 
     def abort_datset_multipart_upload(
@@ -592,10 +628,10 @@ class ComponentAPI:
         return None
 
     def delete_dataset(self, app_id: str, dataset_id: str) -> str:
-        resp = self.__session.post(
+        resp = self.__session.post_json(
             path="/component/delete-dataset",
             json={"dataset": {"project_id": app_id, "dataset_id": dataset_id}},
-        ).json()
+        )
 
         return resp["dataset_id"]
 
@@ -616,7 +652,7 @@ class ComponentAPI:
             cast(dict, directory.to_dict()) if directory is not None else {}
         )
         schedule_dict = schedule if schedule else None
-        resp = self.__session.post(
+        resp = self.__session.post_json(
             path="/component/create-pipeline",
             json={
                 "pipeline": {
@@ -628,20 +664,24 @@ class ComponentAPI:
                     "schedule": schedule_dict,
                 },
             },
-        ).json()
+        )
         return resp["pipeline_id"]
 
     def get_flow(self, flow_id: str) -> FlowDict:
-        flow = self.__session.get(
-            path="/component/get-pipeline", params={"pipeline_id": flow_id}
-        ).json()["pipeline"]
+        flow = self.__session.get_json(
+            path="/component/get-pipeline",
+            params={"pipeline_id": flow_id},
+            conditional=True,
+        )["pipeline"]
 
         return cast(FlowDict, flow)
 
     def get_flow_by_name(self, app_id: str, name: str) -> FlowDict:
-        flow = self.__session.get(
-            path="/component/get-pipeline", params={"project_id": app_id, "name": name}
-        ).json()["pipeline"]
+        flow = self.__session.get_json(
+            path="/component/get-pipeline",
+            params={"project_id": app_id, "name": name},
+            conditional=True,
+        )["pipeline"]
 
         return cast(FlowDict, flow)
 
@@ -652,10 +692,10 @@ class ComponentAPI:
         if directory_id is not MISSING:
             params["directory_id"] = directory_id
 
-        response = self.__session.get(
+        response = self.__session.get_json(
             path="/component/get-pipelines-for-project",
             params=params,
-        ).json()
+        )
 
         flows = response["pipelines"]
         if warning := response["limit_warning"]:
@@ -663,17 +703,28 @@ class ComponentAPI:
 
         return cast(list[FlowDict], flows)
 
+    def iter_flows_for_app(
+        self, app_id: str, directory_id: str | MissingType = MISSING
+    ) -> Iterator[FlowDict]:
+        params = {"project_id": app_id, "fetch_all": directory_id is MISSING}
+        if directory_id is not MISSING:
+            params["directory_id"] = directory_id
+
+        return self.__iter_listing(
+            path="/component/get-pipelines-for-project", params=params, key="pipelines"
+        )
+
     def get_flow_log(
         self, app_id: str, flow_id: str, max_count: int
     ) -> list[FlowLogDict]:
-        log_dicts = self.__session.get(
+        log_dicts = self.__session.get_json(
             path="/component/get-pipeline-log",
             params={
                 "pipeline_id": flow_id,
                 "project_id": app_id,
                 "limit": max_count,
             },
-        ).json()["pipeline_log"]
+        )["pipeline_log"]
 
         return cast(list[FlowLogDict], log_dicts)
 
@@ -712,16 +763,16 @@ class ComponentAPI:
                     "end_time": "1",
                 }
 
-        resp = self.__session.post(
+        resp = self.__session.post_json(
             path="/component/edit-pipeline", json={"pipeline": pipeline}
-        ).json()
+        )
         return resp["pipeline_id"]
 
     def delete_flow(self, app_id: str, flow_id: str) -> str:
-        resp = self.__session.post(
+        resp = self.__session.post_json(
             path="/component/delete-pipeline",
             json={"pipeline": {"project_id": app_id, "pipeline_id": flow_id}},
-        ).json()
+        )
 
         return resp["pipeline_id"]
 
@@ -734,18 +785,18 @@ class ComponentAPI:
         if variables:
             payload["variables"] = variables
 
-        resp = self.__session.post(
+        resp = self.__session.post_json(
             path="/component/run-pipeline",
             json=payload,
-        ).json()
+        )
 
         return resp["pipeline_id"]
 
     def is_flow_runing(self, app_id: str, flow_id: str) -> FlowStatusReportDict:
-        resp = self.__session.get(
+        resp = self.__session.get_json(
             path="/component/is-pipeline-running",
             params={"project_id": app_id, "pipeline_id": flow_id},
-        ).json()
+        )
 
         # BE is a bit inconsistent with the response so clean it up
         status = resp["progress"]["status"] if resp["status"] else "IDLE"
@@ -758,6 +809,25 @@ class ComponentAPI:
             message=message,
         )
 
+    def stream_flow_status(
+        self, app_id: str, flow_id: str, timeout: float | None = None
+    ) -> Iterator[FlowStatusReportDict]:
+        events = self.__session.stream_events(
+            path="/component/stream-pipeline-status",
+            params={"project_id": app_id, "pipeline_id": flow_id},
+            timeout=timeout,
+        )
+        for event in events:
+            # Other events (e.g. keep-alive pings) carry no status
+            if event.event != "status":
+                continue
+            status = codec.loads(event.data)
+            yield FlowStatusReportDict(
+                status=status["status"],
+                progress=status.get("progress"),
+                message=status.get("message", ""),
+            )
+
     """
     Model APIs
     """
@@ -774,7 +844,7 @@ class ComponentAPI:
             cast(dict, directory.to_dict()) if directory is not None else {}
         )
 
-        resp = self.__session.post(
+        resp = self.__session.post_json(
             path="/component/create-model",
             json={
                 "model": {
@@ -786,23 +856,23 @@ class ComponentAPI:
                     "description": description,
                 }
             },
-        ).json()
+        )
 
         return resp["model_id"]
 
     def get_model(self, app_id: str, model_id: str) -> ModelDict:
-        model = self.__session.get(
+        model = self.__session.get_json(
             path="/component/get-model",
             params={"project_id": app_id, "model_id": model_id},
-        ).json()["model"]
+        )["model"]
 
         return cast(ModelDict, model)
 
     def get_model_by_name(self, app_id: str, name: str) -> ModelDict:
-        model = self.__session.get(
+        model = self.__session.get_json(
             path="/component/get-model",
             params={"project_id": app_id, "name": name},
-        ).json()["model"]
+        )["model"]
 
         return cast(ModelDict, model)
 
@@ -813,10 +883,10 @@ class ComponentAPI:
         if directory_id is not MISSING:
             params["directory_id"] = directory_id
 
-        response = self.__session.get(
+        response = self.__session.get_json(
             path="/component/get-models-for-project",
             params=params,
-        ).json()
+        )
 
         models = response["models"]
         if warning := response["limit_warning"]:
@@ -824,6 +894,17 @@ class ComponentAPI:
 
         return cast(list[ModelDict], models)
 
+    def iter_models_for_app(
+        self, app_id: str, directory_id: str | MissingType = MISSING
+    ) -> Iterator[ModelDict]:
+        params = {"project_id": app_id, "fetch_all": directory_id is MISSING}
+        if directory_id is not MISSING:
+            params["directory_id"] = directory_id
+
+        return self.__iter_listing(
+            path="/component/get-models-for-project", params=params, key="models"
+        )
+
     def edit_model(
         self,
         app_id: str,
@@ -844,18 +925,18 @@ class ComponentAPI:
         if description is not MISSING:
             model["description"] = description
 
-        resp = self.__session.post(
+        resp = self.__session.post_json(
             path="/component/edit-model",
             json={"model": model},
-        ).json()
+        )
 
         return resp["model_id"]
 
     def delete_model(self, app_id: str, model_id: str) -> str:
-        resp = self.__session.post(
+        resp = self.__session.post_json(
             path="/component/delete-model",
             json={"model": {"project_id": app_id, "model_id": model_id}},
-        ).json()
+        )
 
         return resp["model_id"]
 
@@ -864,19 +945,19 @@ class ComponentAPI:
     """
 
     def get_model_version(self, app_id: str, version_id: str) -> ModelVersionDict:
-        resp = self.__session.get(
+        resp = self.__session.get_json(
             path="/component/get-model-version",
             params={"project_id": app_id, "version_id": version_id},
-        ).json()
+        )
         model_version = resp["model_version"]
 
         return cast(ModelVersionDict, model_version)
 
     def get_model_versions(self, app_id: str, model_id: str) -> list[ModelVersionDict]:
-        resp = self.__session.get(
+        resp = self.__session.get_json(
             path="/component/get-model-versions",
             params={"project_id": app_id, "model_id": model_id},
-        ).json()
+        )
         model_versions = resp["versions"]
 
         return cast(list[ModelVersionDict], model_versions)
@@ -888,7 +969,7 @@ class ComponentAPI:
     def create_app_directory(self, name: str, parent: Directory | None = None) -> str:
         parent_id = parent.directory_id if parent else ""
 
-        resp = self.__session.post(
+        resp = self.__session.post_json(
             path="/component/create-project-directory",
             json={
                 "directory": {
@@ -896,15 +977,15 @@ class ComponentAPI:
                     "parent_id": parent_id,
                 }
             },
-        ).json()
+        )
 
         return resp["directory_id"]
 
     def get_app_directory(self, directory_id: str) -> NamedDirectoryDict:
-        directory = self.__session.get(
+        directory = self.__session.get_json(
             path="/component/get-project-directory",
             params={"directory_id": directory_id},
-        ).json()["directory"]
+        )["directory"]
 
         return cast(NamedDirectoryDict, directory)
 
@@ -919,18 +1000,18 @@ class ComponentAPI:
         if directory_id is not MISSING:
             params["directory_id"] = directory_id
 
-        directory_dicts = self.__session.get(
+        directory_dicts = self.__session.get_json(
             path="/component/get-project-directories-for-user",
             params=params,
-        ).json()["directories"]
+        )["directories"]
 
         return cast(list[NamedDirectoryDict], directory_dicts)
 
     def delete_app_directory(self, directory_id: str) -> str:
-        resp = self.__session.post(
+        resp = self.__session.post_json(
             path="/component/delete-project-directory",
             json={"directory": {"directory_id": directory_id}},
-        ).json()
+        )
 
         return resp["directory_id"]
 
@@ -939,7 +1020,7 @@ class ComponentAPI:
     ) -> str:
         parent_id = parent.directory_id if parent else ""
 
-        resp = self.__session.post(
+        resp = self.__session.post_json(
             path="/component/create-dataset-directory",
             json={
                 "directory": {
@@ -948,17 +1029,17 @@ class ComponentAPI:
                     "parent_id": parent_id,
                 }
             },
-        ).json()
+        )
 
         return resp["directory_id"]
 
     def get_dataset_directory(
         self, app_id: str, directory_id: str
     ) -> NamedDirectoryDict:
-        directory = self.__session.get(
+        directory = self.__session.get_json(
             path="/component/get-dataset-directory",
             params={"project_id": app_id, "directory_id": directory_id},
-        ).json()["directory"]
+        )["directory"]
 
         return cast(NamedDirectoryDict, directory)
 
@@ -969,10 +1050,10 @@ class ComponentAPI:
         if parent is not MISSING:
             params["directory_id"] = parent.directory_id
 
-        resp = self.__session.get(
+        resp = self.__session.get_json(
             path="/component/get-dataset-directories-for-project",
             params=params,
-        ).json()
+        )
         directories = resp["directories"]
 
         return cast(list[NamedDirectoryDict], directories)
@@ -982,7 +1063,7 @@ class ComponentAPI:
     ) -> str:
         parent_id = parent.directory_id if parent else ""
 
-        resp = self.__session.post(
+        resp = self.__session.post_json(
             path="/component/create-pipeline-directory",
             json={
                 "directory": {
@@ -991,15 +1072,15 @@ class ComponentAPI:
                     "parent_id": parent_id,
                 }
             },
-        ).json()
+        )
 
         return resp["directory_id"]
 
     def get_flow_directory(self, app_id: str, directory_id: str) -> NamedDirectoryDict:
-        directory = self.__session.get(
+        directory = self.__session.get_json(
             path="/component/get-pipeline-directory",
             params={"project_id": app_id, "directory_id": directory_id},
-        ).json()["directory"]
+        )["directory"]
 
         return cast(NamedDirectoryDict, directory)
 
@@ -1010,10 +1091,10 @@ class ComponentAPI:
         if parent is not MISSING:
             params["directory_id"] = parent.directory_id
 
-        resp = self.__session.get(
+        resp = self.__session.get_json(
             path="/component/get-pipeline-directories-for-project",
             params=params,
-        ).json()
+        )
 
         directories = resp["directories"]
         return cast(list[NamedDirectoryDict], directories)
@@ -1023,7 +1104,7 @@ class ComponentAPI:
     ) -> str:
         parent_id = parent.directory_id if parent else ""
 
-        resp = self.__session.post(
+        resp = self.__session.post_json(
             path="/component/create-model-directory",
             json={
                 "directory": {
@@ -1032,15 +1113,15 @@ class ComponentAPI:
                     "parent_id": parent_id,
                 }
             },
-        ).json()
+        )
 
         return resp["directory_id"]
 
     def get_model_directory(self, app_id: str, directory_id: str) -> NamedDirectoryDict:
-        directory = self.__session.get(
+        directory = self.__session.get_json(
             path="/component/get-model-directory",
             params={"project_id": app_id, "directory_id": directory_id},
-        ).json()["directory"]
+        )["directory"]
 
         return cast(NamedDirectoryDict, directory)
 
@@ -1051,10 +1132,10 @@ class ComponentAPI:
         if parent is not MISSING:
             params["directory_id"] = parent.directory_id
 
-        resp = self.__session.get(
+        resp = self.__session.get_json(
             path="/component/get-model-directories-for-project",
             params=params,
-        ).json()
+        )
 
         directories = resp["directories"]
         return cast(list[NamedDirectoryDict], directories)
@@ -1063,19 +1144,23 @@ class ComponentAPI:
     Spec APIs
     """
 
-    @cache
     def get_facet_specs(self) -> FacetSpecsDict:
-        resp = self.__session.get(
-            path="/component/get-facet-specs",
-        ).json()
+        return self.__specs_cache.get(
+            str(self.__session.base_url), "facet_specs", self.__fetch_facet_specs
+        )
+
+    def __fetch_facet_specs(self) -> FacetSpecsDict:
+        resp = self.__session.get_json(path="/component/get-facet-specs")
 
         return cast(FacetSpecsDict, resp)
 
-    @cache
     def get_model_specs(self) -> list[ModelSpecDict]:
-        resp = self.__session.get(
-            path="/component/get-model-specs",
-        ).json()
+        return self.__specs_cache.get(
+            str(self.__session.base_url), "model_specs", self.__fetch_model_specs
+        )
+
+    def __fetch_model_specs(self) -> list[ModelSpecDict]:
+        resp = self.__session.get_json(path="/component/get-model-specs")
 
         model_specs = resp.values()
 
@@ -1101,9 +1186,9 @@ class SearchAPI:
     """
 
     def search_projects_for_user(self, query: str) -> list[AppDict]:
-        response = self.__session.get(
+        response = self.__session.get_json(
             path="/search/search-projects-for-user", params={"query": query}
-        ).json()
+        )
 
         app_dicts = response["projects"]
         if warning := response["limit_warning"]:
@@ -1112,19 +1197,19 @@ class SearchAPI:
         return cast(list[AppDict], app_dicts)
 
     def search_custom_facets_for_user(self, query: str) -> list[CustomFacetDict]:
-        response = self.__session.get(
+        response = self.__session.get_json(
             path="/search/search-custom-facets-for-user",
             params={"query": query},
-        ).json()
+        )
 
         custom_facet_dicts = response["custom_facets"]
         return cast(list[CustomFacetDict], custom_facet_dicts)
 
     def search_datasets_for_project(self, app_id: str, query: str) -> list[DatasetDict]:
-        response = self.__session.get(
+        response = self.__session.get_json(
             path="/search/search-datasets-for-project",
             params={"project_id": app_id, "query": query},
-        ).json()
+        )
 
         dataset_dict = response["datasets"]
         if warning := response["limit_warning"]:
@@ -1133,10 +1218,10 @@ class SearchAPI:
         return cast(list[DatasetDict], dataset_dict)
 
     def search_flows_for_project(self, app_id: str, query: str) -> list[FlowDict]:
-        response = self.__session.get(
+        response = self.__session.get_json(
             path="/search/search-pipelines-for-project",
             params={"project_id": app_id, "query": query},
-        ).json()
+        )
 
         flow_dict = response["pipelines"]
         if warning := response["limit_warning"]:
@@ -1145,10 +1230,10 @@ class SearchAPI:
         return cast(list[FlowDict], flow_dict)
 
     def search_models_for_project(self, app_id: str, query: str) -> list[ModelDict]:
-        response = self.__session.get(
+        response = self.__session.get_json(
             path="/search/search-models-for-project",
             params={"project_id": app_id, "query": query},
-        ).json()
+        )
 
         model_dict = response["models"]
         if warning := response["limit_warning"]:
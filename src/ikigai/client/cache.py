@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class SpecsCache:
+    """
+    Facet and model specs fetched from Ikigai platforms.
+
+    The specs do not depend on the user, clients of different users can share
+    a cache to fetch them once. Entries are kept per base URL, so a cache can
+    be shared by clients of different platforms too. The cache is thread-safe.
+
+    Examples
+    --------
+    >>> specs_cache = SpecsCache()
+    >>> alice = Ikigai(user_email=..., api_key=..., specs_cache=specs_cache)
+    >>> bob = Ikigai(user_email=..., api_key=..., specs_cache=specs_cache)
+    >>> alice.facet_types, bob.facet_types  # Fetched once
+    """
+
+    def __init__(self) -> None:
+        self.__entries: dict[tuple[str, str], Any] = {}
+        self.__lock = threading.Lock()
+
+    def get(self, base_url: str, name: str, load: Callable[[], T]) -> T:
+        """
+        Get the specs, loading them if they are not cached yet.
+
+        Parameters
+        ----------
+        base_url: str
+            Base URL of the platform the specs belong to.
+
+        name: str
+            Name of the specs (e.g. "facet_specs").
+
+        load: Callable[[], T]
+            Fetches the specs, called at most once per base URL and name
+            unless it raises.
+
+        Returns
+        -------
+        T
+            The cached specs.
+        """
+        key = (base_url, name)
+        with self.__lock:
+            if key not in self.__entries:
+                # Concurrent clients wait for the one fetching the specs
+                self.__entries[key] = load()
+            return self.__entries[key]
+
+    def clear(self) -> None:
+        """Forget the cached specs, they are fetched again when needed."""
+        with self.__lock:
+            self.__entries.clear()
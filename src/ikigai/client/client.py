@@ -5,47 +5,117 @@
 from __future__ import annotations
 
 import logging
+import threading
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import InitVar
 from typing import Any
 
+import requests
 from pydantic import ConfigDict, EmailStr, Field, HttpUrl
 from pydantic.dataclasses import dataclass
 from requests import Response
 from requests.exceptions import ConnectionError
 
 from ikigai.client.api import AccessAPI, ComponentAPI, SearchAPI
+from ikigai.client.cache import SpecsCache
+from ikigai.client.compression import DEFAULT_COMPRESSION_THRESHOLD
+from ikigai.client.hooks import SessionHooks
 from ikigai.client.session import Session, SSLConfig
+from ikigai.client.tracing import Span, Tracer
+from ikigai.client.transport import Transport
+from ikigai.utils import BaseUrlValidation, RequestCompression
 from ikigai.utils.compatibility import HTTPMethod
 
 logger = logging.getLogger("ikigai.client")
 
+# Base URLs validated in this process, clients for them skip the validation
+_validated_base_urls: set[str] = set()
+_validated_base_urls_lock = threading.Lock()
+
 
 # Config to avoid extra '/' in url paths: https://pydantic.dev/articles/pydantic-v2-12-release#preserve-empty-url-paths
-@dataclass(config=ConfigDict(url_preserve_empty_path=True))
+@dataclass(
+    config=ConfigDict(arbitrary_types_allowed=True, url_preserve_empty_path=True)
+)
 class Client:
     # Init only vars
     user_email: InitVar[EmailStr]
     api_key: InitVar[str]
     base_url: InitVar[HttpUrl]
     ssl: InitVar[SSLConfig]
+    transport: InitVar[Transport | None] = None
+    validate_base_url: InitVar[BaseUrlValidation] = BaseUrlValidation.EAGER
+    request_compression: InitVar[RequestCompression | None] = None
+    compression_threshold: InitVar[int] = DEFAULT_COMPRESSION_THRESHOLD
+    specs_cache: InitVar[SpecsCache | None] = None
+    coalesce_requests: InitVar[bool] = True
 
     __session: Session = Field(init=False)
+    __specs_cache: SpecsCache = Field(init=False)
     __access_api: AccessAPI = Field(init=False)
     __component_api: ComponentAPI = Field(init=False)
     __search_api: SearchAPI = Field(init=False)
-
-    def __post_init__(
-        self, user_email: EmailStr, api_key: str, base_url: HttpUrl, ssl: SSLConfig
+    __tracer: Tracer | None = Field(init=False, default=None)
+    __detach_tracer: Callable[[], None] | None = Field(init=False, default=None)
+
+    def __post_init__(  # noqa: PLR0917 -- the dataclass passes InitVars positionally
+        self,
+        user_email: EmailStr,
+        api_key: str,
+        base_url: HttpUrl,
+        ssl: SSLConfig,
+        transport: Transport | None = None,
+        validate_base_url: BaseUrlValidation = BaseUrlValidation.EAGER,
+        request_compression: RequestCompression | None = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        specs_cache: SpecsCache | None = None,
+        coalesce_requests: bool = True,
     ) -> None:
+        self.__specs_cache = specs_cache if specs_cache is not None else SpecsCache()
         self.__session = Session(
-            user_email=user_email, api_key=api_key, base_url=base_url, ssl=ssl
+            user_email=user_email,
+            api_key=api_key,
+            base_url=base_url,
+            ssl=ssl,
+            transport=transport,
+            request_compression=request_compression,
+            compression_threshold=compression_threshold,
+            coalesce_requests=coalesce_requests,
         )
+        self.__init_apis()
+
+        # Validate Base URL
+        with _validated_base_urls_lock:
+            is_validated = str(self.__session.base_url) in _validated_base_urls
+        if is_validated:
+            logger.debug("Base URL %s already validated", self.__session.base_url)
+        elif validate_base_url == BaseUrlValidation.EAGER:
+            self.__validate_base_url__()
+        else:
+            self.__session.defer_validation(
+                self.__validate_base_url__,
+                background=validate_base_url == BaseUrlValidation.BACKGROUND,
+            )
+
+    def __init_apis(self) -> None:
         self.__access_api = AccessAPI(session=self.__session)
-        self.__component_api = ComponentAPI(session=self.__session)
+        self.__component_api = ComponentAPI(
+            session=self.__session, specs_cache=self.__specs_cache
+        )
         self.__search_api = SearchAPI(session=self.__session)
 
-        # Validate Base URL
-        self.__validate_base_url__()
+    def __getstate__(self) -> dict[str, Any]:
+        # The session pickles its configuration only, the tracer, its hooks and
+        #   the specs cache stay with the process they were set in
+        return {"session": self.__session}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__session = state["session"]
+        self.__specs_cache = SpecsCache()
+        self.__init_apis()
+        self.__tracer = None
+        self.__detach_tracer = None
 
     def __validate_base_url__(self) -> None:
         heartbeats = {"Search": self.__search_api.heartbeat}
@@ -69,12 +139,62 @@ class Client:
             )
             raise ValueError(message) from None
 
+        with _validated_base_urls_lock:
+            _validated_base_urls.add(str(self.__session.base_url))
+
     def get(self, path: str, params: dict[str, Any] | None = None) -> Response:
         return self.__session.request(method=HTTPMethod.GET, path=path, params=params)
 
     def post(self, path: str, json: dict[Any, Any] | None = None) -> Response:
         return self.__session.request(method=HTTPMethod.POST, path=path, json=json)
 
+    @property
+    def hooks(self) -> SessionHooks:
+        return self.__session.hooks
+
+    def transfer_session(self) -> requests.Session:
+        return self.__session.transfer_session()
+
+    @property
+    def closed(self) -> bool:
+        return self.__session.closed
+
+    def close(self) -> None:
+        self.__session.close()
+
+    @property
+    def tracer(self) -> Tracer | None:
+        return self.__tracer
+
+    def set_tracer(self, tracer: Tracer | None) -> None:
+        if self.__detach_tracer is not None:
+            self.__detach_tracer()
+        self.__tracer = tracer
+        self.__detach_tracer = tracer.attach(self.hooks) if tracer else None
+
+    def span(
+        self, name: str, /, **attributes: Any
+    ) -> AbstractContextManager[Span | None]:
+        """
+        Record a span around a composite operation, if tracing is enabled.
+
+        Parameters
+        ----------
+        name: str
+            Name of the operation.
+
+        **attributes: Any
+            Attributes describing the operation.
+
+        Returns
+        -------
+        AbstractContextManager[Span | None]
+            Context manager yielding the span, or None if tracing is disabled.
+        """
+        if self.__tracer is None:
+            return nullcontext()
+        return self.__tracer.span(name, **attributes)
+
     # APIs
 
     @property
@@ -0,0 +1,37 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+JSON encoding and decoding of request and response bodies.
+
+orjson is used when it is installed (`pip install ikigai[fast]`), it decodes
+large responses (e.g. facet specs, listings) several times faster than the
+standard library. Without it the standard library's json module is used.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover -- depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+BACKEND = "orjson" if orjson is not None else "json"
+"""Name of the JSON library in use."""
+
+
+def loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        # Same as the standard library, non-string keys (e.g. enums) are allowed
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj).encode("utf-8")
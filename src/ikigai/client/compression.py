@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Compression of request bodies.
+
+Responses are decompressed by `requests`, which negotiates gzip and deflate
+(and brotli when the brotli package is installed) with the Accept-Encoding
+header of every request.
+"""
+
+from __future__ import annotations
+
+import gzip
+
+from ikigai.utils import RequestCompression
+
+try:
+    import brotli  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover -- depends on the environment
+    brotli = None
+
+DEFAULT_COMPRESSION_THRESHOLD = 16 * 1024
+"""Request bodies smaller than this many bytes are sent uncompressed."""
+
+
+def check_available(compression: RequestCompression) -> None:
+    if compression == RequestCompression.BROTLI and brotli is None:
+        error_msg = (
+            "Brotli request compression requires the brotli package, "
+            "install it with `pip install brotli`"
+        )
+        raise ValueError(error_msg)
+
+
+def compress(data: bytes, compression: RequestCompression) -> bytes:
+    if compression == RequestCompression.BROTLI:
+        check_available(compression)
+        return brotli.compress(data, quality=5)
+    # Level 6 trades a little compression ratio for speed, a fixed mtime keeps
+    #   the compressed body of a request deterministic (e.g. for replaying)
+    return gzip.compress(data, compresslevel=6, mtime=0)
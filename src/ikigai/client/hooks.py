@@ -0,0 +1,206 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from requests import Response
+
+logger = logging.getLogger("ikigai.client")
+
+
+@dataclass(eq=False)
+class RequestEvent:
+    """
+    A request that is about to be sent to the Ikigai API.
+
+    Hooks called before the request is sent may add headers to `headers`, they
+    are sent with the request.
+    """
+
+    method: str
+    path: str
+    params: Mapping[str, Any] | None = None
+    headers: dict[str, str] = field(default_factory=dict)
+    """Additional headers to send with the request."""
+    started_at: float = field(default_factory=time.perf_counter)
+    """Value of `time.perf_counter()` when the request was created."""
+    body_size: int | None = None
+    """Size of the request body before it is compressed, if it has a body."""
+
+    @property
+    def endpoint(self) -> str:
+        return f"{self.method} {self.path}"
+
+
+@dataclass(frozen=True)
+class ResponseEvent:
+    """
+    A response received from the Ikigai API, including 4XX and 5XX responses.
+    """
+
+    request: RequestEvent
+    status_code: int
+    elapsed: float
+    """Seconds from sending the request until the response was received."""
+    bytes_sent: int
+    """Size of the request body, before compression."""
+    bytes_received: int
+    """Size of the response body, after decompression."""
+    wire_bytes_sent: int = 0
+    """Size of the request body as sent, after compression."""
+    wire_bytes_received: int = 0
+    """Size of the response body as received, before decompression."""
+
+    @classmethod
+    def from_response(
+        cls, request: RequestEvent, response: Response, *, streamed: bool = False
+    ) -> ResponseEvent:
+        elapsed = time.perf_counter() - request.started_at
+        body = response.request.body
+        wire_bytes_sent = len(body) if isinstance(body, (bytes, str)) else 0
+        if streamed:
+            # The body is not read yet, rely on the announced length
+            bytes_received = int(response.headers.get("Content-Length", 0))
+            wire_bytes_received = bytes_received
+        else:
+            bytes_received = len(response.content)
+            wire_bytes_received = _wire_bytes_read(response, default=bytes_received)
+        return cls(
+            request=request,
+            status_code=response.status_code,
+            elapsed=elapsed,
+            bytes_sent=(
+                request.body_size if request.body_size is not None else wire_bytes_sent
+            ),
+            bytes_received=bytes_received,
+            wire_bytes_sent=wire_bytes_sent,
+            wire_bytes_received=wire_bytes_received,
+        )
+
+
+def _wire_bytes_read(response: Response, default: int) -> int:
+    # urllib3 counts the bytes read from the connection, before decoding.
+    #   Responses of other transports (e.g. replayed) are not encoded.
+    tell = getattr(response.raw, "tell", None)
+    if tell is None:
+        return default
+    try:
+        return int(tell())
+    except (OSError, ValueError):
+        return default
+
+
+@dataclass(frozen=True)
+class ErrorEvent:
+    """
+    A request to the Ikigai API that failed, either because no response was
+    received or because the response status indicates an error.
+    """
+
+    request: RequestEvent
+    error: BaseException
+    elapsed: float
+    """Seconds from sending the request until it failed."""
+
+
+BeforeRequestHook = Callable[[RequestEvent], None]
+AfterResponseHook = Callable[[ResponseEvent], None]
+ErrorHook = Callable[[ErrorEvent], None]
+
+
+class SessionHooks:
+    """
+    Callbacks invoked by the session around every request it makes.
+
+    Hooks are observers, an exception raised by a hook is logged and does not
+    affect the request. Hooks may be called concurrently from multiple threads.
+
+    Examples
+    --------
+    >>> unregister = ikigai.hooks.register(
+    ...     after_response=lambda event: print(event.request.path, event.elapsed)
+    ... )
+    >>> app = ikigai.apps["my-app"]
+    /component/get-projects-for-user 0.12
+    >>> unregister()
+    """
+
+    def __init__(self) -> None:
+        # Tuples are replaced (not mutated) so dispatching needs no lock
+        self.__before_request: tuple[BeforeRequestHook, ...] = ()
+        self.__after_response: tuple[AfterResponseHook, ...] = ()
+        self.__error: tuple[ErrorHook, ...] = ()
+        self.__lock = threading.Lock()
+
+    def register(
+        self,
+        *,
+        before_request: BeforeRequestHook | None = None,
+        after_response: AfterResponseHook | None = None,
+        error: ErrorHook | None = None,
+    ) -> Callable[[], None]:
+        """
+        Register hooks for request events.
+
+        Parameters
+        ----------
+        before_request: Callable[[RequestEvent], None] | None
+            Called before a request is sent, may add headers to the request.
+
+        after_response: Callable[[ResponseEvent], None] | None
+            Called when a response is received.
+
+        error: Callable[[ErrorEvent], None] | None
+            Called when a request failed.
+
+        Returns
+        -------
+        Callable[[], None]
+            Unregisters the hooks when called.
+        """
+        with self.__lock:
+            if before_request is not None:
+                self.__before_request = (*self.__before_request, before_request)
+            if after_response is not None:
+                self.__after_response = (*self.__after_response, after_response)
+            if error is not None:
+                self.__error = (*self.__error, error)
+
+        def unregister() -> None:
+            with self.__lock:
+                self.__before_request = tuple(
+                    hook for hook in self.__before_request if hook is not before_request
+                )
+                self.__after_response = tuple(
+                    hook for hook in self.__after_response if hook is not after_response
+                )
+                self.__error = tuple(hook for hook in self.__error if hook is not error)
+
+        return unregister
+
+    def emit_before_request(self, event: RequestEvent) -> None:
+        for hook in self.__before_request:
+            self.__call(hook, event)
+
+    def emit_after_response(self, event: ResponseEvent) -> None:
+        for hook in self.__after_response:
+            self.__call(hook, event)
+
+    def emit_error(self, event: ErrorEvent) -> None:
+        for hook in self.__error:
+            self.__call(hook, event)
+
+    @staticmethod
+    def __call(hook: Callable[[Any], None], event: Any) -> None:
+        try:
+            hook(event)
+        except Exception:
+            logger.warning("Request hook %r failed", hook, exc_info=True)
@@ -0,0 +1,275 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import bisect
+import copy
+import threading
+from collections import Counter
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from ikigai.client.hooks import ErrorEvent, RequestEvent, ResponseEvent, SessionHooks
+
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+"""Upper bounds (in seconds) of the latency histogram buckets."""
+
+
+@dataclass
+class _EndpointMetrics:
+    method: str
+    path: str
+    bucket_counts: list[int]
+    requests: int = 0
+    responses: int = 0
+    latency_sum: float = 0.0
+    latency_max: float = 0.0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    wire_bytes_sent: int = 0
+    wire_bytes_received: int = 0
+    status_codes: Counter[int] = field(default_factory=Counter)
+    errors: Counter[str] = field(default_factory=Counter)
+
+
+class MetricsCollector:
+    """
+    Collects per-endpoint request metrics from a session's hooks.
+
+    For every endpoint (method and path) the collector keeps a latency
+    histogram, the number of bytes sent and received (before and after
+    compression), the response status codes and the errors.
+
+    Parameters
+    ----------
+    buckets: Sequence[float]
+        Upper bounds (in seconds) of the latency histogram buckets.
+
+    Examples
+    --------
+    >>> metrics = MetricsCollector()
+    >>> metrics.attach(ikigai.hooks)
+    >>> datasets = app.datasets()
+    >>> metrics.to_dict()["GET /component/get-datasets-for-project"]["count"]
+    1
+    >>> print(metrics.to_prometheus())
+    # HELP ikigai_request_duration_seconds Latency of requests to the Ikigai API.
+    ...
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        if not buckets or list(buckets) != sorted(set(buckets)):
+            error_msg = (
+                f"Buckets must be non-empty and strictly increasing, got {buckets}"
+            )
+            raise ValueError(error_msg)
+        self.__buckets = tuple(buckets)
+        self.__endpoints: dict[tuple[str, str], _EndpointMetrics] = {}
+        self.__lock = threading.Lock()
+
+    def attach(self, hooks: SessionHooks) -> Callable[[], None]:
+        """
+        Start collecting metrics of the requests made by a session.
+
+        Parameters
+        ----------
+        hooks: SessionHooks
+            Hooks of the session, e.g. `ikigai.hooks`.
+
+        Returns
+        -------
+        Callable[[], None]
+            Stops collecting metrics from the session when called.
+        """
+        return hooks.register(
+            before_request=self.__before_request,
+            after_response=self.__after_response,
+            error=self.__error,
+        )
+
+    def reset(self) -> None:
+        """
+        Discard all collected metrics.
+        """
+        with self.__lock:
+            self.__endpoints.clear()
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        """
+        Collected metrics keyed by endpoint.
+
+        Returns
+        -------
+        dict[str, dict[str, Any]]
+            Metrics of each endpoint keyed by "<METHOD> <path>". Histogram
+            buckets are cumulative and keyed by their upper bound.
+        """
+        with self.__lock:
+            return {
+                f"{metrics.method} {metrics.path}": {
+                    "method": metrics.method,
+                    "path": metrics.path,
+                    "requests": metrics.requests,
+                    "count": metrics.responses,
+                    "latency": {
+                        "sum": metrics.latency_sum,
+                        "max": metrics.latency_max,
+                        "mean": (
+                            metrics.latency_sum / metrics.responses
+                            if metrics.responses
+                            else 0.0
+                        ),
+                        "buckets": self.__cumulative_buckets(metrics),
+                    },
+                    "bytes_sent": metrics.bytes_sent,
+                    "bytes_received": metrics.bytes_received,
+                    "wire_bytes_sent": metrics.wire_bytes_sent,
+                    "wire_bytes_received": metrics.wire_bytes_received,
+                    "status_codes": dict(metrics.status_codes),
+                    "errors": dict(metrics.errors),
+                }
+                for metrics in self.__endpoints.values()
+            }
+
+    def to_prometheus(self, prefix: str = "ikigai") -> str:
+        """
+        Collected metrics in the Prometheus text exposition format.
+
+        Parameters
+        ----------
+        prefix: str
+            Prefix of the metric names.
+
+        Returns
+        -------
+        str
+            The metrics, ready to be served from a `/metrics` endpoint.
+        """
+        with self.__lock:
+            # Format a snapshot, the metrics keep being updated by other threads
+            endpoints = copy.deepcopy(list(self.__endpoints.values()))
+            histograms = [self.__cumulative_buckets(metrics) for metrics in endpoints]
+
+        lines: list[str] = []
+        name = f"{prefix}_request_duration_seconds"
+        lines.append(f"# HELP {name} Latency of requests to the Ikigai API.")
+        lines.append(f"# TYPE {name} histogram")
+        for metrics, histogram in zip(endpoints, histograms):
+            labels = _labels(metrics)
+            for bound, count in histogram.items():
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f"{name}_sum{{{labels}}} {metrics.latency_sum}")
+            lines.append(f"{name}_count{{{labels}}} {metrics.responses}")
+
+        counters = [
+            ("requests_total", "Requests sent to the Ikigai API.", "requests"),
+            ("request_bytes_total", "Bytes sent in request bodies.", "bytes_sent"),
+            (
+                "response_bytes_total",
+                "Bytes received in response bodies.",
+                "bytes_received",
+            ),
+            (
+                "request_wire_bytes_total",
+                "Bytes sent in request bodies, after compression.",
+                "wire_bytes_sent",
+            ),
+            (
+                "response_wire_bytes_total",
+                "Bytes received in response bodies, before decompression.",
+                "wire_bytes_received",
+            ),
+        ]
+        for suffix, description, attribute in counters:
+            name = f"{prefix}_{suffix}"
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} counter")
+            lines.extend(
+                f"{name}{{{_labels(metrics)}}} {getattr(metrics, attribute)}"
+                for metrics in endpoints
+            )
+
+        name = f"{prefix}_responses_total"
+        lines.append(f"# HELP {name} Responses received by status code.")
+        lines.append(f"# TYPE {name} counter")
+        for metrics in endpoints:
+            lines.extend(
+                f'{name}{{{_labels(metrics)},status="{status}"}} {count}'
+                for status, count in sorted(metrics.status_codes.items())
+            )
+
+        name = f"{prefix}_request_errors_total"
+        lines.append(f"# HELP {name} Failed requests by error type.")
+        lines.append(f"# TYPE {name} counter")
+        for metrics in endpoints:
+            lines.extend(
+                f'{name}{{{_labels(metrics)},error="{error}"}} {count}'
+                for error, count in sorted(metrics.errors.items())
+            )
+
+        return "\n".join(lines) + "\n"
+
+    def __endpoint(self, request: RequestEvent) -> _EndpointMetrics:
+        # Must be called while holding the lock
+        key = (request.method, request.path)
+        metrics = self.__endpoints.get(key)
+        if metrics is None:
+            metrics = _EndpointMetrics(
+                method=request.method,
+                path=request.path,
+                bucket_counts=[0] * (len(self.__buckets) + 1),
+            )
+            self.__endpoints[key] = metrics
+        return metrics
+
+    def __cumulative_buckets(self, metrics: _EndpointMetrics) -> dict[str, int]:
+        bounds = [*(f"{bound:g}" for bound in self.__buckets), "+Inf"]
+        cumulative, total = {}, 0
+        for bound, count in zip(bounds, metrics.bucket_counts):
+            total += count
+            cumulative[bound] = total
+        return cumulative
+
+    def __before_request(self, event: RequestEvent) -> None:
+        with self.__lock:
+            metrics = self.__endpoint(event)
+            metrics.requests += 1
+
+    def __after_response(self, event: ResponseEvent) -> None:
+        bucket = bisect.bisect_left(self.__buckets, event.elapsed)
+        with self.__lock:
+            metrics = self.__endpoint(event.request)
+            metrics.responses += 1
+            metrics.bucket_counts[bucket] += 1
+            metrics.latency_sum += event.elapsed
+            metrics.latency_max = max(metrics.latency_max, event.elapsed)
+            metrics.bytes_sent += event.bytes_sent
+            metrics.bytes_received += event.bytes_received
+            metrics.wire_bytes_sent += event.wire_bytes_sent
+            metrics.wire_bytes_received += event.wire_bytes_received
+            metrics.status_codes[event.status_code] += 1
+
+    def __error(self, event: ErrorEvent) -> None:
+        with self.__lock:
+            metrics = self.__endpoint(event.request)
+            metrics.errors[type(event.error).__name__] += 1
+
+
+def _labels(metrics: _EndpointMetrics) -> str:
+    return f'method="{metrics.method}",endpoint="{metrics.path}"'
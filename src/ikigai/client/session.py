@@ -4,20 +4,49 @@
 
 from __future__ import annotations
 
+import itertools
 import logging
+import os
+import threading
+import time
+import warnings
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from concurrent.futures import Future
 from dataclasses import InitVar
 from http import HTTPStatus
-from typing import Annotated, Any, TypeAlias
+from typing import Annotated, Any, TypeAlias, TypeVar, cast
 
 import requests
-from pydantic import ConfigDict, EmailStr, Field, HttpUrl
+from pydantic import ConfigDict, EmailStr, Field, HttpUrl, TypeAdapter
 from pydantic.dataclasses import dataclass
 from requests import Response
+from requests.adapters import HTTPAdapter
 
+from ikigai.client import codec, compression
+from ikigai.client.hooks import ErrorEvent, RequestEvent, ResponseEvent, SessionHooks
+from ikigai.client.sse import ServerSentEvent, iter_events
+from ikigai.client.streaming import iter_array_items
+from ikigai.client.transport import Transport
+from ikigai.utils import RequestCompression
 from ikigai.utils.compatibility import HTTPMethod
 
 logger = logging.getLogger("ikigai.client")
 
+STREAM_CHUNK_SIZE = 64 * 1024
+
+DEFAULT_POOL_SIZE = 32
+"""Connections kept open per host, shared by the threads using a session."""
+
+CONDITIONAL_CACHE_SIZE = 1024
+"""Responses kept by a session to revalidate with conditional requests."""
+
+_UNAVAILABLE_STREAM_STATUSES = (
+    HTTPStatus.NOT_FOUND,
+    HTTPStatus.METHOD_NOT_ALLOWED,
+    HTTPStatus.NOT_IMPLEMENTED,
+)
 
 PEMfilePath: TypeAlias = Annotated[
     str, "Path to a PEM file containing SSL certificates"
@@ -27,26 +56,352 @@ CertKeyPair: TypeAlias = Annotated[
 ]
 SSLConfig: TypeAlias = bool | PEMfilePath | CertKeyPair
 
+T = TypeVar("T")
+
+
+class _DeferredValidation:
+    """
+    Validation run once before the first request that waits for it.
+
+    Requests made by the validation itself do not wait for it. A failed
+    validation raises for the requests waiting for it and is run again by the
+    next request.
+    """
+
+    def __init__(self, validate: Callable[[], None]) -> None:
+        self.__validate = validate
+        self.__result: Future[None] | None = None
+        self.__lock = threading.Lock()
+        self.__local = threading.local()
+        self.succeeded = False
+
+    def start_in_background(self) -> None:
+        threading.Thread(
+            target=self.__run_in_background,
+            name="ikigai-deferred-validation",
+            daemon=True,
+        ).start()
+
+    def wait(self) -> None:
+        if self.succeeded or getattr(self.__local, "validating", False):
+            return None
+
+        with self.__lock:
+            result = self.__result
+            if result is None:
+                result = self.__result = Future()
+                run = True
+            else:
+                run = False
+
+        if run:
+            self.__local.validating = True
+            try:
+                self.__validate()
+            except BaseException as error:
+                with self.__lock:
+                    self.__result = None
+                result.set_exception(error)
+            else:
+                self.succeeded = True
+                result.set_result(None)
+            finally:
+                self.__local.validating = False
+
+        return result.result()
+
+    def __run_in_background(self) -> None:
+        try:
+            self.wait()
+        except Exception as error:
+            # Raised again by the next request, which validates again
+            logger.debug("Background validation failed: %s", error)
+
+
+class _SingleFlight:
+    """
+    Calls made while an identical call is in flight share its outcome.
+
+    The first caller makes the call, the concurrent callers with the same key
+    wait for it and get its result or exception. A call made again by the
+    thread making it (e.g. from a hook) is not shared, it would wait for itself.
+    A call started before the caller's `after` mark is not shared either, see
+    `mark`.
+    """
+
+    def __init__(self) -> None:
+        self.__in_flight: dict[Hashable, tuple[Future[Any], int, int]] = {}
+        self.__lock = threading.Lock()
+        self.__sequence = itertools.count()
+
+    def mark(self) -> int:
+        """
+        Mark the calls started so far.
+
+        Returns
+        -------
+        int
+            Mark to pass as `after` to `call`, so that it does not share the
+            outcome of a call started before the mark.
+        """
+        with self.__lock:
+            return next(self.__sequence)
+
+    def call(self, key: Hashable, fn: Callable[[], T], *, after: int = -1) -> T:
+        thread_id = threading.get_ident()
+        with self.__lock:
+            in_flight = self.__in_flight.get(key)
+            if in_flight is not None and in_flight[2] < after:
+                # Started before the caller's mark, later calls share the caller's
+                in_flight = None
+            if in_flight is None:
+                result: Future[Any] = Future()
+                flight = (result, thread_id, next(self.__sequence))
+                self.__in_flight[key] = flight
+            else:
+                result, caller_id, _ = in_flight
+
+        if in_flight is not None:
+            if caller_id == thread_id:
+                return fn()
+            return result.result()
+
+        try:
+            value = fn()
+        except BaseException as error:
+            result.set_exception(error)
+            raise
+        else:
+            result.set_result(value)
+            return value
+        finally:
+            with self.__lock:
+                # A later call with the same key may have taken the slot
+                if self.__in_flight.get(key) is flight:
+                    del self.__in_flight[key]
+
+
+class _ConditionalCache:
+    """
+    Responses carrying validators (ETag, Last-Modified), by request.
+
+    Cached responses are revalidated with conditional requests, a response
+    that was not modified is served from the cache. The least recently used
+    responses are dropped once there are more than `max_entries`.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.__responses: OrderedDict[Hashable, Response] = OrderedDict()
+        self.__max_entries = max_entries
+        self.__lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Response | None:
+        with self.__lock:
+            resp = self.__responses.get(key)
+            if resp is not None:
+                self.__responses.move_to_end(key)
+            return resp
+
+    def store(self, key: Hashable, resp: Response) -> None:
+        with self.__lock:
+            if not _validators(resp):
+                self.__responses.pop(key, None)
+                return None
+            self.__responses[key] = resp
+            self.__responses.move_to_end(key)
+            while len(self.__responses) > self.__max_entries:
+                self.__responses.popitem(last=False)
+        return None
+
 
 @dataclass(
     config=ConfigDict(arbitrary_types_allowed=True, url_preserve_empty_path=True)
 )
 class Session:
+    """
+    Authenticated session with the Ikigai platform.
+
+    A session can be used from many threads at once. Each thread sends its
+    requests with its own `requests.Session`, all of them share the transport
+    and so its connection pool.
+
+    A session can be pickled (e.g. to a process pool worker), only its
+    configuration is. Sessions unpickled in a process share their connections
+    if they have the same configuration. A forked process opens its own
+    connections instead of using the ones inherited from its parent, a given
+    transport is kept and must handle forking itself. Hooks are not carried
+    over in either case.
+
+    Close the session to release its connections, a session that is garbage
+    collected while open emits a `ResourceWarning` (shown in development mode,
+    `python -X dev`).
+
+    Identical GET requests made concurrently (e.g. by the threads of a pool
+    resolving the same component) are coalesced, only the first one is sent
+    and the others share its response. Request hooks observe the sent request
+    only. A thread does not share the response of a request sent before its
+    last non-GET request finished, so it reads its own changes.
+    """
+
     # Init only vars
     user_email: InitVar[EmailStr]
     api_key: InitVar[str]
     ssl: InitVar[SSLConfig]
 
     base_url: HttpUrl
-    __session: requests.Session = Field(init=False)
+    transport: InitVar[Transport | None] = None
+    request_compression: RequestCompression | None = None
+    """Compression of request bodies larger than the compression threshold."""
+    compression_threshold: int = compression.DEFAULT_COMPRESSION_THRESHOLD
+    coalesce_requests: bool = True
+    """Share one response between identical GET requests made concurrently."""
+    __local: threading.local = Field(init=False)
+    __headers: dict[str, str] = Field(init=False)
+    __hooks: SessionHooks = Field(init=False)
+    __ssl: SSLConfig = Field(init=False)
+    __transport: Transport | None = Field(init=False)
+    __shared_transport: Transport = Field(init=False)
+    __pid: int = Field(init=False)
+    # Set when connecting, a session that failed to initialize has none open
+    __closed: bool = Field(init=False, default=True)
+    __validation: _DeferredValidation | None = Field(init=False, default=None)
+    __in_flight: _SingleFlight = Field(init=False)
+    __conditional_cache: _ConditionalCache = Field(init=False)
+    # Event streams the platform does not serve, they are not requested again
+    __unavailable_streams: set[str] = Field(init=False)
+
+    def __post_init__(
+        self,
+        user_email: EmailStr,
+        api_key: str,
+        ssl: SSLConfig,
+        transport: Transport | None = None,
+    ) -> None:
+        self.__ssl = ssl
+        self.__transport = transport
+        self.__connect()
+        if self.request_compression is not None:
+            compression.check_available(self.request_compression)
+        self.__headers = {"user": user_email, "api-key": api_key}
+        self.__hooks = SessionHooks()
+        self.__in_flight = _SingleFlight()
+        self.__conditional_cache = _ConditionalCache(max_entries=CONDITIONAL_CACHE_SIZE)
+        self.__unavailable_streams = set()
+
+    def __connect(self) -> None:
+        self.__pid = os.getpid()
+        self.__local = threading.local()
+        self.__shared_transport = (
+            self.__transport
+            if self.__transport is not None
+            else HTTPAdapter(pool_maxsize=DEFAULT_POOL_SIZE)
+        )
+        self.__closed = False
 
-    def __post_init__(self, user_email: EmailStr, api_key: str, ssl: SSLConfig) -> None:
-        self.__session = requests.Session()
-        if isinstance(ssl, bool):
-            self.__session.verify = ssl
+    def __reduce__(self) -> tuple[Callable[..., Session], tuple[Any, ...]]:
+        config = {
+            "user_email": self.__headers["user"],
+            "api_key": self.__headers["api-key"],
+            "ssl": self.__ssl,
+            "base_url": self.base_url,
+            "transport": self.__transport,
+            "request_compression": self.request_compression,
+            "compression_threshold": self.compression_threshold,
+            "coalesce_requests": self.coalesce_requests,
+        }
+        return _unpickle_session, (config,)
+
+    def __new_session(self) -> requests.Session:
+        session = requests.Session()
+        if isinstance(self.__ssl, bool):
+            session.verify = self.__ssl
         else:
-            self.__session.cert = ssl
-        self.__session.headers.update({"user": user_email, "api-key": api_key})
+            session.cert = self.__ssl
+        session.mount("http://", self.__shared_transport)
+        session.mount("https://", self.__shared_transport)
+        return session
+
+    def __thread_local(self) -> threading.local:
+        if self.__closed:
+            error_msg = "The session is closed"
+            raise RuntimeError(error_msg)
+        if self.__pid != os.getpid():
+            # Forked, the inherited sockets are still used by the parent
+            self.__connect()
+        return self.__local
+
+    @property
+    def __session(self) -> requests.Session:
+        # requests.Session is not thread-safe (e.g. its cookie jar), every
+        #   thread gets its own sharing the transport's connection pool
+        local = self.__thread_local()
+        session: requests.Session | None = getattr(local, "session", None)
+        if session is None:
+            session = local.session = self.__new_session()
+            session.headers.update(self.__headers)
+        return session
+
+    @property
+    def closed(self) -> bool:
+        return self.__closed
+
+    def close(self) -> None:
+        """
+        Close the connections of the session, including the transport.
+
+        The session can not be used afterwards, closing it again does nothing.
+        """
+        if self.__closed:
+            return None
+        self.__closed = True
+        self.__shared_transport.close()
+        return None
+
+    def defer_validation(
+        self, validate: Callable[[], None], *, background: bool = False
+    ) -> None:
+        """
+        Validate the session before its first request is sent.
+
+        Parameters
+        ----------
+        validate: Callable[[], None]
+            Validation raising if the session is unusable, it may make
+            requests with the session.
+
+        background: bool
+            Start validating right away in a background thread, requests wait
+            for the validation to finish.
+        """
+        validation = _DeferredValidation(validate)
+        self.__validation = validation
+        if background:
+            validation.start_in_background()
+
+    def transfer_session(self) -> requests.Session:
+        """
+        Session for transferring data to and from storage URLs.
+
+        The session uses the SSL configuration and the connection pool of this
+        session but does not carry its credentials, which must not be sent to
+        the (presigned) storage URLs.
+
+        Returns
+        -------
+        requests.Session
+            The transfer session of the calling thread, it is reused by its
+            next transfers and closed with this session. Do not close it or
+            change its headers, pass headers per request instead.
+        """
+        local = self.__thread_local()
+        session: requests.Session | None = getattr(local, "transfer_session", None)
+        if session is None:
+            session = local.transfer_session = self.__new_session()
+        return session
+
+    @property
+    def hooks(self) -> SessionHooks:
+        return self.__hooks
 
     def request(
         self,
@@ -56,20 +411,270 @@ class Session:
         json: dict | None = None,
         *,
         suppress_logging: bool = False,
+        conditional: bool = False,
     ) -> Response:
         logger.debug(
             "[%(method)s] %(path)s %(params)s\njson: %(json)s",
             {"method": method, "path": path, "params": params, "json": json},
         )
+        if self.__validation is not None:
+            self.__validation.wait()
+        if method == HTTPMethod.GET and json is None and self.coalesce_requests:
+            # Every caller decodes the shared response into its own objects
+            key = (path, _params_key(params))
+            return self.__in_flight.call(
+                key,
+                lambda: self.__send(
+                    method=method,
+                    path=path,
+                    params=params,
+                    json=json,
+                    suppress_logging=suppress_logging,
+                    conditional=conditional,
+                ),
+                after=getattr(self.__local, "last_write", -1),
+            )
+        try:
+            return self.__send(
+                method=method,
+                path=path,
+                params=params,
+                json=json,
+                suppress_logging=suppress_logging,
+                conditional=conditional,
+            )
+        finally:
+            if method != HTTPMethod.GET:
+                # Even a failed write may have been applied
+                self.__local.last_write = self.__in_flight.mark()
+
+    def __send(
+        self,
+        method: HTTPMethod,
+        path: str,
+        params: dict[str, str] | None,
+        json: dict | None,
+        *,
+        suppress_logging: bool,
+        conditional: bool,
+    ) -> Response:
         url = f"{self.base_url}{path}"
-        resp = self.__session.request(
-            method=method,
-            url=url,
-            params=params,
-            json=json,
-        )
+        event = RequestEvent(method=method, path=path, params=params)
+        cache_key = (path, _params_key(params))
+        cached = self.__conditional_cache.get(cache_key) if conditional else None
+        if cached is not None:
+            event.headers.update(_validators(cached))
+        data: bytes | None = None
+        if json is not None:
+            data = codec.dumps(json)
+            event.body_size = len(data)
+            event.headers["Content-Type"] = "application/json"
+            if (
+                self.request_compression is not None
+                and len(data) >= self.compression_threshold
+            ):
+                data = compression.compress(data, self.request_compression)
+                event.headers["Content-Encoding"] = self.request_compression
+        self.__hooks.emit_before_request(event)
+        try:
+            resp = self.__session.request(
+                method=method,
+                url=url,
+                params=params,
+                data=data,
+                headers=event.headers or None,
+            )
+        except requests.RequestException as error:
+            self.__emit_error(event, error)
+            raise
+        self.__hooks.emit_after_response(ResponseEvent.from_response(event, resp))
+        try:
+            self.__raise_for_status(
+                method=method,
+                path=path,
+                params=params,
+                resp=resp,
+                suppress_logging=suppress_logging,
+            )
+        except RuntimeError as error:
+            self.__emit_error(event, error)
+            raise
+        if conditional:
+            if resp.status_code == HTTPStatus.NOT_MODIFIED and cached is not None:
+                logger.debug("%s was not modified, using the cached response", path)
+                return cached
+            self.__conditional_cache.store(cache_key, resp)
+        return resp
+
+    def stream_events(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        *,
+        timeout: float | None = None,
+    ) -> Iterator[ServerSentEvent]:
+        """
+        Subscribe to a server-sent events endpoint.
+
+        An endpoint that is missing (e.g. 404) or does not respond with an event
+        stream is remembered, later subscriptions to it fail without sending a
+        request.
+
+        Parameters
+        ----------
+        path: str
+            Path of the event stream endpoint.
+
+        params: dict[str, Any] | None
+            Query parameters of the request.
+
+        timeout: float | None
+            Seconds to wait for the connection and between received events.
+
+        Yields
+        ------
+        ServerSentEvent
+            Events as they are received, until the server closes the stream.
+
+        Raises
+        ------
+        RuntimeError
+            If the server rejected the request or does not respond with an
+            event stream.
+        """
+        if path in self.__unavailable_streams:
+            error_msg = f"Event stream {path} is not available on the platform"
+            raise RuntimeError(error_msg)
+        logger.debug("[STREAM] %(path)s %(params)s", {"path": path, "params": params})
+        if self.__validation is not None:
+            self.__validation.wait()
+        url = f"{self.base_url}{path}"
+        event = RequestEvent(method=HTTPMethod.GET, path=path, params=params)
+        self.__hooks.emit_before_request(event)
+        try:
+            resp = self.__session.get(
+                url,
+                params=params,
+                headers={**event.headers, "Accept": "text/event-stream"},
+                stream=True,
+                timeout=timeout,
+            )
+        except requests.RequestException as error:
+            self.__emit_error(event, error)
+            raise
+        with resp:
+            self.__hooks.emit_after_response(
+                ResponseEvent.from_response(event, resp, streamed=True)
+            )
+            try:
+                self.__raise_for_status(
+                    method=HTTPMethod.GET,
+                    path=path,
+                    params=params,
+                    resp=resp,
+                    suppress_logging=True,
+                )
+            except RuntimeError as error:
+                if resp.status_code in _UNAVAILABLE_STREAM_STATUSES:
+                    self.__unavailable_streams.add(path)
+                self.__emit_error(event, error)
+                raise
+            content_type = resp.headers.get("Content-Type", "")
+            if not content_type.startswith("text/event-stream"):
+                self.__unavailable_streams.add(path)
+                message = f"Expected an event stream from {path}, got '{content_type}'"
+                raise RuntimeError(message)
+            lines = cast(Iterator[str], resp.iter_lines(decode_unicode=True))
+            yield from iter_events(lines)
+
+    def stream_json_items(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        *,
+        key: str,
+        envelope: dict[str, Any] | None = None,
+    ) -> Iterator[Any]:
+        """
+        Make a GET request and yield the items of an array in its JSON response.
+
+        The response is parsed while it is received, each item is yielded as
+        soon as it is complete instead of after decoding the whole body.
+
+        Parameters
+        ----------
+        path: str
+            Path of the endpoint.
+
+        params: dict[str, Any] | None
+            Query parameters of the request.
+
+        key: str
+            Key of the array in the response object.
+
+        envelope: dict[str, Any] | None
+            Receives the other members of the response object, they are
+            complete once the items are exhausted.
+
+        Yields
+        ------
+        Any
+            The decoded items of the array, in order.
+
+        Raises
+        ------
+        RuntimeError
+            If the server rejected the request.
+        """
+        logger.debug("[STREAM] %(path)s %(params)s", {"path": path, "params": params})
+        if self.__validation is not None:
+            self.__validation.wait()
+        url = f"{self.base_url}{path}"
+        event = RequestEvent(method=HTTPMethod.GET, path=path, params=params)
+        self.__hooks.emit_before_request(event)
+        try:
+            resp = self.__session.get(
+                url, params=params, headers=event.headers or None, stream=True
+            )
+        except requests.RequestException as error:
+            self.__emit_error(event, error)
+            raise
+        with resp:
+            self.__hooks.emit_after_response(
+                ResponseEvent.from_response(event, resp, streamed=True)
+            )
+            try:
+                self.__raise_for_status(
+                    method=HTTPMethod.GET,
+                    path=path,
+                    params=params,
+                    resp=resp,
+                    suppress_logging=False,
+                )
+            except RuntimeError as error:
+                self.__emit_error(event, error)
+                raise
+            yield from iter_array_items(
+                resp.iter_content(chunk_size=STREAM_CHUNK_SIZE),
+                key=key,
+                envelope=envelope,
+            )
+
+    def __emit_error(self, event: RequestEvent, error: BaseException) -> None:
+        elapsed = time.perf_counter() - event.started_at
+        self.__hooks.emit_error(ErrorEvent(request=event, error=error, elapsed=elapsed))
+
+    def __raise_for_status(
+        self,
+        method: HTTPMethod,
+        path: str,
+        params: dict[str, Any] | None,
+        resp: Response,
+        *,
+        suppress_logging: bool,
+    ) -> None:
         if resp.status_code < HTTPStatus.BAD_REQUEST:
-            return resp
+            return None
         if resp.status_code < HTTPStatus.INTERNAL_SERVER_ERROR:
             # A 4XX error happened
             if not suppress_logging:
@@ -129,12 +734,14 @@ class Session:
         params: dict[str, Any] | None = None,
         *,
         suppress_logging: bool = False,
+        conditional: bool = False,
     ) -> Response:
         return self.request(
             method=HTTPMethod.GET,
             path=path,
             params=params,
             suppress_logging=suppress_logging,
+            conditional=conditional,
         )
 
     def post(
@@ -151,5 +758,118 @@ class Session:
             suppress_logging=suppress_logging,
         )
 
+    def get_json(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        *,
+        adapter: TypeAdapter | None = None,
+        suppress_logging: bool = False,
+        conditional: bool = False,
+    ) -> Any:
+        """
+        Make a GET request and decode its JSON response.
+
+        Parameters
+        ----------
+        path: str
+            Path of the endpoint.
+
+        params: dict[str, Any] | None
+            Query parameters of the request.
+
+        adapter: TypeAdapter | None
+            Validate the response body with the adapter directly from the
+            received bytes, skipping the intermediate decoding. If None, the
+            body is decoded with the JSON library in use (see `codec`).
+
+        suppress_logging: bool
+            Do not log rejected requests.
+
+        conditional: bool
+            Revalidate the cached response of the same request, if any, with
+            its ETag or Last-Modified date. The cached response is decoded if
+            the server reports it was not modified (304), without
+            transferring it again.
+
+        Returns
+        -------
+        Any
+            The decoded response, validated by the adapter if given.
+        """
+        resp = self.get(
+            path=path,
+            params=params,
+            suppress_logging=suppress_logging,
+            conditional=conditional,
+        )
+        return _decode(resp, adapter=adapter)
+
+    def post_json(
+        self,
+        path: str,
+        json: dict[Any, Any] | None = None,
+        *,
+        adapter: TypeAdapter | None = None,
+        suppress_logging: bool = False,
+    ) -> Any:
+        """
+        Make a POST request and decode its JSON response.
+
+        See `get_json` for the decoding of the response.
+        """
+        resp = self.post(path=path, json=json, suppress_logging=suppress_logging)
+        return _decode(resp, adapter=adapter)
+
     def __del__(self) -> None:
-        self.__session.close()
+        if not self.__closed:
+            warnings.warn(
+                f"Unclosed Ikigai session for {self.base_url}, close the client "
+                "or use it as a context manager",
+                ResourceWarning,
+                source=self,
+                stacklevel=1,
+            )
+            self.close()
+
+
+# Sessions unpickled in this process by configuration, see `Session.__reduce__`
+_unpickled_sessions: weakref.WeakValueDictionary[tuple, Session] = (
+    weakref.WeakValueDictionary()
+)
+_unpickled_sessions_lock = threading.Lock()
+
+
+def _unpickle_session(config: dict[str, Any]) -> Session:
+    if config["transport"] is not None:
+        # Transports are not comparable, the session gets its own
+        return Session(**config)
+
+    key = tuple(config.values())
+    with _unpickled_sessions_lock:
+        session = _unpickled_sessions.get(key)
+        if session is None or session.closed:
+            session = _unpickled_sessions[key] = Session(**config)
+    return session
+
+
+def _params_key(params: dict[str, Any] | None) -> tuple[tuple[str, str], ...]:
+    # Parameters are sent as strings, in any order
+    return tuple(
+        sorted((str(key), str(value)) for key, value in (params or {}).items())
+    )
+
+
+def _validators(resp: Response) -> dict[str, str]:
+    headers = {}
+    if etag := resp.headers.get("ETag"):
+        headers["If-None-Match"] = etag
+    if last_modified := resp.headers.get("Last-Modified"):
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def _decode(resp: Response, adapter: TypeAdapter | None) -> Any:
+    if adapter is not None:
+        return adapter.validate_json(resp.content)
+    return codec.loads(resp.content)
@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ServerSentEvent:
+    """
+    A single event received from a `text/event-stream` response.
+    """
+
+    event: str = "message"
+    data: str = ""
+    id: str | None = None
+    retry: int | None = None
+
+
+def iter_events(lines: Iterable[str]) -> Iterator[ServerSentEvent]:
+    """
+    Parse server-sent events from the lines of an event stream.
+
+    Follows the WHATWG event stream format: events are separated by blank
+    lines, lines starting with ':' are comments and multiple data lines of an
+    event are joined with newlines.
+
+    Parameters
+    ----------
+    lines: Iterable[str]
+        Lines of the event stream without line terminators.
+
+    Yields
+    ------
+    ServerSentEvent
+        The events in the stream, events without data are skipped.
+    """
+    event, event_id, retry = "", None, None
+    data: list[str] = []
+    for line in lines:
+        if not line:
+            # Blank line dispatches the event
+            if data:
+                yield ServerSentEvent(
+                    event=event or "message",
+                    data="\n".join(data),
+                    id=event_id,
+                    retry=retry,
+                )
+            event, data, retry = "", [], None
+            continue
+        if line.startswith(":"):
+            continue
+
+        field, _, value = line.partition(":")
+        value = value.removeprefix(" ")
+        if field == "event":
+            event = value
+        elif field == "data":
+            data.append(value)
+        elif field == "id":
+            event_id = value
+        elif field == "retry" and value.isdigit():
+            retry = int(value)
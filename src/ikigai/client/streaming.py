@@ -0,0 +1,147 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Incremental parsing of JSON listing responses.
+
+Listings (e.g. the datasets of an app) are JSON objects holding one large
+array of components next to a few small members (e.g. `limit_warning`). The
+parser yields the items of the array as soon as each of them is received, so
+only one item is held in memory at a time instead of the whole body and its
+decoded tree.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+_WHITESPACE = " \t\n\r"
+# Characters that may continue a number, e.g. after "12" or "1.5e"
+_NUMBER_CHARS = "0123456789+-.eE"
+
+
+class _Reader:
+    """Text buffer over chunks of a UTF-8 encoded JSON document."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self.__chunks = iter(chunks)
+        self.__decoder = codecs.getincrementaldecoder("utf-8")()
+        self.__json_decoder = json.JSONDecoder()
+        self.__buffer = ""
+        self.__pos = 0
+        self.__eof = False
+
+    def __fill(self) -> bool:
+        if self.__eof:
+            return False
+        # Drop the consumed text before appending more
+        self.__buffer = self.__buffer[self.__pos :]
+        self.__pos = 0
+        for chunk in self.__chunks:
+            if text := self.__decoder.decode(chunk):
+                self.__buffer += text
+                return True
+        self.__buffer += self.__decoder.decode(b"", final=True)
+        self.__eof = True
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character, empty at the end of the document."""
+        while True:
+            while (
+                self.__pos < len(self.__buffer)
+                and self.__buffer[self.__pos] in _WHITESPACE
+            ):
+                self.__pos += 1
+            if self.__pos < len(self.__buffer):
+                return self.__buffer[self.__pos]
+            if not self.__fill():
+                return ""
+
+    def expect(self, *chars: str) -> str:
+        char = self.peek()
+        if char == "" or char not in chars:
+            found = repr(char) if char else "end of document"
+            error_msg = f"Expected one of {', '.join(map(repr, chars))}, got {found}"
+            raise ValueError(error_msg)
+        self.__pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode the next JSON value, reading more chunks until it is complete."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.__json_decoder.raw_decode(self.__buffer, self.__pos)
+            except json.JSONDecodeError:
+                if not self.__fill():
+                    raise
+                continue
+            # A number may continue in the next chunk, it is complete once a
+            #   delimiter follows it (e.g. "12." is decoded as 12)
+            if not self.__eof and (
+                end == len(self.__buffer) or self.__buffer[end] in _NUMBER_CHARS
+            ):
+                self.__fill()
+                continue
+            self.__pos = end
+            return value
+
+
+def iter_array_items(
+    chunks: Iterable[bytes], key: str, envelope: dict[str, Any] | None = None
+) -> Iterator[Any]:
+    """
+    Yield the items of an array member of a JSON object as they are parsed.
+
+    Parameters
+    ----------
+    chunks: Iterable[bytes]
+        The UTF-8 encoded JSON object, in chunks of any size.
+
+    key: str
+        Key of the array member whose items are yielded.
+
+    envelope: dict[str, Any] | None
+        Receives the other members of the object, they are complete once the
+        items are exhausted.
+
+    Yields
+    ------
+    Any
+        The decoded items of the array, in order.
+
+    Raises
+    ------
+    ValueError
+        If the document is not a JSON object or its `key` member is not an
+        array.
+    """
+    reader = _Reader(chunks)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return None
+    while True:
+        member = reader.value()
+        reader.expect(":")
+        if member == key:
+            if reader.peek() != "[":
+                error_msg = f"Expected '{key}' to be an array"
+                raise ValueError(error_msg)
+            reader.expect("[")
+            if reader.peek() != "]":
+                yield reader.value()
+                while reader.expect(",", "]") == ",":
+                    yield reader.value()
+            else:
+                reader.expect("]")
+        else:
+            value = reader.value()
+            if envelope is not None:
+                envelope[member] = value
+        if reader.expect(",", "}") == "}":
+            return None
@@ -0,0 +1,384 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, Protocol
+
+import requests
+
+from ikigai.client.hooks import ErrorEvent, RequestEvent, ResponseEvent, SessionHooks
+
+logger = logging.getLogger("ikigai.client")
+
+_current_span: ContextVar[Span | None] = ContextVar("ikigai_current_span", default=None)
+
+
+@dataclass
+class Span:
+    """
+    A timed operation, part of a trace.
+
+    Spans of composite operations (e.g. uploading a dataset) are the parents of
+    the spans of the operations they are made of, down to individual requests.
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None = None
+    kind: str = "INTERNAL"
+    """INTERNAL for SDK operations, CLIENT for requests made by the SDK."""
+    start_time_ns: int = field(default_factory=time.time_ns)
+    end_time_ns: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    status: str = "UNSET"
+    """UNSET, OK or ERROR."""
+    status_message: str = ""
+
+    @property
+    def duration(self) -> float | None:
+        """Duration of the span in seconds, None while the span has not ended."""
+        if self.end_time_ns is None:
+            return None
+        return (self.end_time_ns - self.start_time_ns) / 1e9
+
+    @property
+    def traceparent(self) -> str:
+        """W3C trace context header value identifying this span."""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_error(self, error: BaseException | str) -> None:
+        self.status = "ERROR"
+        self.status_message = (
+            error if isinstance(error, str) else f"{type(error).__name__}: {error}"
+        )
+
+    def end(self) -> None:
+        if self.end_time_ns is None:
+            self.end_time_ns = time.time_ns()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "kind": self.kind,
+            "start_time_ns": self.start_time_ns,
+            "end_time_ns": self.end_time_ns,
+            "duration": self.duration,
+            "attributes": self.attributes,
+            "status": self.status,
+            "status_message": self.status_message,
+        }
+
+
+class SpanExporter(Protocol):
+    def export(self, spans: Sequence[Span]) -> None: ...
+
+    def shutdown(self) -> None: ...
+
+
+class FileSpanExporter:
+    """
+    Export spans as JSON lines appended to a local file.
+
+    Parameters
+    ----------
+    path: Path | str
+        File to append the spans to, created if it does not exist.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.__path = Path(path)
+        self.__lock = threading.Lock()
+
+    def export(self, spans: Sequence[Span]) -> None:
+        lines = "".join(
+            json.dumps(span.to_dict(), default=str) + "\n" for span in spans
+        )
+        with self.__lock, self.__path.open("a", encoding="utf-8") as file:
+            file.write(lines)
+
+    def shutdown(self) -> None:
+        return None
+
+
+class OTLPSpanExporter:
+    """
+    Export spans to an OpenTelemetry collector using OTLP over HTTP (JSON).
+
+    Parameters
+    ----------
+    endpoint: str
+        Traces endpoint of the collector.
+
+    headers: Mapping[str, str] | None
+        Additional headers sent with every export, e.g. for authentication.
+
+    service_name: str
+        Service name reported as resource attribute of the spans.
+
+    timeout: float
+        Seconds to wait for the collector to accept an export.
+    """
+
+    def __init__(
+        self,
+        endpoint: str = "http://localhost:4318/v1/traces",
+        headers: Mapping[str, str] | None = None,
+        service_name: str = "ikigai",
+        timeout: float = 10.0,
+    ) -> None:
+        self.__endpoint = endpoint
+        self.__service_name = service_name
+        self.__timeout = timeout
+        self.__session = requests.Session()
+        self.__session.headers.update(
+            {"Content-Type": "application/json", **(headers or {})}
+        )
+
+    def export(self, spans: Sequence[Span]) -> None:
+        payload = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": _otlp_attributes(
+                            {"service.name": self.__service_name}
+                        )
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "ikigai"},
+                            "spans": [_otlp_span(span) for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+        try:
+            resp = self.__session.post(
+                self.__endpoint, data=json.dumps(payload), timeout=self.__timeout
+            )
+            resp.raise_for_status()
+        except requests.RequestException as error:
+            # Tracing must never break the traced operations
+            logger.warning("Failed to export %d spans: %s", len(spans), error)
+
+    def shutdown(self) -> None:
+        self.__session.close()
+
+
+class Tracer:
+    """
+    Records spans of SDK operations and the requests they make.
+
+    Requests carry the trace context of their span in the W3C `traceparent`
+    header, so the platform's traces can be joined with the SDK's.
+
+    Parameters
+    ----------
+    exporter: SpanExporter
+        Receives the finished spans, e.g. a `FileSpanExporter` or an
+        `OTLPSpanExporter`.
+
+    batch_size: int
+        Number of finished spans buffered before they are exported.
+
+    Examples
+    --------
+    >>> tracer = Tracer(exporter=FileSpanExporter("spans.jsonl"))
+    >>> ikigai.set_tracer(tracer)
+    >>> with tracer.span("nightly-refresh"):
+    ...     app.dataset.new("sales").df(df).build()
+    >>> tracer.flush()
+    """
+
+    def __init__(self, exporter: SpanExporter, batch_size: int = 64) -> None:
+        if batch_size < 1:
+            error_msg = f"batch_size must be at least 1, got {batch_size}"
+            raise ValueError(error_msg)
+        self.__exporter = exporter
+        self.__batch_size = batch_size
+        self.__finished: list[Span] = []
+        self.__requests: dict[RequestEvent, Span] = {}
+        self.__lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, /, **attributes: Any) -> Iterator[Span]:
+        """
+        Record a span around the operations in the with block.
+
+        Parameters
+        ----------
+        name: str
+            Name of the operation.
+
+        **attributes: Any
+            Attributes describing the operation.
+
+        Yields
+        ------
+        Span
+            The span, it is the parent of spans started within the block.
+        """
+        span = self.__start(name=name, attributes=attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as error:
+            span.set_error(error)
+            raise
+        finally:
+            _current_span.reset(token)
+            self.__finish(span)
+
+    def attach(self, hooks: SessionHooks) -> Callable[[], None]:
+        """
+        Record a span for every request made by a session.
+
+        Parameters
+        ----------
+        hooks: SessionHooks
+            Hooks of the session.
+
+        Returns
+        -------
+        Callable[[], None]
+            Stops recording the session's requests when called.
+        """
+        return hooks.register(
+            before_request=self.__before_request,
+            after_response=self.__after_response,
+            error=self.__error,
+        )
+
+    def flush(self) -> None:
+        """
+        Export all finished spans that are still buffered.
+        """
+        with self.__lock:
+            spans, self.__finished = self.__finished, []
+        if spans:
+            self.__exporter.export(spans)
+
+    def shutdown(self) -> None:
+        """
+        Export the buffered spans and release the exporter's resources.
+        """
+        self.flush()
+        self.__exporter.shutdown()
+
+    def __start(
+        self, name: str, attributes: dict[str, Any], kind: str = "INTERNAL"
+    ) -> Span:
+        parent = _current_span.get()
+        return Span(
+            name=name,
+            trace_id=parent.trace_id if parent else os.urandom(16).hex(),
+            span_id=os.urandom(8).hex(),
+            parent_span_id=parent.span_id if parent else None,
+            kind=kind,
+            attributes=attributes,
+        )
+
+    def __finish(self, span: Span) -> None:
+        span.end()
+        with self.__lock:
+            self.__finished.append(span)
+            if len(self.__finished) < self.__batch_size:
+                return None
+            spans, self.__finished = self.__finished, []
+        self.__exporter.export(spans)
+        return None
+
+    def __before_request(self, event: RequestEvent) -> None:
+        span = self.__start(
+            name=f"{event.method} {event.path}",
+            attributes={"http.method": event.method, "http.path": event.path},
+            kind="CLIENT",
+        )
+        event.headers["traceparent"] = span.traceparent
+        with self.__lock:
+            self.__requests[event] = span
+
+    def __after_response(self, event: ResponseEvent) -> None:
+        with self.__lock:
+            span = self.__requests.pop(event.request, None)
+        if span is None:
+            return None
+        span.attributes.update(
+            {
+                "http.status_code": event.status_code,
+                "http.request.body.size": event.bytes_sent,
+                "http.response.body.size": event.bytes_received,
+            }
+        )
+        if event.status_code >= HTTPStatus.BAD_REQUEST:
+            span.set_error(f"HTTP {event.status_code}")
+        self.__finish(span)
+        return None
+
+    def __error(self, event: ErrorEvent) -> None:
+        with self.__lock:
+            span = self.__requests.pop(event.request, None)
+        if span is None:
+            # Span already finished with the error response
+            return None
+        span.set_error(event.error)
+        self.__finish(span)
+        return None
+
+
+def _otlp_attributes(attributes: Mapping[str, Any]) -> list[dict[str, Any]]:
+    encoded: list[dict[str, Any]] = []
+    for key, value in attributes.items():
+        if isinstance(value, bool):
+            encoded_value: dict[str, Any] = {"boolValue": value}
+        elif isinstance(value, int):
+            encoded_value = {"intValue": str(value)}
+        elif isinstance(value, float):
+            encoded_value = {"doubleValue": value}
+        else:
+            encoded_value = {"stringValue": str(value)}
+        encoded.append({"key": key, "value": encoded_value})
+    return encoded
+
+
+_OTLP_SPAN_KINDS = {"INTERNAL": 1, "CLIENT": 3}
+_OTLP_STATUS_CODES = {"UNSET": 0, "OK": 1, "ERROR": 2}
+
+
+def _otlp_span(span: Span) -> dict[str, Any]:
+    otlp_span: dict[str, Any] = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": _OTLP_SPAN_KINDS.get(span.kind, 0),
+        "startTimeUnixNano": str(span.start_time_ns),
+        "endTimeUnixNano": str(span.end_time_ns or span.start_time_ns),
+        "attributes": _otlp_attributes(span.attributes),
+        "status": {
+            "code": _OTLP_STATUS_CODES[span.status],
+            "message": span.status_message,
+        },
+    }
+    if span.parent_span_id:
+        otlp_span["parentSpanId"] = span.parent_span_id
+    return otlp_span
@@ -0,0 +1,252 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Pluggable transports for the session.
+
+A transport is a `requests` adapter, it sends the prepared requests of the
+session. Besides the default HTTP transport, requests can be recorded to a
+cassette and replayed from it, so that code using the SDK can be tested and
+benchmarked deterministically without a network connection.
+"""
+
+from __future__ import annotations
+
+import base64
+import io
+import json
+import threading
+from collections import defaultdict, deque
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, TypeAlias
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from ikigai.utils.compatibility import Self
+
+Transport: TypeAlias = BaseAdapter
+"""Sends the requests of a session, any `requests` adapter can be used."""
+
+Interaction: TypeAlias = dict[str, Any]
+
+
+def _request_key(method: str | None, url: str | None, body: bytes | None) -> str:
+    # Query parameters are sorted, their order does not identify a request
+    parts = urlsplit(url or "")
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    body_text = body.decode("utf-8", errors="replace") if body else ""
+    return f"{method} {parts.netloc}{parts.path}?{query}\n{body_text}"
+
+
+def _encode_body(body: bytes) -> dict[str, str]:
+    try:
+        return {"encoding": "utf-8", "data": body.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"encoding": "base64", "data": base64.b64encode(body).decode("ascii")}
+
+
+def _decode_body(body: Mapping[str, str]) -> bytes:
+    if body["encoding"] == "base64":
+        return base64.b64decode(body["data"])
+    return body["data"].encode("utf-8")
+
+
+def _request_body(request: requests.PreparedRequest) -> bytes | None:
+    body = request.body
+    if isinstance(body, str):
+        return body.encode("utf-8")
+    if isinstance(body, bytes):
+        return body
+    return None
+
+
+class Cassette:
+    """
+    Recorded request and response pairs.
+
+    Requests are matched by method, URL (ignoring the order of query
+    parameters) and body. Identical requests are answered with their recorded
+    responses in order, the last one is repeated once all were replayed (e.g.
+    for status polling). Request headers are not recorded, so cassettes never
+    contain credentials.
+    """
+
+    def __init__(self, interactions: list[Interaction] | None = None) -> None:
+        self.__interactions: list[Interaction] = []
+        self.__responses: dict[str, deque[Interaction]] = defaultdict(deque)
+        self.__lock = threading.Lock()
+        for interaction in interactions or []:
+            self.append(interaction)
+
+    def __len__(self) -> int:
+        return len(self.__interactions)
+
+    @classmethod
+    def load(cls, path: Path | str) -> Self:
+        with Path(path).open(encoding="utf-8") as file:
+            return cls(interactions=json.load(file)["interactions"])
+
+    def save(self, path: Path | str) -> None:
+        with self.__lock:
+            interactions = list(self.__interactions)
+        with Path(path).open("w", encoding="utf-8") as file:
+            json.dump({"interactions": interactions}, file, indent=1)
+
+    def append(self, interaction: Interaction) -> None:
+        request = interaction["request"]
+        key = _request_key(
+            method=request["method"],
+            url=request["url"],
+            body=_decode_body(request["body"]) if request["body"] else None,
+        )
+        with self.__lock:
+            self.__interactions.append(interaction)
+            self.__responses[key].append(interaction)
+
+    def record(
+        self, request: requests.PreparedRequest, response: requests.Response
+    ) -> None:
+        body = _request_body(request)
+        self.append(
+            {
+                "request": {
+                    "method": request.method,
+                    "url": request.url,
+                    "body": _encode_body(body) if body else None,
+                },
+                "response": {
+                    "status": response.status_code,
+                    "reason": response.reason,
+                    "headers": dict(response.headers),
+                    "body": _encode_body(response.content),
+                },
+            }
+        )
+
+    def play(self, request: requests.PreparedRequest) -> Interaction | None:
+        key = _request_key(
+            method=request.method, url=request.url, body=_request_body(request)
+        )
+        with self.__lock:
+            responses = self.__responses.get(key)
+            if not responses:
+                return None
+            return responses.popleft() if len(responses) > 1 else responses[0]
+
+
+class RecordingTransport(BaseAdapter):
+    """
+    Transport recording all requests and responses to a cassette.
+
+    Parameters
+    ----------
+    path: Path | str
+        File the cassette is saved to when the transport is closed.
+
+    transport: Transport | None
+        Transport actually sending the requests, the default HTTP transport
+        if None.
+
+    Examples
+    --------
+    >>> transport = RecordingTransport("upload.json")
+    >>> ikigai = Ikigai(user_email=..., api_key=..., transport=transport)
+    >>> dataset = app.dataset.new("sales").df(df).build()
+    >>> transport.save()
+    """
+
+    def __init__(self, path: Path | str, transport: Transport | None = None) -> None:
+        super().__init__()
+        self.__path = Path(path)
+        self.__transport = transport if transport is not None else HTTPAdapter()
+        self.cassette = Cassette()
+
+    def send(  # noqa: PLR0917 -- signature of requests.adapters.BaseAdapter
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Any = None,
+        verify: Any = True,
+        cert: Any = None,
+        proxies: Mapping[str, str] | None = None,
+    ) -> requests.Response:
+        response = self.__transport.send(
+            request,
+            stream=stream,
+            timeout=timeout,
+            verify=verify,
+            cert=cert,
+            proxies=dict(proxies) if proxies is not None else None,
+        )
+        # Reading the content consumes streamed responses, they are read from
+        #   the recorded content instead
+        self.cassette.record(request=request, response=response)
+        if stream:
+            response.raw = io.BytesIO(response.content)
+        return response
+
+    def save(self) -> None:
+        self.cassette.save(self.__path)
+
+    def close(self) -> None:
+        self.save()
+        self.__transport.close()
+
+
+class ReplayTransport(BaseAdapter):
+    """
+    Transport answering requests with the responses recorded in a cassette.
+
+    Parameters
+    ----------
+    cassette: Cassette | Path | str
+        The cassette, or the file it was saved to.
+
+    Raises
+    ------
+    requests.ConnectionError
+        When sending a request that was not recorded.
+    """
+
+    def __init__(self, cassette: Cassette | Path | str) -> None:
+        super().__init__()
+        self.cassette = (
+            cassette if isinstance(cassette, Cassette) else Cassette.load(cassette)
+        )
+
+    def send(  # noqa: PLR0917 -- signature of requests.adapters.BaseAdapter
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Any = None,
+        verify: Any = True,
+        cert: Any = None,
+        proxies: Mapping[str, str] | None = None,
+    ) -> requests.Response:
+        interaction = self.cassette.play(request)
+        if interaction is None:
+            error_msg = f"No recorded response for [{request.method}] {request.url}"
+            raise requests.ConnectionError(error_msg, request=request)
+
+        recorded = interaction["response"]
+        response = requests.Response()
+        response.status_code = recorded["status"]
+        response.reason = recorded["reason"]
+        response.headers = CaseInsensitiveDict(recorded["headers"])
+        # The recorded content is already decoded
+        response.headers.pop("Content-Encoding", None)
+        response._content = _decode_body(recorded["body"])
+        response._content_consumed = True
+        response.raw = io.BytesIO(response._content)
+        response.url = request.url or ""
+        response.request = request
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
+    def close(self) -> None:
+        return None
@@ -2,40 +2,101 @@
 #
 # SPDX-License-Identifier: MIT
 
-from ikigai.components.app import (
-    App,
-    AppBrowser,
-    AppBuilder,
-    AppDirectory,
-    AppDirectoryBuilder,
-)
-from ikigai.components.custom_facet import (
-    CustomFacet,
-    CustomFacetBrowser,
-    CustomFacetBuilder,
-)
-from ikigai.components.dataset import (
-    Dataset,
-    DatasetBrowser,
-    DatasetBuilder,
-    DatasetDirectory,
-    DatasetDirectoryBuilder,
-)
-from ikigai.components.flow import (
-    Flow,
-    FlowBrowser,
-    FlowBuilder,
-    FlowDirectory,
-    FlowDirectoryBuilder,
-    Schedule,
-)
-from ikigai.components.flow_definition import FlowDefinitionBuilder
-from ikigai.components.model import (
-    Model,
-    ModelBrowser,
-    ModelBuilder,
-    ModelDirectory,
-    ModelDirectoryBuilder,
+"""
+Components are imported on first access, so that `import ikigai` does not
+load pandas and every component model up front.
+"""
+
+from typing import TYPE_CHECKING
+
+from ikigai.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ikigai.components.app import (
+        App,
+        AppBrowser,
+        AppBuilder,
+        AppDirectory,
+        AppDirectoryBuilder,
+        AppEditor,
+    )
+    from ikigai.components.custom_facet import (
+        CustomFacet,
+        CustomFacetBrowser,
+        CustomFacetBuilder,
+    )
+    from ikigai.components.dataset import (
+        Dataset,
+        DatasetBrowser,
+        DatasetBuilder,
+        DatasetDirectory,
+        DatasetDirectoryBuilder,
+        DatasetEditor,
+    )
+    from ikigai.components.flow import (
+        Flow,
+        FlowBrowser,
+        FlowBuilder,
+        FlowDirectory,
+        FlowDirectoryBuilder,
+        FlowEditor,
+        RunLogCursor,
+        Schedule,
+    )
+    from ikigai.components.flow_definition import FlowDefinitionBuilder
+    from ikigai.components.model import (
+        Model,
+        ModelBrowser,
+        ModelBuilder,
+        ModelDirectory,
+        ModelDirectoryBuilder,
+        ModelEditor,
+    )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ikigai.components.app": (
+            "App",
+            "AppBrowser",
+            "AppBuilder",
+            "AppDirectory",
+            "AppDirectoryBuilder",
+            "AppEditor",
+        ),
+        "ikigai.components.custom_facet": (
+            "CustomFacet",
+            "CustomFacetBrowser",
+            "CustomFacetBuilder",
+        ),
+        "ikigai.components.dataset": (
+            "Dataset",
+            "DatasetBrowser",
+            "DatasetBuilder",
+            "DatasetDirectory",
+            "DatasetDirectoryBuilder",
+            "DatasetEditor",
+        ),
+        "ikigai.components.flow": (
+            "Flow",
+            "FlowBrowser",
+            "FlowBuilder",
+            "FlowDirectory",
+            "FlowDirectoryBuilder",
+            "FlowEditor",
+            "RunLogCursor",
+            "Schedule",
+        ),
+        "ikigai.components.flow_definition": ("FlowDefinitionBuilder",),
+        "ikigai.components.model": (
+            "Model",
+            "ModelBrowser",
+            "ModelBuilder",
+            "ModelDirectory",
+            "ModelDirectoryBuilder",
+            "ModelEditor",
+        ),
+    },
 )
 
 __all__ = [
@@ -44,6 +105,7 @@ __all__ = [
     "AppBuilder",
     "AppDirectory",
     "AppDirectoryBuilder",
+    "AppEditor",
     "CustomFacet",
     "CustomFacetBrowser",
     "CustomFacetBuilder",
@@ -52,16 +114,20 @@ __all__ = [
     "DatasetBuilder",
     "DatasetDirectory",
     "DatasetDirectoryBuilder",
+    "DatasetEditor",
     "Flow",
     "FlowBrowser",
     "FlowBuilder",
     "FlowDefinitionBuilder",
     "FlowDirectory",
     "FlowDirectoryBuilder",
+    "FlowEditor",
     "Model",
     "ModelBrowser",
     "ModelBuilder",
     "ModelDirectory",
     "ModelDirectoryBuilder",
+    "ModelEditor",
+    "RunLogCursor",
     "Schedule",
 ]
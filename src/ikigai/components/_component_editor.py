@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import abc
+from typing import Any, Generic, TypeVar
+
+from ikigai.client import Client
+from ikigai.typing import Directory, Named
+from ikigai.utils.compatibility import Self
+
+T = TypeVar("T", bound=Named)
+
+
+class _ComponentEditor(Generic[T], abc.ABC):
+    """
+    Changes to a component, sent to the platform in a single edit request.
+
+    Subclasses add the setters of their component's editable fields and send
+    the changes with the component's edit endpoint.
+    """
+
+    _component: T
+    _changes: dict[str, Any]
+    _client: Client
+
+    def __init__(self, client: Client, component: T) -> None:
+        self._client = client
+        self._component = component
+        self._changes = {}
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *_: object) -> None:
+        # Discard the pending changes if the block raised
+        if exc_type is None:
+            self.commit()
+        return None
+
+    def rename(self, name: str) -> Self:
+        self._changes["name"] = name
+        return self
+
+    def move(self, directory: Directory) -> Self:
+        self._changes["directory"] = directory
+        return self
+
+    def commit(self) -> T:
+        """
+        Send the pending changes to the platform in a single edit request.
+
+        Returns
+        -------
+        T
+            The updated component.
+        """
+        if not self._changes:
+            return self._component
+        changes, self._changes = self._changes, {}
+        self._commit(changes)
+        return self._component
+
+    @abc.abstractmethod
+    def _commit(self, changes: dict[str, Any]) -> None:
+        """
+        Send the changes with the component's edit request and apply them to
+        the component.
+
+        Parameters
+        ----------
+        changes: dict[str, Any]
+            Arguments of the edit request, keyed by argument name.
+        """
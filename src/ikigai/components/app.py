@@ -4,14 +4,15 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from datetime import datetime
-from functools import cached_property
+from functools import cached_property, partial
 from typing import Any
 
 from pydantic import BaseModel, EmailStr, Field, PrivateAttr
 
 from ikigai.client import Client
+from ikigai.components._component_editor import _ComponentEditor
 from ikigai.components.dataset import (
     Dataset,
     DatasetBrowser,
@@ -39,7 +40,9 @@ from ikigai.typing import (
     NamedDirectoryDict,
     NamedMapping,
 )
+from ikigai.typing.pydantic_extensions import LazyModel
 from ikigai.utils import AppAccessLevel, DirectoryType
+from ikigai.utils.bulk import BulkExecutor
 from ikigai.utils.compatibility import Self, deprecated, override
 
 
@@ -71,12 +74,36 @@ class AppBuilder:
         self._directory = directory
         return self
 
-    def build(self) -> App:
+    def build(self, *, lazy: bool = False) -> App:
+        """
+        Build the App
+
+        Parameters
+        ----------
+        lazy : bool
+            If True, the App is populated from the builder instead of being
+            fetched after creation, remaining fields are fetched on first access.
+
+        Returns
+        -------
+        App
+            The created App
+        """
         app_id = self.__client.component.create_app(
             name=self._name,
             description=self._description,
             directory=self._directory,
         )
+        if lazy:
+            return App._from_partial(
+                data={
+                    "app_id": app_id,
+                    "name": self._name,
+                    "description": self._description,
+                },
+                client=self.__client,
+            )
+
         app_dict = self.__client.component.get_app(app_id=app_id)
         return App.from_dict(data=app_dict, client=self.__client)
 
@@ -171,7 +198,7 @@ class AppAccess(BaseModel):
         return self
 
 
-class App(BaseModel):
+class App(LazyModel):
     """
     Represents an App in the Ikigai platform.
 
@@ -217,6 +244,15 @@ class App(BaseModel):
         self.__client = client
         return self
 
+    @classmethod
+    def _from_partial(cls, data: Mapping[str, Any], client: Client) -> Self:
+        app_id = data["app_id"]
+        self = cls._construct_partial(
+            data=data, loader=partial(_load_app, client, app_id)
+        )
+        self.__client = client
+        return self
+
     """
     Operations on App
     """
@@ -316,6 +352,28 @@ class App(BaseModel):
         self.description = description
         return self
 
+    def edit(self) -> AppEditor:
+        """
+        Batch several edits to the App into a single request.
+
+        Changes recorded on the editor are sent together when the `with` block
+        exits without an exception, or when `commit` is called.
+
+        Returns
+        -------
+
+        AppEditor
+            Editor accumulating changes to the App.
+
+        Examples
+        --------
+
+        >>> with app.edit() as edit:
+        ...     edit.rename("Sales Forecasting")
+        ...     edit.update_description("Weekly sales forecasts")
+        """
+        return AppEditor(client=self.__client, component=self)
+
     @cached_property
     def access(self) -> AppAccess:
         """
@@ -348,6 +406,42 @@ class App(BaseModel):
             "components": components,
         }
 
+    def bulk(
+        self, max_workers: int = 8, rate_limit: float | None = None
+    ) -> BulkExecutor:
+        """
+        Get an executor to run many operations on the App's components concurrently.
+
+        Operations run on a bounded thread pool, a failing operation does not
+        stop the remaining ones.
+
+        Parameters
+        ----------
+
+        max_workers: int
+            Maximum number of operations running at the same time.
+
+        rate_limit: float | None
+            Maximum number of operations started per second, None for no limit.
+
+        Returns
+        -------
+
+        BulkExecutor
+            A new bulk executor.
+
+        Examples
+        --------
+
+        Delete all datasets in a directory
+
+        >>> bulk = app.bulk(max_workers=16)
+        >>> bulk.map(lambda dataset: dataset.delete(), directory.datasets().values())
+        >>> results = bulk.run()
+        >>> results.raise_on_error()
+        """
+        return BulkExecutor(max_workers=max_workers, rate_limit=rate_limit)
+
     """
     Access Components in the App
     """
@@ -504,6 +598,20 @@ class App(BaseModel):
         return ModelDirectoryBuilder(client=self.__client, app_id=self.app_id)
 
 
+class AppEditor(_ComponentEditor[App]):
+    def update_description(self, description: str) -> Self:
+        self._changes["description"] = description
+        return self
+
+    @override
+    def _commit(self, changes: dict[str, Any]) -> None:
+        _ = self._client.component.edit_app(app_id=self._component.app_id, **changes)
+        if "name" in changes:
+            self._component.name = changes["name"]
+        if "description" in changes:
+            self._component.description = changes["description"]
+
+
 class AppBrowser(ComponentBrowser[App]):
     __client: Client
 
@@ -520,6 +628,11 @@ class AppBrowser(ComponentBrowser[App]):
 
         return NamedMapping(apps)
 
+    @override
+    def iter(self) -> Iterator[App]:
+        for app in self.__client.component.iter_apps_for_user():
+            yield App.from_dict(data=app, client=self.__client)
+
     @override
     def __getitem__(self, name: str) -> App:
         app_dict = self.__client.component.get_app_by_name(name)
@@ -553,17 +666,23 @@ class AppDirectoryBuilder:
         self._parent = parent
         return self
 
-    def build(self) -> AppDirectory:
+    def build(self, *, lazy: bool = False) -> AppDirectory:
         directory_id = self.__client.component.create_app_directory(
             name=self._name, parent=self._parent
         )
+        if lazy:
+            return AppDirectory._from_partial(
+                data={"directory_id": directory_id, "name": self._name},
+                client=self.__client,
+            )
+
         directory_dict = self.__client.component.get_app_directory(
             directory_id=directory_id
         )
         return AppDirectory.from_dict(data=directory_dict, client=self.__client)
 
 
-class AppDirectory(BaseModel):
+class AppDirectory(LazyModel):
     directory_id: str
     name: str
     __client: Client = PrivateAttr()
@@ -578,6 +697,16 @@ class AppDirectory(BaseModel):
         self.__client = client
         return self
 
+    @classmethod
+    def _from_partial(cls, data: Mapping[str, Any], client: Client) -> Self:
+        directory_id = data["directory_id"]
+        self = cls._construct_partial(
+            data=data,
+            loader=partial(_load_app_directory, client, directory_id),
+        )
+        self.__client = client
+        return self
+
     def to_dict(self) -> NamedDirectoryDict:
         return {"directory_id": self.directory_id, "type": self.type, "name": self.name}
 
@@ -613,3 +742,14 @@ class AppDirectory(BaseModel):
         }
 
         return NamedMapping(apps)
+
+
+# Loaders of lazily created components, module level functions to be picklable
+
+
+def _load_app(client: Client, app_id: str) -> Mapping[str, Any]:
+    return client.component.get_app(app_id=app_id)
+
+
+def _load_app_directory(client: Client, directory_id: str) -> Mapping[str, Any]:
+    return client.component.get_app_directory(directory_id=directory_id)
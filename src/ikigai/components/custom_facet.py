@@ -6,9 +6,9 @@ from __future__ import annotations
 
 import ast
 import textwrap
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from datetime import datetime
-from functools import cached_property
+from functools import cached_property, partial
 from logging import getLogger
 from pathlib import Path
 from typing import Any
@@ -30,8 +30,9 @@ from ikigai.specs import (
     FacetTypes,
 )
 from ikigai.typing import ComponentBrowser, NamedMapping
+from ikigai.typing.pydantic_extensions import LazyModel
 from ikigai.utils import CustomFacetAccessLevel, CustomFacetArgumentType
-from ikigai.utils.compatibility import Self, deprecated
+from ikigai.utils.compatibility import Self, deprecated, override
 
 logger = getLogger("ikigai.components")
 
@@ -191,13 +192,20 @@ class CustomFacetBuilder:
         self._system_access = system_access
         return self
 
-    def build(self) -> CustomFacet:
+    def build(self, *, lazy: bool = False) -> CustomFacet:
         """
         Build the custom facet object.
 
         Creates the custom facet in the Ikigai platform using the provided
         parameters and returns the corresponding CustomFacet object.
 
+        Parameters
+        ----------
+        lazy : bool
+            If True, the custom facet is populated from the builder instead of
+            being fetched after creation, remaining fields are fetched on
+            first access.
+
         Returns
         -------
         CustomFacet
@@ -228,6 +236,20 @@ class CustomFacetBuilder:
             rootkit_token=rootkit_token,
             arguments=arguments,
         )
+        if lazy:
+            return CustomFacet._from_partial(
+                data={
+                    "custom_facet_id": custom_facet_id,
+                    "name": self._name,
+                    "facet_type": self._facet_type,
+                    "description": self._description,
+                    "script": self._script,
+                    "requirements": self._requirements,
+                    "rootkit_token": rootkit_token,
+                    "arguments": dict(self._arguments),
+                },
+                client=self.__client,
+            )
 
         custom_facet_dict = self.__client.component.get_custom_facet(
             custom_facet_id=custom_facet_id,
@@ -322,7 +344,7 @@ class CustomFacetAccess(BaseModel):
         return self
 
 
-class CustomFacet(BaseModel):
+class CustomFacet(LazyModel):
     custom_facet_id: str
     name: str
     facet_type: FacetType
@@ -354,6 +376,16 @@ class CustomFacet(BaseModel):
         self.__client = client
         return self
 
+    @classmethod
+    def _from_partial(cls, data: Mapping[str, Any], client: Client) -> Self:
+        custom_facet_id, facet_type = data["custom_facet_id"], data["facet_type"]
+        self = cls._construct_partial(
+            data=data,
+            loader=partial(_load_custom_facet, client, custom_facet_id, facet_type),
+        )
+        self.__client = client
+        return self
+
     """
     Operations on Custom Facet
     """
@@ -622,6 +654,11 @@ class CustomFacetBrowser(ComponentBrowser[CustomFacet]):
 
         return NamedMapping(custom_facets)
 
+    @override
+    def iter(self) -> Iterator[CustomFacet]:
+        for custom_facet in self.__client.component.get_custom_facets_for_user():
+            yield CustomFacet.from_dict(data=custom_facet, client=self.__client)
+
     def __getitem__(self, name: str) -> CustomFacet:
         custom_facet_dict = self.__client.component.get_custom_facet_by_name(name=name)
 
@@ -680,3 +717,15 @@ class CustomFacetVersion(BaseModel):
     @property
     def facet_type(self) -> CustomFacetType:
         return self.__facet_type
+
+
+# Loader of lazily created custom facets, a module level function to be picklable
+
+
+def _load_custom_facet(
+    client: Client, custom_facet_id: str, facet_type: FacetType
+) -> Mapping[str, Any]:
+    return {
+        **client.component.get_custom_facet(custom_facet_id=custom_facet_id),
+        "facet_type": facet_type,
+    }
@@ -8,21 +8,26 @@ import io
 import logging
 import math
 import time
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from datetime import datetime
+from functools import partial
 from http import HTTPStatus
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import pandas as pd
-import requests
 from pydantic import BaseModel, Field, PrivateAttr
 
 from ikigai.client import Client, datax
+from ikigai.components._component_editor import _ComponentEditor
 from ikigai.typing import ComponentBrowser, Directory, NamedDirectoryDict, NamedMapping
+from ikigai.typing.pydantic_extensions import LazyModel
 from ikigai.utils import DatasetDataType, DatasetDownloadStatus, DirectoryType
 from ikigai.utils.compatibility import Self, deprecated, override
 
+if TYPE_CHECKING:
+    # pandas is slow to import, it is imported when data is first read
+    import pandas as pd
+
 logger = logging.getLogger("ikigai.components")
 
 
@@ -50,24 +55,23 @@ def __upload_data(
 
     etags: dict[int, str] = {}
     try:
-        with requests.session() as request:
-            request.headers.update(
-                {"Content-Type": content_type, "Cache-Control": "no-cache"}
-            )
-            for idx, (chunk_idx, upload_url) in enumerate(sorted(upload_urls.items())):
-                chunk_start, chunk_end = (idx * chunk_size, (idx + 1) * chunk_size)
-                chunk = data[chunk_start : min(chunk_end, file_size)]
-                resp = request.put(url=upload_url, data=chunk)
-                if resp.status_code != HTTPStatus.OK:
-                    error_msg = (
-                        f"Failed to upload chunk {chunk_idx:02d} of {num_chunks:02d} "
-                        "received response:\n"
-                        f"[{resp.status_code}] {resp.text}"
-                    )
-                    raise RuntimeError(error_msg)
-
-                # Get etags from response header
-                etags[chunk_idx] = resp.headers["ETag"]
+        request = client.transfer_session()
+        headers = {"Content-Type": content_type, "Cache-Control": "no-cache"}
+        for idx, (chunk_idx, upload_url) in enumerate(sorted(upload_urls.items())):
+            chunk_start, chunk_end = (idx * chunk_size, (idx + 1) * chunk_size)
+            chunk = data[chunk_start : min(chunk_end, file_size)]
+            with client.span("dataset.upload.chunk", chunk=chunk_idx, size=len(chunk)):
+                resp = request.put(url=upload_url, data=chunk, headers=headers)
+            if resp.status_code != HTTPStatus.OK:
+                error_msg = (
+                    f"Failed to upload chunk {chunk_idx:02d} of {num_chunks:02d} "
+                    "received response:\n"
+                    f"[{resp.status_code}] {resp.text}"
+                )
+                raise RuntimeError(error_msg)
+
+            # Get etags from response header
+            etags[chunk_idx] = resp.headers["ETag"]
     except Exception:
         client.component.abort_datset_multipart_upload(
             app_id=app_id,
@@ -96,14 +100,26 @@ def _upload_data(
 
     filename = f"{name}.csv"
 
-    __upload_data(
-        client=client,
-        app_id=app_id,
-        dataset_id=dataset_id,
-        data=data,
-        filename=filename,
-    )
+    with client.span(
+        "dataset.upload", app_id=app_id, dataset_id=dataset_id, size=len(data)
+    ):
+        __upload_data(
+            client=client,
+            app_id=app_id,
+            dataset_id=dataset_id,
+            data=data,
+            filename=filename,
+        )
+
+        with client.span("dataset.upload.confirm", dataset_id=dataset_id):
+            _confirm_upload(
+                client=client, app_id=app_id, dataset_id=dataset_id, filename=filename
+            )
 
+
+def _confirm_upload(
+    client: Client, app_id: str, dataset_id: str, filename: str
+) -> None:
     upload_completion_time = time.time()
     client.component.verify_dataset_upload(
         app_id=app_id, dataset_id=dataset_id, filename=filename
@@ -198,11 +214,31 @@ class DatasetBuilder:
         self._directory = directory
         return self
 
-    def build(self) -> Dataset:
+    def build(self, *, lazy: bool = False) -> Dataset:
+        """
+        Build the Dataset
+
+        Creates the dataset and uploads its data.
+
+        Parameters
+        ----------
+        lazy : bool
+            If True, the Dataset is populated from the builder instead of being
+            fetched after the upload, remaining fields are fetched on first access.
+
+        Returns
+        -------
+        Dataset
+            The created Dataset
+        """
         if self._data is None:
             error_msg = "Dataset is empty"
             raise ValueError(error_msg)
 
+        with self.__client.span("dataset.build", app_id=self._app_id, name=self._name):
+            return self.__build(data=self._data, lazy=lazy)
+
+    def __build(self, data: bytes, *, lazy: bool) -> Dataset:
         dataset_id = self.__client.component.create_dataset(
             app_id=self._app_id, name=self._name, directory=self._directory
         )
@@ -213,7 +249,7 @@ class DatasetBuilder:
                 app_id=self._app_id,
                 dataset_id=dataset_id,
                 name=self._name,
-                data=self._data,
+                data=data,
             )
         except Exception:
             # Delete created record and re-raise
@@ -222,6 +258,16 @@ class DatasetBuilder:
             )
             raise
 
+        if lazy:
+            return Dataset._from_partial(
+                data={
+                    "app_id": self._app_id,
+                    "dataset_id": dataset_id,
+                    "name": self._name,
+                },
+                client=self.__client,
+            )
+
         # Populate Dataset object
         dataset_dict = self.__client.component.get_dataset(
             app_id=self._app_id, dataset_id=dataset_id
@@ -235,7 +281,7 @@ class ColumnDataType(BaseModel):
     data_formats: dict[str, str]
 
 
-class Dataset(BaseModel):
+class Dataset(LazyModel):
     app_id: str = Field(validation_alias="project_id")
     dataset_id: str
     name: str
@@ -254,6 +300,16 @@ class Dataset(BaseModel):
         self.__client = client
         return self
 
+    @classmethod
+    def _from_partial(cls, data: Mapping[str, Any], client: Client) -> Self:
+        app_id, dataset_id = data["app_id"], data["dataset_id"]
+        self = cls._construct_partial(
+            data=data,
+            loader=partial(_load_dataset, client, app_id, dataset_id),
+        )
+        self.__client = client
+        return self
+
     def to_dict(self) -> dict:
         return {
             "dataset_id": self.dataset_id,
@@ -288,13 +344,51 @@ class Dataset(BaseModel):
         )
         return self
 
+    def edit(self) -> DatasetEditor:
+        """
+        Batch several edits to the dataset into a single request.
+
+        Changes recorded on the editor are sent together when the `with` block
+        exits without an exception, or when `commit` is called.
+
+        Returns
+        -------
+        DatasetEditor
+            Editor accumulating changes to the dataset.
+
+        Examples
+        --------
+        >>> with dataset.edit() as edit:
+        ...     edit.rename("Sales 2024")
+        ...     edit.move(directory)
+        """
+        return DatasetEditor(client=self.__client, component=self)
+
     def df(self, **parser_options) -> pd.DataFrame:
-        download_url = _get_dataset_download_url(
-            client=self.__client,
-            app_id=self.app_id,
-            dataset_id=self.dataset_id,
-        )
-        return pd.read_csv(download_url, **parser_options)
+        with self.__client.span(
+            "dataset.download", app_id=self.app_id, dataset_id=self.dataset_id
+        ):
+            download_url = _get_dataset_download_url(
+                client=self.__client,
+                app_id=self.app_id,
+                dataset_id=self.dataset_id,
+            )
+            with (
+                self.__client.span("dataset.download.read"),
+                self.__client.transfer_session().get(download_url, stream=True) as resp,
+            ):
+                if resp.status_code != HTTPStatus.OK:
+                    error_msg = (
+                        "Failed to download dataset, received response:\n"
+                        f"[{resp.status_code}] {resp.text}"
+                    )
+                    raise RuntimeError(error_msg)
+
+                import pandas as pd  # noqa: PLC0415 -- deferred, slow to import
+
+                # Parse the data as it is downloaded instead of holding all of it
+                resp.raw.decode_content = True
+                return pd.read_csv(resp.raw, **parser_options)
 
     def edit_data(self, data: pd.DataFrame) -> None:
         buffer = io.BytesIO()
@@ -314,6 +408,18 @@ class Dataset(BaseModel):
         )
 
 
+class DatasetEditor(_ComponentEditor[Dataset]):
+    @override
+    def _commit(self, changes: dict[str, Any]) -> None:
+        self._client.component.edit_dataset(
+            app_id=self._component.app_id,
+            dataset_id=self._component.dataset_id,
+            **changes,
+        )
+        if "name" in changes:
+            self._component.name = changes["name"]
+
+
 class DatasetBrowser(ComponentBrowser[Dataset]):
     __app_id: str
     __client: Client
@@ -334,6 +440,13 @@ class DatasetBrowser(ComponentBrowser[Dataset]):
 
         return NamedMapping(datasets)
 
+    @override
+    def iter(self) -> Iterator[Dataset]:
+        for dataset in self.__client.component.iter_datasets_for_app(
+            app_id=self.__app_id
+        ):
+            yield Dataset.from_dict(data=dataset, client=self.__client)
+
     @override
     def __getitem__(self, name: str) -> Dataset:
         dataset_dict = self.__client.component.get_dataset_by_name(
@@ -374,10 +487,20 @@ class DatasetDirectoryBuilder:
         self._parent = parent
         return self
 
-    def build(self) -> DatasetDirectory:
+    def build(self, *, lazy: bool = False) -> DatasetDirectory:
         directory_id = self.__client.component.create_dataset_directory(
             app_id=self._app_id, name=self._name, parent=self._parent
         )
+        if lazy:
+            return DatasetDirectory._from_partial(
+                data={
+                    "app_id": self._app_id,
+                    "directory_id": directory_id,
+                    "name": self._name,
+                },
+                client=self.__client,
+            )
+
         directory_dict = self.__client.component.get_dataset_directory(
             app_id=self._app_id, directory_id=directory_id
         )
@@ -385,7 +508,7 @@ class DatasetDirectoryBuilder:
         return DatasetDirectory.from_dict(data=directory_dict, client=self.__client)
 
 
-class DatasetDirectory(BaseModel):
+class DatasetDirectory(LazyModel):
     app_id: str = Field(validation_alias="project_id")
     directory_id: str
     name: str
@@ -402,6 +525,16 @@ class DatasetDirectory(BaseModel):
         self.__client = client
         return self
 
+    @classmethod
+    def _from_partial(cls, data: Mapping[str, Any], client: Client) -> Self:
+        app_id, directory_id = data["app_id"], data["directory_id"]
+        self = cls._construct_partial(
+            data=data,
+            loader=partial(_load_dataset_directory, client, app_id, directory_id),
+        )
+        self.__client = client
+        return self
+
     def to_dict(self) -> NamedDirectoryDict:
         return {"directory_id": self.directory_id, "type": self.type, "name": self.name}
 
@@ -433,3 +566,18 @@ class DatasetDirectory(BaseModel):
         }
 
         return NamedMapping(datasets)
+
+
+# Loaders of lazily created components, module level functions to be picklable
+
+
+def _load_dataset(client: Client, app_id: str, dataset_id: str) -> Mapping[str, Any]:
+    return client.component.get_dataset(app_id=app_id, dataset_id=dataset_id)
+
+
+def _load_dataset_directory(
+    client: Client, app_id: str, directory_id: str
+) -> Mapping[str, Any]:
+    return client.component.get_dataset_directory(
+        app_id=app_id, directory_id=directory_id
+    )
@@ -5,11 +5,16 @@
 from __future__ import annotations
 
 import logging
+import math
 import time
-from collections.abc import Mapping
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, TypeVar, cast
+from functools import partial
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, cast
 
+import requests
 from pydantic import (
     AliasChoices,
     BaseModel,
@@ -18,25 +23,37 @@ from pydantic import (
     PrivateAttr,
     field_validator,
 )
-from tqdm.auto import tqdm
 
 from ikigai.client import Client, datax
+from ikigai.components._component_editor import _ComponentEditor
 from ikigai.components._flow_definition_shim import flow_versioning_shim
-from ikigai.components.flow_definition import FlowDefinition
+from ikigai.components.flow_definition import (
+    FlowDefinition,
+    FlowDefinitionDiff,
+    diff_flow_definitions,
+)
 from ikigai.typing import ComponentBrowser, Directory, NamedDirectoryDict, NamedMapping
 from ikigai.typing.pydantic_extensions import (
     CronStr,
+    LazyModel,
     OptionalStr,
     TimestampSerializableDatetime,
     TimestampSerializableOptionalDatetime,
 )
 from ikigai.utils import DirectoryType, FlowStatus
 from ikigai.utils.compatibility import Self, deprecated, override
+from ikigai.utils.missing import MISSING, MissingType
+
+if TYPE_CHECKING:
+    # pandas and tqdm are slow to import, they are imported when runs are awaited
+    import pandas as pd
 
 logger = logging.getLogger("ikigai.components")
 
 T = TypeVar("T")
 
+_RUN_LOG_TIMEOUT = 24 * 60 * 60.0
+
 
 class Schedule(BaseModel):
     """
@@ -215,13 +232,19 @@ class FlowBuilder:
         )
         raise TypeError(error_msg)
 
-    def build(self) -> Flow:
+    def build(self, *, lazy: bool = False) -> Flow:
         """
         Build the Flow object
 
         Creates the flow in the Ikigai platform using the provided
         parameters and returns the corresponding Flow object.
 
+        Parameters
+        ----------
+        lazy : bool
+            If True, the Flow is populated from the builder instead of being
+            fetched after creation, remaining fields are fetched on first access.
+
         Returns
         -------
         Flow
@@ -235,6 +258,16 @@ class FlowBuilder:
             flow_definition=self._flow_definition,
             schedule=self._schedule.to_dict() if self._schedule else None,
         )
+        if lazy:
+            return Flow._from_partial(
+                data={
+                    "app_id": self._app_id,
+                    "flow_id": flow_id,
+                    "name": self._name,
+                    "schedule": self._schedule,
+                },
+                client=self.__client,
+            )
 
         # Populate Flow object
         flow_dict = self.__client.component.get_flow(flow_id=flow_id)
@@ -265,7 +298,7 @@ class RunLog(BaseModel):
         return cls.model_validate(data)
 
 
-class Flow(BaseModel):
+class Flow(LazyModel):
     app_id: str = Field(validation_alias=AliasChoices("app_id", "project_id"))
     flow_id: str = Field(validation_alias=AliasChoices("flow_id", "pipeline_id"))
     name: str
@@ -291,6 +324,15 @@ class Flow(BaseModel):
         self.__client = client
         return self
 
+    @classmethod
+    def _from_partial(cls, data: Mapping[str, Any], client: Client) -> Self:
+        flow_id = data["flow_id"]
+        self = cls._construct_partial(
+            data=data, loader=partial(_load_flow, client, flow_id)
+        )
+        self.__client = client
+        return self
+
     def to_dict(self) -> dict:
         return {
             "flow_id": self.flow_id,
@@ -323,33 +365,30 @@ class Flow(BaseModel):
         schedule : Schedule | ScheduleDict | str | None
             The schedule to set for the flow.
             Can be provided as a Schedule object, a Schedule dictionary, or a
-            cron string. Pass None to remove existing schedule.
+            cron string. Pass None to remove existing schedule, this waits until
+            the platform reports the schedule as removed.
 
         Returns
         -------
         Self
             The updated Flow object.
-        """
-        if isinstance(schedule, str):
-            schedule = Schedule(
-                name=self.name, cron=schedule, start_time=datetime.now(), end_time=None
-            )
-        if isinstance(schedule, Mapping):
-            schedule = Schedule.from_dict(schedule)
 
-        self.__client.component.edit_flow(
-            app_id=self.app_id,
-            flow_id=self.flow_id,
-            schedule=schedule.to_dict() if schedule else None,
-        )
+        Raises
+        ------
+        TimeoutError
+            If the platform still reports the removed schedule after waiting,
+            the flow keeps its schedule.
 
-        if schedule is None:
-            # HACK: BE has no way to remove schedule via API,
-            #   so we wait for 90 seconds to ensure the schedule is removed
-            time.sleep(90)
+        Examples
+        --------
+        Remove the schedules of many flows concurrently
 
-        # Update the schedule attribute
-        self.schedule = schedule
+        >>> bulk = app.bulk(max_workers=16)
+        >>> bulk.map(lambda flow: flow.update_schedule(None), app.flows().values())
+        >>> bulk.run().raise_on_error()
+        """
+        with self.edit() as edit:
+            edit.update_schedule(schedule=schedule)
         return self
 
     def move(self, directory: Directory) -> Self:
@@ -382,12 +421,17 @@ class Flow(BaseModel):
         return self
 
     def update_definition(
-        self, definition: FlowDefinition | datax.FlowDefinitionDict
+        self,
+        definition: FlowDefinition | datax.FlowDefinitionDict,
+        *,
+        force: bool = False,
     ) -> Self:
         """
         Update the flow definition.
 
         Replaces the existing flow definition with the provided one.
+        The update is skipped if the provided definition does not differ from
+        the flow's current definition.
 
         Parameters
         ----------
@@ -395,6 +439,9 @@ class Flow(BaseModel):
             The new flow definition to set. Can be provided as a FlowDefinition
             object or as a dictionary.
 
+        force : bool
+            If True, send the definition even if it matches the current one.
+
         Returns
         -------
         Self
@@ -404,11 +451,62 @@ class Flow(BaseModel):
         if isinstance(definition, FlowDefinition):
             definition = definition.to_dict()
 
+        if not force:
+            diff = self.diff_definition(definition)
+            if not diff:
+                logger.debug("Definition of %s unchanged, skipping update", self)
+                return self
+            logger.debug("Updating definition of %s: %s", self, diff.summary())
+
         self.__client.component.edit_flow(
             app_id=self.app_id, flow_id=self.flow_id, flow_definition=definition
         )
         return self
 
+    def diff_definition(
+        self, definition: FlowDefinition | datax.FlowDefinitionDict
+    ) -> FlowDefinitionDiff:
+        """
+        Compare a flow definition with the flow's current definition.
+
+        Parameters
+        ----------
+        definition : FlowDefinition | FlowDefinitionDict
+            The flow definition to compare with the current one.
+
+        Returns
+        -------
+        FlowDefinitionDiff
+            Facet and arrow level differences from the current definition,
+            falsy if there are none.
+        """
+        if isinstance(definition, FlowDefinition):
+            definition = definition.to_dict()
+
+        flow = self.__client.component.get_flow(flow_id=self.flow_id)
+        return diff_flow_definitions(old=flow["definition"], new=definition)
+
+    def edit(self) -> FlowEditor:
+        """
+        Batch several edits to the flow into a single request.
+
+        Changes recorded on the editor are sent together when the `with` block
+        exits without an exception, or when `commit` is called.
+
+        Returns
+        -------
+        FlowEditor
+            Editor accumulating changes to the flow.
+
+        Examples
+        --------
+        >>> with flow.edit() as edit:
+        ...     edit.rename("Daily Sales")
+        ...     edit.update_high_volume_preference(optimize=True)
+        ...     edit.update_definition(definition)
+        """
+        return FlowEditor(client=self.__client, component=self)
+
     def status(self) -> FlowStatusReport:
         resp = self.__client.component.is_flow_runing(
             app_id=self.app_id, flow_id=self.flow_id
@@ -427,6 +525,46 @@ class Flow(BaseModel):
             run_logs = [log for log in run_logs if log.timestamp > since]
         return run_logs
 
+    def log_cursor(
+        self, since: datetime | None = None, page_size: int = 10
+    ) -> RunLogCursor:
+        """
+        Get a cursor to incrementally tail the flow's run logs
+
+        Parameters
+        ----------
+        since : datetime | None
+            Only logs after this time are returned by the cursor.
+            If None, only logs created after the cursor are returned.
+
+        page_size : int
+            Number of logs requested per poll, the page grows automatically
+            when more new logs are available.
+
+        Returns
+        -------
+        RunLogCursor
+            Cursor returning each new run log once.
+
+        Examples
+        --------
+        Print run logs as they are created
+
+        >>> for run_log in flow.log_cursor().follow(poll_interval=10):
+        ...     print(run_log.status, run_log.timestamp)
+        """
+        cursor = RunLogCursor(flow=self, client=self.__client, page_size=page_size)
+        if since is not None:
+            cursor._seek(timestamp=since)
+        else:
+            latest_logs = self.run_logs(max_count=1)
+            if latest_logs:
+                cursor._seek(
+                    timestamp=latest_logs[0].timestamp,
+                    log_ids={latest_logs[0].log_id},
+                )
+        return cursor
+
     def run(self, **variables) -> RunLog:
         """
         Run the flow
@@ -447,18 +585,134 @@ class Flow(BaseModel):
         RunLog
             The final run log of the flow after completion
         """
-        run_variables: datax.RunVariablesRequest = {
-            key: {"value": value}
-            for key, value in variables.items()
-            if not key.startswith("_")
-        }
+        run_variables = _run_variables_request(variables)
 
-        # Start running pipeline
-        self.__client.component.run_flow(
-            app_id=self.app_id, flow_id=self.flow_id, variables=run_variables
-        )
+        with self.__client.span("flow.run", app_id=self.app_id, flow_id=self.flow_id):
+            # Start running pipeline
+            self.__client.component.run_flow(
+                app_id=self.app_id, flow_id=self.flow_id, variables=run_variables
+            )
+
+            with self.__client.span("flow.run.wait"):
+                return self.__await_run()
+
+    def run_many(
+        self,
+        variable_sets: Iterable[Mapping[str, Any]],
+        max_concurrency: int = 1,
+        timeout: float | None = _RUN_LOG_TIMEOUT,
+    ) -> pd.DataFrame:
+        """
+        Run the flow once for each set of run variables
+
+        Runs are submitted as earlier runs finish, keeping at most
+        `max_concurrency` runs of the flow submitted but not finished. Finished
+        runs are matched to submitted runs in submission order through the
+        flow's run logs. A run that could not be submitted does not stop the
+        remaining runs, its error is reported in the results.
+
+        Run logs do not identify their run, a log is only matched to a run if
+        it was created after the run was submitted. Runs of the flow started
+        elsewhere that finish while `run_many` waits (e.g. by the flow's
+        schedule) or runs finishing out of submission order can not be told
+        apart and get the results of another run. Pause the flow's schedule
+        and do not run the flow otherwise while `run_many` runs it.
 
-        return self.__await_run()
+        Parameters
+        ----------
+        variable_sets : Iterable[Mapping[str, Any]]
+            Run variables for each run, see `run` for details.
+
+        max_concurrency : int
+            Maximum number of runs submitted at the same time. Only raise this
+            if the platform is configured to queue runs of the same flow and
+            runs them one at a time, in submission order.
+
+        timeout : float | None
+            Seconds to wait for the run log of a submitted run. A run without a
+            log by then is reported with a TimeoutError and the next logs are
+            matched to the following runs. Default is 24 hours, None waits
+            indefinitely.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per variable set in the given order, with the columns
+            variables, status, log_id, erroneous_facet_id, data, error,
+            submitted_at, finished_at, duration and run_log.
+
+        Examples
+        --------
+        >>> results = flow.run_many(
+        ...     [{"region": region} for region in ("north", "south", "east")]
+        ... )
+        >>> results[["variables", "status", "duration"]]
+        """
+        if max_concurrency < 1:
+            error_msg = f"max_concurrency must be at least 1, got {max_concurrency}"
+            raise ValueError(error_msg)
+
+        runs = [
+            _FlowRun(index=idx, variables=dict(variables))
+            for idx, variables in enumerate(variable_sets)
+        ]
+        pending = deque(runs)
+        in_flight: deque[_FlowRun] = deque()
+
+        # Logs that exist before the first run are not results of these runs
+        log_cursor = self.log_cursor(page_size=max_concurrency)
+
+        import pandas as pd  # noqa: PLC0415 -- deferred, slow to import
+        from tqdm.auto import tqdm  # noqa: PLC0415 -- deferred, slow to import
+
+        with tqdm(total=len(runs), dynamic_ncols=True) as progress_bar:
+            while pending or in_flight:
+                while pending and len(in_flight) < max_concurrency:
+                    run = pending.popleft()
+                    run.submitted_at = datetime.now().astimezone()
+                    if timeout is not None:
+                        run.deadline = time.monotonic() + timeout
+                    try:
+                        self.__client.component.run_flow(
+                            app_id=self.app_id,
+                            flow_id=self.flow_id,
+                            variables=_run_variables_request(run.variables),
+                        )
+                    except Exception as error:
+                        logger.warning("Failed to submit run %d: %s", run.index, error)
+                        run.error = error
+                        progress_bar.update(1)
+                        continue
+                    in_flight.append(run)
+
+                if not in_flight:
+                    continue
+                time.sleep(1)
+
+                for log in log_cursor.fetch():
+                    if not in_flight:
+                        break
+                    run = in_flight[0]
+                    if not run.is_log_after_submission(log):
+                        # Finished before any in flight run was submitted
+                        logger.debug("Skipping run log %s of another run", log.log_id)
+                        continue
+                    in_flight.popleft()
+                    run.run_log = log
+                    progress_bar.update(1)
+                    progress_bar.desc = f"{log.status}"
+
+                # Runs time out in submission order, as they are matched to logs
+                while in_flight and in_flight[0].deadline <= time.monotonic():
+                    run = in_flight.popleft()
+                    error_msg = f"No run log within {timeout} seconds of submitting"
+                    logger.warning("Run %d timed out: %s", run.index, error_msg)
+                    run.error = TimeoutError(error_msg)
+                    progress_bar.update(1)
+
+        return pd.DataFrame.from_records(
+            [run.to_dict() for run in runs], columns=_FlowRun.COLUMNS
+        )
 
     def describe(self) -> datax.FlowDict:
         flow = self.__client.component.get_flow(flow_id=self.flow_id)
@@ -471,35 +725,65 @@ class Flow(BaseModel):
         shimed_flow = flow_versioning_shim(flow=flow, facet_specs=facet_specs)
         return shimed_flow  # noqa: RET504
 
+    def watch_status(self, timeout: float = 60.0) -> Iterator[FlowStatusReport]:
+        """
+        Watch the flow's status transitions until it stops running
+
+        Status updates are pushed by the platform when it supports status
+        streaming, otherwise the status is polled.
+
+        Parameters
+        ----------
+        timeout : float
+            Seconds to wait for a pushed update before falling back to polling.
+
+        Yields
+        ------
+        FlowStatusReport
+            The current status, then each status change until the flow is no
+            longer running.
+        """
+        last_status_report: FlowStatusReport | None = None
+        try:
+            status_dicts = self.__client.component.stream_flow_status(
+                app_id=self.app_id, flow_id=self.flow_id, timeout=timeout
+            )
+            for status_dict in status_dicts:
+                status_report = FlowStatusReport.from_dict(status_dict)
+                if status_report != last_status_report:
+                    yield status_report
+                last_status_report = status_report
+                if status_report.status not in _RUNNING_STATES:
+                    return None
+        except (RuntimeError, requests.RequestException) as error:
+            logger.debug("Flow status stream unavailable, polling instead: %s", error)
+
+        # Stream is unavailable or ended while the flow was running, poll instead
+        status_report = self.status()
+        if status_report != last_status_report:
+            yield status_report
+        while status_report.status in _RUNNING_STATES:
+            # Wait longer while the flow is waiting to be scheduled
+            time.sleep(5 if status_report.status == FlowStatus.SCHEDULED else 1)
+            previous_status_report, status_report = status_report, self.status()
+            if status_report != previous_status_report:
+                yield status_report
+        return None
+
     def __await_run(self) -> RunLog:
+        from tqdm.auto import tqdm  # noqa: PLC0415 -- deferred, slow to import
+
         start_time = datetime.now().astimezone()
-        # TODO: Switch to using websockets once they are available
         with tqdm(total=100, dynamic_ncols=True) as progress_bar:
-            status_report = self.status()
-            progress_bar.desc = status_report.status
-            progress_bar.update(0)
-
-            # Initially wait while pipeline is scheduled
-            while status_report.status == FlowStatus.SCHEDULED:
-                time.sleep(5)
-                status_report = self.status()
-
-            last_progress = status_report.progress if status_report.progress else 0
-            progress_bar.desc = status_report.status
-            progress_bar.update(last_progress)
-
-            # Wait while pipeline is running
-            running_states = (
-                FlowStatus.RUNNING,  # Flow is running
-                FlowStatus.STOPPING,  # Flow is in the process of stopping
-                FlowStatus.SCHEDULED,  # Flow is scheduled (again), likely a retry
-                FlowStatus.UNKNOWN,  # Flow status is unknown, but known was running
-            )
-            while status_report.status in running_states:
-                time.sleep(1)
-                status_report = self.status()
-                progress = status_report.progress if status_report.progress else 100
+            last_progress = 0
+            for status_report in self.watch_status():
                 progress_bar.desc = status_report.status
+                if status_report.progress:
+                    progress = status_report.progress
+                else:
+                    # No progress reported, the flow is starting or has finished
+                    running = status_report.status in _RUNNING_STATES
+                    progress = last_progress if running else 100
                 new_progress = last_progress + max(progress - last_progress, 0)
                 progress_bar.update(new_progress - last_progress)
                 last_progress = new_progress
@@ -524,6 +808,297 @@ class Flow(BaseModel):
             return run_log
 
 
+_RUNNING_STATES = (
+    FlowStatus.RUNNING,  # Flow is running
+    FlowStatus.STOPPING,  # Flow is in the process of stopping
+    FlowStatus.SCHEDULED,  # Flow is scheduled (again), likely a retry
+    FlowStatus.UNKNOWN,  # Flow status is unknown, but known was running
+)
+
+
+class RunLogCursor:
+    """
+    Incremental reader of a flow's run logs.
+
+    Remembers the newest log it returned, each call to `fetch` only returns the
+    logs created since then. The platform does not support filtering logs by
+    time, so the cursor requests small pages of the latest logs and grows the
+    page only while all logs in it are new.
+    """
+
+    MAX_PAGE_SIZE: ClassVar[int] = 1000
+
+    _flow: Flow
+    _page_size: int
+    _last_timestamp: datetime | None
+    _last_log_ids: set[str] | None
+    __client: Client
+
+    def __init__(self, flow: Flow, client: Client, page_size: int = 10) -> None:
+        if page_size < 1:
+            error_msg = f"page_size must be at least 1, got {page_size}"
+            raise ValueError(error_msg)
+        self.__client = client
+        self._flow = flow
+        self._page_size = page_size
+        self._last_timestamp = None
+        # Ids of the logs returned with the last timestamp, None if all logs with
+        #   the last timestamp are considered seen
+        self._last_log_ids = None
+
+    @property
+    def flow(self) -> Flow:
+        return self._flow
+
+    @property
+    def last_timestamp(self) -> datetime | None:
+        return self._last_timestamp
+
+    def _seek(self, timestamp: datetime, log_ids: set[str] | None = None) -> None:
+        self._last_timestamp = timestamp
+        self._last_log_ids = log_ids
+
+    def __is_seen(self, log: RunLog) -> bool:
+        if self._last_timestamp is None or log.timestamp > self._last_timestamp:
+            return False
+        if log.timestamp < self._last_timestamp:
+            return True
+        return self._last_log_ids is None or log.log_id in self._last_log_ids
+
+    def fetch(self) -> list[RunLog]:
+        """
+        Fetch the run logs created since the last fetch.
+
+        Returns
+        -------
+        list[RunLog]
+            New run logs, oldest first.
+        """
+        page_size = self._page_size
+        while True:
+            log_dicts = self.__client.component.get_flow_log(
+                app_id=self._flow.app_id,
+                flow_id=self._flow.flow_id,
+                max_count=page_size,
+            )
+            run_logs = [RunLog.from_dict(data=log) for log in log_dicts]
+            new_logs = [log for log in run_logs if not self.__is_seen(log)]
+
+            # Done if the page reached already seen logs or the oldest log
+            if len(new_logs) < len(run_logs) or len(run_logs) < page_size:
+                break
+            if page_size >= self.MAX_PAGE_SIZE:
+                logger.warning(
+                    "More than %d new run logs for %s, older logs are skipped",
+                    page_size,
+                    self._flow,
+                )
+                break
+            page_size = min(page_size * 2, self.MAX_PAGE_SIZE)
+
+        if not new_logs:
+            return []
+
+        # Logs are listed newest first, keep that order for equal timestamps
+        new_logs.reverse()
+        new_logs.sort(key=lambda log: log.timestamp)
+        last_timestamp = new_logs[-1].timestamp
+        last_log_ids = {
+            log.log_id for log in new_logs if log.timestamp == last_timestamp
+        }
+        if last_timestamp == self._last_timestamp and self._last_log_ids is not None:
+            last_log_ids |= self._last_log_ids
+        self._seek(timestamp=last_timestamp, log_ids=last_log_ids)
+        return new_logs
+
+    def follow(self, poll_interval: float = 5.0) -> Iterator[RunLog]:
+        """
+        Yield new run logs as they are created, polling indefinitely.
+
+        Parameters
+        ----------
+        poll_interval : float
+            Seconds to wait between polls.
+
+        Yields
+        ------
+        RunLog
+            New run logs, oldest first.
+        """
+        while True:
+            yield from self.fetch()
+            time.sleep(poll_interval)
+
+    @staticmethod
+    def follow_many(
+        cursors: Iterable[RunLogCursor], poll_interval: float = 5.0
+    ) -> Iterator[tuple[Flow, RunLog]]:
+        """
+        Yield new run logs of many flows as they are created, polling indefinitely.
+
+        Parameters
+        ----------
+        cursors : Iterable[RunLogCursor]
+            Cursors of the flows to watch.
+
+        poll_interval : float
+            Seconds to wait between polling all flows.
+
+        Yields
+        ------
+        tuple[Flow, RunLog]
+            The flow and its new run log.
+
+        Examples
+        --------
+        >>> cursors = [flow.log_cursor() for flow in app.flows().values()]
+        >>> for flow, run_log in RunLogCursor.follow_many(cursors):
+        ...     print(flow.name, run_log.status)
+        """
+        cursors = list(cursors)
+        while True:
+            for cursor in cursors:
+                yield from ((cursor.flow, log) for log in cursor.fetch())
+            time.sleep(poll_interval)
+
+
+_SCHEDULE_REMOVAL_TIMEOUT = 120.0
+_SCHEDULE_REMOVAL_POLL_INTERVAL = 1.0
+_SCHEDULE_REMOVAL_MAX_POLL_INTERVAL = 10.0
+
+
+def _await_schedule_removal(client: Client, flow: Flow) -> None:
+    deadline = time.monotonic() + _SCHEDULE_REMOVAL_TIMEOUT
+    poll_interval = _SCHEDULE_REMOVAL_POLL_INTERVAL
+    while True:
+        schedule = client.component.get_flow(flow_id=flow.flow_id).get("schedule")
+        if Flow.validate_schedule(schedule) is None:
+            return None
+
+        remaining_time = deadline - time.monotonic()
+        if remaining_time <= 0:
+            error_msg = (
+                f"Could not verify schedule removal for {flow} within"
+                f" {_SCHEDULE_REMOVAL_TIMEOUT} seconds, last observed schedule:"
+                f" {schedule}"
+            )
+            raise TimeoutError(error_msg)
+        time.sleep(min(poll_interval, remaining_time))
+        poll_interval = min(poll_interval * 2, _SCHEDULE_REMOVAL_MAX_POLL_INTERVAL)
+
+
+def _run_variables_request(variables: Mapping[str, Any]) -> datax.RunVariablesRequest:
+    return {
+        key: {"value": value}
+        for key, value in variables.items()
+        if not key.startswith("_")
+    }
+
+
+@dataclass
+class _FlowRun:
+    COLUMNS: ClassVar[list[str]] = [
+        "variables",
+        "status",
+        "log_id",
+        "erroneous_facet_id",
+        "data",
+        "error",
+        "submitted_at",
+        "finished_at",
+        "duration",
+        "run_log",
+    ]
+
+    index: int
+    variables: dict[str, Any]
+    submitted_at: datetime | None = None
+    deadline: float = math.inf
+    run_log: RunLog | None = None
+    error: Exception | None = None
+
+    def is_log_after_submission(self, run_log: RunLog) -> bool:
+        if self.submitted_at is None:
+            return False
+        # Run logs have a resolution of seconds
+        return run_log.timestamp >= self.submitted_at.replace(microsecond=0)
+
+    def to_dict(self) -> dict[str, Any]:
+        run_log = self.run_log
+        finished_at = run_log.timestamp if run_log else None
+        return {
+            "variables": self.variables,
+            "status": run_log.status if run_log else None,
+            "log_id": run_log.log_id if run_log else None,
+            "erroneous_facet_id": run_log.erroneous_facet_id if run_log else None,
+            "data": run_log.data if run_log else None,
+            "error": str(self.error) if self.error else None,
+            "submitted_at": self.submitted_at,
+            "finished_at": finished_at,
+            "duration": (
+                finished_at - self.submitted_at
+                if finished_at and self.submitted_at
+                else None
+            ),
+            "run_log": run_log,
+        }
+
+
+class FlowEditor(_ComponentEditor[Flow]):
+    _schedule: Schedule | MissingType | None
+
+    def __init__(self, client: Client, component: Flow) -> None:
+        super().__init__(client=client, component=component)
+        self._schedule = MISSING
+
+    def update_schedule(
+        self, schedule: Schedule | datax.ScheduleDict | str | None = None
+    ) -> Self:
+        if isinstance(schedule, str):
+            schedule = Schedule(
+                name=self._changes.get("name", self._component.name),
+                cron=schedule,
+                start_time=datetime.now(),
+                end_time=None,
+            )
+        if isinstance(schedule, Mapping):
+            schedule = Schedule.from_dict(schedule)
+
+        self._changes["schedule"] = schedule.to_dict() if schedule else None
+        self._schedule = schedule
+        return self
+
+    def update_high_volume_preference(self, optimize: bool) -> Self:
+        self._changes["high_volume_preference"] = optimize
+        return self
+
+    def update_definition(
+        self, definition: FlowDefinition | datax.FlowDefinitionDict
+    ) -> Self:
+        if isinstance(definition, FlowDefinition):
+            definition = definition.to_dict()
+        self._changes["flow_definition"] = definition
+        return self
+
+    @override
+    def _commit(self, changes: dict[str, Any]) -> None:
+        schedule, self._schedule = self._schedule, MISSING
+
+        self._client.component.edit_flow(
+            app_id=self._component.app_id,
+            flow_id=self._component.flow_id,
+            **changes,
+        )
+        if "name" in changes:
+            self._component.name = changes["name"]
+        if schedule is not MISSING:
+            if schedule is None:
+                # HACK: BE has no way to remove schedule via API,
+                #   so we wait until the schedule is observed to be removed
+                _await_schedule_removal(client=self._client, flow=self._component)
+            self._component.schedule = schedule
+
+
 class FlowBrowser(ComponentBrowser[Flow]):
     __app_id: str
     __client: Client
@@ -542,6 +1117,11 @@ class FlowBrowser(ComponentBrowser[Flow]):
 
         return NamedMapping(flows)
 
+    @override
+    def iter(self) -> Iterator[Flow]:
+        for flow in self.__client.component.iter_flows_for_app(app_id=self.__app_id):
+            yield Flow.from_dict(data=flow, client=self.__client)
+
     @override
     def __getitem__(self, name: str) -> Flow:
         flow_dict = self.__client.component.get_flow_by_name(
@@ -582,10 +1162,20 @@ class FlowDirectoryBuilder:
         self._parent = parent
         return self
 
-    def build(self) -> FlowDirectory:
+    def build(self, *, lazy: bool = False) -> FlowDirectory:
         directory_id = self.__client.component.create_flow_directory(
             app_id=self._app_id, name=self._name, parent=self._parent
         )
+        if lazy:
+            return FlowDirectory._from_partial(
+                data={
+                    "app_id": self._app_id,
+                    "directory_id": directory_id,
+                    "name": self._name,
+                },
+                client=self.__client,
+            )
+
         directory_dict = self.__client.component.get_flow_directory(
             app_id=self._app_id, directory_id=directory_id
         )
@@ -593,7 +1183,7 @@ class FlowDirectoryBuilder:
         return FlowDirectory.from_dict(data=directory_dict, client=self.__client)
 
 
-class FlowDirectory(BaseModel):
+class FlowDirectory(LazyModel):
     app_id: str = Field(validation_alias="project_id")
     directory_id: str
     name: str
@@ -610,6 +1200,16 @@ class FlowDirectory(BaseModel):
         self.__client = client
         return self
 
+    @classmethod
+    def _from_partial(cls, data: Mapping[str, Any], client: Client) -> Self:
+        app_id, directory_id = data["app_id"], data["directory_id"]
+        self = cls._construct_partial(
+            data=data,
+            loader=partial(_load_flow_directory, client, app_id, directory_id),
+        )
+        self.__client = client
+        return self
+
     def to_dict(self) -> NamedDirectoryDict:
         return {"directory_id": self.directory_id, "type": self.type, "name": self.name}
 
@@ -641,3 +1241,16 @@ class FlowDirectory(BaseModel):
         }
 
         return NamedMapping(flows)
+
+
+# Loaders of lazily created components, module level functions to be picklable
+
+
+def _load_flow(client: Client, flow_id: str) -> Mapping[str, Any]:
+    return client.component.get_flow(flow_id=flow_id)
+
+
+def _load_flow_directory(
+    client: Client, app_id: str, directory_id: str
+) -> Mapping[str, Any]:
+    return client.component.get_flow_directory(app_id=app_id, directory_id=directory_id)
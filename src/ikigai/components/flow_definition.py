@@ -4,19 +4,24 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 from collections import defaultdict
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from ikigai.client import datax
-from ikigai.components.custom_facet import CustomFacetVersion
-from ikigai.specs import CustomFacetType, FacetType
-from ikigai.specs import SubModelSpec as ModelType
 from ikigai.utils import FacetArgumentType
 from ikigai.utils.compatibility import Self, override
-from ikigai.utils.data_structures import merge_dicts
+from ikigai.utils.data_structures import copy_containers, merge_dicts_in_place
+
+if TYPE_CHECKING:
+    # Specs are only needed once facets are added, they are not imported eagerly
+    from ikigai.components.custom_facet import CustomFacetVersion
+    from ikigai.specs import CustomFacetType, FacetType
+    from ikigai.specs import SubModelSpec as ModelType
 
 logger = logging.getLogger("ikigai.components")
 
@@ -235,7 +240,7 @@ class FacetBuilder:
             arg_spec.validate_value(facet=facet_name, value=arg_value)
 
     def _update_arguments(self, **arguments: Any) -> Self:
-        self._arguments = merge_dicts(self._arguments, arguments)
+        merge_dicts_in_place(self._arguments, arguments)
         return self
 
     def _build_arguments(self) -> dict[str, Any]:
@@ -255,7 +260,9 @@ class FacetBuilder:
             facet_id=facet_id,
             facet_uid=self._facet_type.facet_uid,
             name=self.__name,
-            arguments=self._build_arguments(),
+            # Arguments are merged in place, the built facet must not share
+            #   them with the builder
+            arguments=copy_containers(self._build_arguments()),
         )
 
         self.__arrows = [
@@ -265,7 +272,9 @@ class FacetBuilder:
 
     def build(self) -> FlowDefinition:
         flow_definition = self._builder.build()
-        logger.debug("Built flow definition: %s", flow_definition.to_dict())
+        if logger.isEnabledFor(logging.DEBUG):
+            # Dumping a large flow definition is expensive, only do it when logged
+            logger.debug("Built flow definition: %s", flow_definition.to_dict())
         return flow_definition
 
 
@@ -331,9 +340,7 @@ class CustomFacetFacetBuilder(FacetBuilder):
             arg_spec.validate_value(facet=facet_name, value=arg_value)
 
     def _update_custom_arguments(self, **custom_arguments: Any) -> Self:
-        self._custom_facet_arguments = merge_dicts(
-            self._custom_facet_arguments, custom_arguments
-        )
+        merge_dicts_in_place(self._custom_facet_arguments, custom_arguments)
         return self
 
     @override
@@ -525,7 +532,7 @@ class FlowDefinitionBuilder:
         return facet_builder
 
     def _add_variables(self, variables: dict[str, FlowVariable]) -> Self:
-        self._variables = merge_dicts(self._variables, variables)
+        self._variables.update(variables)
         return self
 
     def build(self) -> FlowDefinition:
@@ -536,10 +543,12 @@ class FlowDefinitionBuilder:
             facets.append(facet)
             arrows.extend(in_arrows)
 
-        return FlowDefinition(
+        # Facets, arrows and variables are already validated models,
+        #   skip re-validating them as it dominates build time for large flows
+        return FlowDefinition.model_construct(
             facets=facets,
             arrows=arrows,
-            variables=self._variables,
+            variables=dict(self._variables),
             model_variables={},
         )
 
@@ -566,3 +575,214 @@ class FlowDefinition(BaseModel):
     def to_dict(self) -> datax.FlowDefinitionDict:
         # TODO: Check if this is correct
         return cast(datax.FlowDefinitionDict, self.model_dump(by_alias=True))
+
+    def content_hash(self) -> str:
+        """
+        Hash of the definition's content.
+
+        Two definitions have the same hash exactly when `diff_flow_definitions`
+        reports no changes between them.
+
+        Returns
+        -------
+        str
+            Hex digest of the normalized definition.
+        """
+        return flow_definition_hash(self.to_dict())
+
+
+class FlowDefinitionDiff(BaseModel):
+    """
+    Facet and arrow level differences between two flow definitions.
+    """
+
+    added_facets: list[str] = Field(default_factory=list)
+    """Ids of facets only present in the new definition."""
+    removed_facets: list[str] = Field(default_factory=list)
+    """Ids of facets only present in the old definition."""
+    changed_facets: list[str] = Field(default_factory=list)
+    """Ids of facets whose type, name or arguments changed."""
+    added_arrows: list[tuple[str, str]] = Field(default_factory=list)
+    """(source, destination) of arrows only present in the new definition."""
+    removed_arrows: list[tuple[str, str]] = Field(default_factory=list)
+    """(source, destination) of arrows only present in the old definition."""
+    changed_arrows: list[tuple[str, str]] = Field(default_factory=list)
+    """(source, destination) of arrows whose arguments changed."""
+    variables_changed: bool = False
+    model_variables_changed: bool = False
+
+    model_config = ConfigDict(frozen=True)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(
+            self.added_facets
+            or self.removed_facets
+            or self.changed_facets
+            or self.added_arrows
+            or self.removed_arrows
+            or self.changed_arrows
+            or self.variables_changed
+            or self.model_variables_changed
+        )
+
+    def __bool__(self) -> bool:
+        return self.has_changes
+
+    def summary(self) -> str:
+        if not self.has_changes:
+            return "no changes"
+        parts = [
+            f"{description}: {values}"
+            for description, values in (
+                ("added facets", self.added_facets),
+                ("removed facets", self.removed_facets),
+                ("changed facets", self.changed_facets),
+                ("added arrows", self.added_arrows),
+                ("removed arrows", self.removed_arrows),
+                ("changed arrows", self.changed_arrows),
+            )
+            if values
+        ]
+        if self.variables_changed:
+            parts.append("variables changed")
+        if self.model_variables_changed:
+            parts.append("model variables changed")
+        return "; ".join(parts)
+
+
+# Details of the targeted argument that the platform adds to flow variables
+_VARIABLE_DETAILS = ("value", "type", "is_list")
+
+_NormalizedDefinition = tuple[
+    dict[str, dict[str, Any]], dict[tuple[str, str], dict[str, Any]], dict, dict
+]
+
+
+def _normalize_flow_definition(
+    definition: datax.FlowDefinitionDict,
+) -> _NormalizedDefinition:
+    # Optional fields are dropped by the platform when empty, fill in defaults
+    #   so that a definition compares equal to the one returned by the platform
+    facets = {
+        facet["facet_id"]: {
+            "facet_uid": facet["facet_uid"],
+            "name": facet.get("name", ""),
+            "arguments": facet.get("arguments") or {},
+        }
+        for facet in definition.get("facets", [])
+    }
+    arrows = {
+        (arrow["source"], arrow["destination"]): arrow.get("arguments") or {}
+        for arrow in definition.get("arrows", [])
+    }
+    # The platform adds the type and value of the targeted argument to the
+    #   variables, FlowVariable sets the targeted argument only. The details
+    #   are kept when given, they are compared if both definitions have them
+    variables = {
+        variable_name: {
+            "facet_name": variable.get("facet_name", ""),
+            "name": variable["name"],
+            **{
+                key: value
+                for key, value in variable.items()
+                if key in _VARIABLE_DETAILS
+            },
+        }
+        for variable_name, variable in (definition.get("variables") or {}).items()
+    }
+    return (
+        facets,
+        arrows,
+        variables,
+        dict(definition.get("model_variables") or {}),
+    )
+
+
+def _variables_changed(old: dict, new: dict) -> bool:
+    if old.keys() != new.keys():
+        return True
+    for variable_name, new_variable in new.items():
+        old_variable = old[variable_name]
+        shared_keys = old_variable.keys() & new_variable.keys()
+        if any(old_variable[key] != new_variable[key] for key in shared_keys):
+            return True
+    return False
+
+
+def flow_definition_hash(definition: datax.FlowDefinitionDict) -> str:
+    """
+    Hash of a flow definition's content.
+
+    Parameters
+    ----------
+    definition : FlowDefinitionDict
+        The flow definition to hash.
+
+    Returns
+    -------
+    str
+        Hex digest of the normalized definition, independent of facet and
+        arrow order and of optional fields left at their defaults.
+    """
+    facets, arrows, variables, model_variables = _normalize_flow_definition(definition)
+    content = {
+        "facets": sorted(facets.items()),
+        "arrows": sorted(
+            [source, destination, arguments]
+            for (source, destination), arguments in arrows.items()
+        ),
+        "variables": variables,
+        "model_variables": model_variables,
+    }
+    serialized = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def diff_flow_definitions(
+    old: datax.FlowDefinitionDict, new: datax.FlowDefinitionDict
+) -> FlowDefinitionDiff:
+    """
+    Compute the facet and arrow level differences between two flow definitions.
+
+    Parameters
+    ----------
+    old : FlowDefinitionDict
+        The current flow definition, e.g. the one stored on the platform.
+
+    new : FlowDefinitionDict
+        The flow definition to compare against it.
+
+    Returns
+    -------
+    FlowDefinitionDiff
+        The differences, falsy if the definitions are equivalent.
+    """
+    old_facets, old_arrows, old_variables, old_model_variables = (
+        _normalize_flow_definition(old)
+    )
+    new_facets, new_arrows, new_variables, new_model_variables = (
+        _normalize_flow_definition(new)
+    )
+    return FlowDefinitionDiff(
+        added_facets=[
+            facet_id for facet_id in new_facets if facet_id not in old_facets
+        ],
+        removed_facets=[
+            facet_id for facet_id in old_facets if facet_id not in new_facets
+        ],
+        changed_facets=[
+            facet_id
+            for facet_id, facet in new_facets.items()
+            if facet_id in old_facets and old_facets[facet_id] != facet
+        ],
+        added_arrows=[arrow for arrow in new_arrows if arrow not in old_arrows],
+        removed_arrows=[arrow for arrow in old_arrows if arrow not in new_arrows],
+        changed_arrows=[
+            arrow
+            for arrow, arguments in new_arrows.items()
+            if arrow in old_arrows and old_arrows[arrow] != arguments
+        ],
+        variables_changed=_variables_changed(old_variables, new_variables),
+        model_variables_changed=old_model_variables != new_model_variables,
+    )
@@ -5,18 +5,23 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from datetime import datetime
-from typing import Any
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
 from pydantic import AliasChoices, BaseModel, Field, PrivateAttr
 
 from ikigai.client import Client
-from ikigai.specs import SubModelSpec
+from ikigai.components._component_editor import _ComponentEditor
 from ikigai.typing import ComponentBrowser, Directory, NamedDirectoryDict, NamedMapping
+from ikigai.typing.pydantic_extensions import LazyModel
 from ikigai.utils import DirectoryType
 from ikigai.utils.compatibility import Self, deprecated, override
 
+if TYPE_CHECKING:
+    from ikigai.specs import SubModelSpec
+
 logger = logging.getLogger("ikigai.components")
 
 
@@ -52,7 +57,21 @@ class ModelBuilder:
         self._description = description
         return self
 
-    def build(self) -> Model:
+    def build(self, *, lazy: bool = False) -> Model:
+        """
+        Build the Model
+
+        Parameters
+        ----------
+        lazy : bool
+            If True, the Model is populated from the builder instead of being
+            fetched after creation, remaining fields are fetched on first access.
+
+        Returns
+        -------
+        Model
+            The created Model
+        """
         if self._model_type is None:
             error_msg = "Model type must be specified"
             raise ValueError(error_msg)
@@ -64,6 +83,19 @@ class ModelBuilder:
             model_type=self._model_type,
             description=self._description,
         )
+        if lazy:
+            return Model._from_partial(
+                data={
+                    "app_id": self._app_id,
+                    "model_id": model_id,
+                    "name": self._name,
+                    "model_type": self._model_type.model_type,
+                    "sub_model_type": self._model_type.sub_model_type,
+                    "description": self._description,
+                },
+                client=self.__client,
+            )
+
         # Populate the model object
         model_dict = self.__client.component.get_model(
             app_id=self._app_id, model_id=model_id
@@ -72,7 +104,7 @@ class ModelBuilder:
         return Model.from_dict(data=model_dict, client=self.__client)
 
 
-class Model(BaseModel):
+class Model(LazyModel):
     app_id: str = Field(validation_alias=AliasChoices("app_id", "project_id"))
     model_id: str
     name: str
@@ -90,6 +122,16 @@ class Model(BaseModel):
         self.__client = client
         return self
 
+    @classmethod
+    def _from_partial(cls, data: Mapping[str, Any], client: Client) -> Self:
+        app_id, model_id = data["app_id"], data["model_id"]
+        self = cls._construct_partial(
+            data=data,
+            loader=partial(_load_model, client, app_id, model_id),
+        )
+        self.__client = client
+        return self
+
     def delete(self) -> None:
         self.__client.component.delete_model(app_id=self.app_id, model_id=self.model_id)
         return None
@@ -114,6 +156,26 @@ class Model(BaseModel):
         self.description = description
         return self
 
+    def edit(self) -> ModelEditor:
+        """
+        Batch several edits to the model into a single request.
+
+        Changes recorded on the editor are sent together when the `with` block
+        exits without an exception, or when `commit` is called.
+
+        Returns
+        -------
+        ModelEditor
+            Editor accumulating changes to the model.
+
+        Examples
+        --------
+        >>> with model.edit() as edit:
+        ...     edit.rename("Churn Forecast")
+        ...     edit.update_description("Forecasts monthly churn")
+        """
+        return ModelEditor(client=self.__client, component=self)
+
     def versions(self) -> NamedMapping[ModelVersion]:
         version_dicts = self.__client.component.get_model_versions(
             app_id=self.app_id, model_id=self.model_id
@@ -136,6 +198,24 @@ class Model(BaseModel):
         )
 
 
+class ModelEditor(_ComponentEditor[Model]):
+    def update_description(self, description: str) -> Self:
+        self._changes["description"] = description
+        return self
+
+    @override
+    def _commit(self, changes: dict[str, Any]) -> None:
+        self._client.component.edit_model(
+            app_id=self._component.app_id,
+            model_id=self._component.model_id,
+            **changes,
+        )
+        if "name" in changes:
+            self._component.name = changes["name"]
+        if "description" in changes:
+            self._component.description = changes["description"]
+
+
 class ModelBrowser(ComponentBrowser[Model]):
     __app_id: str
     __client: Client
@@ -156,6 +236,11 @@ class ModelBrowser(ComponentBrowser[Model]):
 
         return NamedMapping(models)
 
+    @override
+    def iter(self) -> Iterator[Model]:
+        for model in self.__client.component.iter_models_for_app(app_id=self.__app_id):
+            yield Model.from_dict(data=model, client=self.__client)
+
     @override
     def __getitem__(self, name: str) -> Model:
         model_dict = self.__client.component.get_model_by_name(
@@ -225,10 +310,20 @@ class ModelDirectoryBuilder:
         self._parent = parent
         return self
 
-    def build(self) -> ModelDirectory:
+    def build(self, *, lazy: bool = False) -> ModelDirectory:
         directory_id = self.__client.component.create_model_directory(
             app_id=self._app_id, name=self._name, parent=self._parent
         )
+        if lazy:
+            return ModelDirectory._from_partial(
+                data={
+                    "app_id": self._app_id,
+                    "directory_id": directory_id,
+                    "name": self._name,
+                },
+                client=self.__client,
+            )
+
         directory_dict = self.__client.component.get_model_directory(
             app_id=self._app_id, directory_id=directory_id
         )
@@ -236,7 +331,7 @@ class ModelDirectoryBuilder:
         return ModelDirectory.from_dict(data=directory_dict, client=self.__client)
 
 
-class ModelDirectory(BaseModel):
+class ModelDirectory(LazyModel):
     app_id: str = Field(validation_alias=AliasChoices("app_id", "project_id"))
     directory_id: str
     name: str
@@ -253,6 +348,16 @@ class ModelDirectory(BaseModel):
         self.__client = client
         return self
 
+    @classmethod
+    def _from_partial(cls, data: Mapping[str, Any], client: Client) -> Self:
+        app_id, directory_id = data["app_id"], data["directory_id"]
+        self = cls._construct_partial(
+            data=data,
+            loader=partial(_load_model_directory, client, app_id, directory_id),
+        )
+        self.__client = client
+        return self
+
     def to_dict(self) -> NamedDirectoryDict:
         return {"directory_id": self.directory_id, "type": self.type, "name": self.name}
 
@@ -284,3 +389,18 @@ class ModelDirectory(BaseModel):
         }
 
         return NamedMapping(models)
+
+
+# Loaders of lazily created components, module level functions to be picklable
+
+
+def _load_model(client: Client, app_id: str, model_id: str) -> Mapping[str, Any]:
+    return client.component.get_model(app_id=app_id, model_id=model_id)
+
+
+def _load_model_directory(
+    client: Client, app_id: str, directory_id: str
+) -> Mapping[str, Any]:
+    return client.component.get_model_directory(
+        app_id=app_id, directory_id=directory_id
+    )
@@ -10,18 +10,30 @@ from pydantic import ConfigDict, EmailStr, Field, HttpUrl
 from pydantic.dataclasses import dataclass
 
 from ikigai import components, specs
-from ikigai.client import Client, SSLConfig
+from ikigai.client import Client, SessionHooks, SpecsCache, SSLConfig, Tracer
+from ikigai.client.compression import DEFAULT_COMPRESSION_THRESHOLD
+from ikigai.client.transport import Transport
 from ikigai.typing import ComponentBrowser, NamedMapping
-from ikigai.utils.compatibility import deprecated
+from ikigai.utils import BaseUrlValidation, RequestCompression
+from ikigai.utils.bulk import BulkExecutor
+from ikigai.utils.compatibility import Self, deprecated
 from ikigai.utils.missing import MISSING, MissingType
 
 
 # Config to avoid extra '/' in url paths: https://pydantic.dev/articles/pydantic-v2-12-release#preserve-empty-url-paths
-@dataclass(config=ConfigDict(url_preserve_empty_path=True))
+@dataclass(
+    config=ConfigDict(arbitrary_types_allowed=True, url_preserve_empty_path=True)
+)
 class Ikigai:
     """
     Main Ikigai class to interact with the Ikigai platform.
 
+    An Ikigai instance can be shared by the threads of a thread pool, they
+    reuse the same connections to the platform. It and its components (e.g.
+    datasets) can be pickled to process pool workers, which open their own
+    connections. Hooks and tracers are not pickled. Close the client, or use
+    it as a context manager, to release its connections.
+
     Parameters
     ----------
 
@@ -40,6 +52,41 @@ class Ikigai:
         Set to `False` to disable SSL verification (unsafe), or provide
         custom SSL certificate by providing the path to a certificate
         (.pem) file or a tuple of (certificate, key).
+
+    transport: requests.adapters.BaseAdapter or None
+        Transport sending the requests, see `ikigai.client.transport`. Use a
+        `RecordingTransport` to record the requests to a cassette and a
+        `ReplayTransport` to replay them without a network connection.
+        Default is None, sending requests over HTTP with up to 32 connections
+        kept open, pass a `requests.adapters.HTTPAdapter` to change it.
+
+    validate_base_url: BaseUrlValidation or str
+        When to check that the Ikigai platform is reachable via the base_url.
+        "eager" (default) checks before the client is returned, "lazy" before
+        the first request is sent and "background" in a background thread
+        that the first request waits for. Each base URL is only checked
+        once per process.
+
+    request_compression: RequestCompression or str or None
+        Compress request bodies larger than `compression_threshold` bytes,
+        with "gzip" or "br" (brotli, requires the brotli package). Default is
+        None, sending requests uncompressed. Responses are always negotiated
+        and decompressed.
+
+    compression_threshold: int
+        Size in bytes from which request bodies are compressed. Default is
+        16 KiB.
+
+    specs_cache: SpecsCache or None
+        Cache of the facet and model specs, share one between the clients of
+        many users to fetch the specs once (see `IkigaiPool`). Default is
+        None, caching the specs for this client only.
+
+    coalesce_requests: bool
+        Send identical GET requests made concurrently (e.g. by the threads of
+        a pool loading the same dataset) once, sharing the response. A thread
+        does not share a response requested before its last change to the
+        platform. Default is True.
     """
 
     user_email: EmailStr
@@ -48,17 +95,61 @@ class Ikigai:
         default="https://api.ikigailabs.io", validate_default=True
     )
     ssl: InitVar[SSLConfig | MissingType] = MISSING
+    transport: InitVar[Transport | None] = None
+    validate_base_url: InitVar[BaseUrlValidation] = BaseUrlValidation.EAGER
+    request_compression: InitVar[RequestCompression | None] = None
+    compression_threshold: InitVar[int] = DEFAULT_COMPRESSION_THRESHOLD
+    specs_cache: InitVar[SpecsCache | None] = None
+    coalesce_requests: InitVar[bool] = True
     __client: Client = Field(init=False)
 
-    def __post_init__(
-        self, api_key: str, ssl: SSLConfig | MissingType = MISSING
+    def __post_init__(  # noqa: PLR0917 -- the dataclass passes InitVars positionally
+        self,
+        api_key: str,
+        ssl: SSLConfig | MissingType = MISSING,
+        transport: Transport | None = None,
+        validate_base_url: BaseUrlValidation = BaseUrlValidation.EAGER,
+        request_compression: RequestCompression | None = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        specs_cache: SpecsCache | None = None,
+        coalesce_requests: bool = True,
     ) -> None:
         if ssl is MISSING:
             ssl = True
         self.__client = Client(
-            user_email=self.user_email, api_key=api_key, base_url=self.base_url, ssl=ssl
+            user_email=self.user_email,
+            api_key=api_key,
+            base_url=self.base_url,
+            ssl=ssl,
+            transport=transport,
+            validate_base_url=validate_base_url,
+            request_compression=request_compression,
+            compression_threshold=compression_threshold,
+            specs_cache=specs_cache,
+            coalesce_requests=coalesce_requests,
         )
 
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the connections to the Ikigai platform.
+
+        The client can not be used afterwards. Prefer using the client as a
+        context manager, which closes it when the block is exited.
+
+        Examples
+        --------
+
+        >>> with Ikigai(user_email=..., api_key=...) as ikigai:
+        ...     app = ikigai.apps["my-app"]
+        """
+        self.__client.close()
+
     @property
     def apps(self) -> ComponentBrowser[components.App]:
         """
@@ -181,6 +272,94 @@ class Ikigai:
         """
         return components.AppDirectoryBuilder(client=self.__client)
 
+    def bulk(
+        self, max_workers: int = 8, rate_limit: float | None = None
+    ) -> BulkExecutor:
+        """
+        Get an executor to run many operations concurrently.
+
+        Operations run on a bounded thread pool, a failing operation does not
+        stop the remaining ones.
+
+        Parameters
+        ----------
+
+        max_workers: int
+            Maximum number of operations running at the same time.
+
+        rate_limit: float | None
+            Maximum number of operations started per second, None for no limit.
+
+        Returns
+        -------
+
+        BulkExecutor
+            A new bulk executor.
+
+        Examples
+        --------
+
+        Create many apps, starting at most 5 per second
+
+        >>> bulk = ikigai.bulk(rate_limit=5)
+        >>> for name in names:
+        ...     bulk.submit(ikigai.app.new(name=name).build)
+        >>> results = bulk.run()
+        >>> apps = [result.value for result in results.succeeded]
+        """
+        return BulkExecutor(max_workers=max_workers, rate_limit=rate_limit)
+
+    @property
+    def hooks(self) -> SessionHooks:
+        """
+        Hooks called around every request made to the Ikigai platform.
+
+        Returns
+        -------
+
+        SessionHooks
+            The request hooks of this client.
+
+        Examples
+        --------
+
+        Collect per-endpoint latency and transfer metrics
+
+        >>> from ikigai.client import MetricsCollector
+        >>> metrics = MetricsCollector()
+        >>> metrics.attach(ikigai.hooks)
+        >>> app = ikigai.apps["my-app"]
+        >>> print(metrics.to_prometheus())
+        """
+        return self.__client.hooks
+
+    def set_tracer(self, tracer: Tracer | None) -> None:
+        """
+        Trace the operations of this client.
+
+        Composite operations (e.g. building a dataset or running a flow) and
+        every request they make are recorded as spans by the tracer, requests
+        carry their trace context in the `traceparent` header.
+
+        Parameters
+        ----------
+
+        tracer: Tracer | None
+            Tracer recording the spans, None to stop tracing.
+
+        Examples
+        --------
+
+        Write the spans of a dataset upload to a local file
+
+        >>> from ikigai.client import FileSpanExporter, Tracer
+        >>> tracer = Tracer(exporter=FileSpanExporter("spans.jsonl"))
+        >>> ikigai.set_tracer(tracer)
+        >>> dataset = app.dataset.new("sales").df(df).build()
+        >>> tracer.flush()
+        """
+        self.__client.set_tracer(tracer)
+
     @property
     def builder(self) -> components.FlowDefinitionBuilder:
         """
@@ -0,0 +1,221 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from typing import Any
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+from ikigai.client import SpecsCache, SSLConfig, Transport
+from ikigai.client.compression import DEFAULT_COMPRESSION_THRESHOLD
+from ikigai.client.session import DEFAULT_POOL_SIZE
+from ikigai.ikigai import Ikigai
+from ikigai.utils import BaseUrlValidation, RequestCompression
+from ikigai.utils.compatibility import Self
+
+DEFAULT_MAX_IDLE_CLIENTS = 128
+
+
+class _SharedTransport(BaseAdapter):
+    """Transport shared by the clients of a pool, closed with the pool only."""
+
+    def __init__(self, transport: Transport) -> None:
+        super().__init__()
+        self.transport = transport
+
+    def send(  # noqa: PLR0917 -- signature of requests.adapters.BaseAdapter
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Any = None,
+        verify: Any = True,
+        cert: Any = None,
+        proxies: Mapping[str, str] | None = None,
+    ) -> requests.Response:
+        return self.transport.send(
+            request,
+            stream=stream,
+            timeout=timeout,
+            verify=verify,
+            cert=cert,
+            proxies=dict(proxies) if proxies is not None else None,
+        )
+
+    def close(self) -> None:
+        # Closing a client of the pool must not close the connections of the
+        #   other clients
+        return None
+
+
+class _Tenant:
+    def __init__(self, ikigai: Ikigai) -> None:
+        self.ikigai = ikigai
+        self.leases = 0
+
+
+class IkigaiPool:
+    """
+    Clients of many users of an Ikigai platform, sharing their resources.
+
+    The clients of the pool share one connection pool and cache the facet and
+    model specs once for all users, each client sends the credentials of its
+    user. Clients are kept while they are idle to be reused by the next lease
+    for their user, the least recently used idle clients are closed once there
+    are more than `max_idle_clients`.
+
+    Parameters
+    ----------
+
+    base_url: str
+        Base URL of the Ikigai API endpoints. Default is
+        "https://api.ikigailabs.io".
+
+    ssl: bool or str or tuple
+        SSL configuration of the clients, see `Ikigai`.
+
+    transport: requests.adapters.BaseAdapter or None
+        Transport sending the requests of all clients, see `Ikigai`. Default
+        is None, sending requests over HTTP with up to 32 connections kept
+        open per host.
+
+    max_idle_clients: int
+        Number of idle clients kept for reuse. Default is 128.
+
+    request_compression: RequestCompression or str or None
+        Compression of request bodies, see `Ikigai`.
+
+    compression_threshold: int
+        Size in bytes from which request bodies are compressed, see `Ikigai`.
+
+    Examples
+    --------
+
+    >>> pool = IkigaiPool(base_url="https://api.ikigailabs.io")
+    >>> with pool.client(user_email=..., api_key=...) as ikigai:
+    ...     app = ikigai.apps["my-app"]
+    >>> pool.close()
+    """
+
+    def __init__(
+        self,
+        base_url: str = "https://api.ikigailabs.io",
+        *,
+        ssl: SSLConfig = True,
+        transport: Transport | None = None,
+        max_idle_clients: int = DEFAULT_MAX_IDLE_CLIENTS,
+        request_compression: RequestCompression | None = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+    ) -> None:
+        if max_idle_clients < 0:
+            error_msg = "max_idle_clients must not be negative"
+            raise ValueError(error_msg)
+        self.base_url = base_url
+        self.max_idle_clients = max_idle_clients
+        self.__transport = _SharedTransport(
+            transport
+            if transport is not None
+            else HTTPAdapter(pool_maxsize=DEFAULT_POOL_SIZE)
+        )
+        # The base URL is validated once per process, the clients after the
+        #   first one are created without making requests
+        self.__client_options: dict[str, Any] = {
+            "base_url": base_url,
+            "ssl": ssl,
+            "transport": self.__transport,
+            "validate_base_url": BaseUrlValidation.LAZY,
+            "request_compression": request_compression,
+            "compression_threshold": compression_threshold,
+            "specs_cache": SpecsCache(),
+        }
+        self.__tenants: OrderedDict[tuple[str, str], _Tenant] = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__closed = False
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__tenants)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    @contextmanager
+    def client(self, user_email: str, api_key: str) -> Iterator[Ikigai]:
+        """
+        Lease the client of a user for the duration of the with block.
+
+        The client is created on the first lease for the user and reused by
+        the next ones, it can be used by many threads at once. Leased clients
+        are never closed by the pool, except when the pool is closed.
+
+        Parameters
+        ----------
+
+        user_email: str
+            Email of the user.
+
+        api_key: str
+            API key of the user.
+
+        Yields
+        ------
+
+        Ikigai
+            The client of the user, do not close it.
+
+        Raises
+        ------
+
+        RuntimeError
+            If the pool is closed.
+        """
+        tenant = self.__lease(user_email=user_email, api_key=api_key)
+        try:
+            yield tenant.ikigai
+        finally:
+            with self.__lock:
+                tenant.leases -= 1
+                evicted = self.__evict_idle()
+            for idle_tenant in evicted:
+                idle_tenant.ikigai.close()
+
+    def close(self) -> None:
+        """Close all clients of the pool and their shared connections."""
+        with self.__lock:
+            self.__closed = True
+            tenants = list(self.__tenants.values())
+            self.__tenants.clear()
+        for tenant in tenants:
+            tenant.ikigai.close()
+        self.__transport.transport.close()
+
+    def __lease(self, user_email: str, api_key: str) -> _Tenant:
+        key = (user_email, api_key)
+        with self.__lock:
+            if self.__closed:
+                error_msg = "The pool is closed"
+                raise RuntimeError(error_msg)
+            tenant = self.__tenants.get(key)
+            if tenant is None:
+                ikigai = Ikigai(
+                    user_email=user_email, api_key=api_key, **self.__client_options
+                )
+                tenant = self.__tenants[key] = _Tenant(ikigai=ikigai)
+            self.__tenants.move_to_end(key)
+            tenant.leases += 1
+        return tenant
+
+    def __evict_idle(self) -> list[_Tenant]:
+        # Must be called while holding the lock
+        idle_keys = [key for key, tenant in self.__tenants.items() if not tenant.leases]
+        num_evicted = max(0, len(idle_keys) - self.max_idle_clients)
+        return [self.__tenants.pop(key) for key in idle_keys[:num_evicted]]
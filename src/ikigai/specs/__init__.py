@@ -2,13 +2,39 @@
 #
 # SPDX-License-Identifier: MIT
 
-from ikigai.specs.facet import (
-    CustomFacetArgumentSpec,
-    CustomFacetType,
-    FacetType,
-    FacetTypes,
+"""
+Specs are imported on first access, so that `import ikigai` does not build
+every spec model up front.
+"""
+
+from typing import TYPE_CHECKING
+
+from ikigai.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ikigai.specs.facet import (
+        CustomFacetArgumentSpec,
+        CustomFacetType,
+        FacetType,
+        FacetTypes,
+    )
+    from ikigai.specs.model import ModelTypes, SubModelSpec
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ikigai.specs.facet": (
+            "CustomFacetArgumentSpec",
+            "CustomFacetType",
+            "FacetType",
+            "FacetTypes",
+        ),
+        "ikigai.specs.model": (
+            "ModelTypes",
+            "SubModelSpec",
+        ),
+    },
 )
-from ikigai.specs.model import ModelTypes, SubModelSpec
 
 __all__ = [
     "CustomFacetArgumentSpec",
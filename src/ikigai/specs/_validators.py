@@ -0,0 +1,140 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Building blocks for the compiled value validators of argument specs.
+
+Each spec compiles its validation rules into a tree of closures once, so that
+validating a value only performs the checks that apply to that spec instead of
+re-inspecting the spec on every call.
+"""
+
+from __future__ import annotations
+
+import abc
+from collections.abc import Callable, Mapping
+from functools import cached_property
+from typing import Any
+
+from pydantic import BaseModel
+
+from ikigai.utils.compatibility import Self, override
+
+Validator = Callable[[str, Any], None]
+"""Validates a value, called with the context (facet or model name) and value."""
+
+ErrorMessage = Callable[..., str]
+"""Formats an error message from the context, expectation and (optional) value."""
+
+
+_TYPE_CHECKS: dict[str, tuple[type | tuple[type, ...], str]] = {
+    "BOOLEAN": (bool, "must be boolean"),
+    "TEXT": (str, "must be string"),
+    "NUMBER": ((int, float), "must be numeric"),
+}
+
+
+class CompiledValidatorModel(BaseModel, abc.ABC):
+    """
+    Spec compiling its validation rules into a validator on first use.
+
+    The validator is cached on the spec, but neither copied nor pickled with
+    it (closures can not be pickled), copies and unpickled specs compile their
+    own validator.
+    """
+
+    @cached_property
+    def _validator(self) -> Validator:
+        return self._compile_validator()
+
+    @abc.abstractmethod
+    def _compile_validator(self) -> Validator: ...
+
+    @override
+    def __getstate__(self) -> dict[Any, Any]:
+        state = super().__getstate__()
+        state["__dict__"] = {
+            name: value
+            for name, value in state["__dict__"].items()
+            if name != "_validator"
+        }
+        return state
+
+    @override
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop("_validator", None)
+        return copied
+
+
+def optional_validator(
+    error_message: ErrorMessage, is_required: bool, validator: Validator
+) -> Validator:
+    def validate(context: str, value: Any) -> None:
+        if value is None:
+            if is_required:
+                error_msg = error_message(context, "is required", value)
+                raise ValueError(error_msg)
+            return None  # No further validation for None values
+        return validator(context, value)
+
+    return validate
+
+
+def list_validator(error_message: ErrorMessage, item_validator: Validator) -> Validator:
+    def validate(context: str, value: Any) -> None:
+        if not isinstance(value, list):
+            error_msg = error_message(context, "must be list", value)
+            raise TypeError(error_msg)
+        for item in value:
+            item_validator(context, item)
+        return None  # All items validated
+
+    return validate
+
+
+def mapping_validator(
+    error_message: ErrorMessage,
+    children: Mapping[str, Validator],
+    child_kind: str,
+    child_context: Callable[[str], str] | None = None,
+) -> Validator:
+    def validate(context: str, value: Any) -> None:
+        if not isinstance(value, Mapping):
+            error_msg = error_message(context, "must be mapping", value)
+            raise TypeError(error_msg)
+
+        nested_context = child_context(context) if child_context else context
+        for name, child_value in value.items():
+            child_validator = children.get(name)
+            if child_validator is None:
+                error_msg = error_message(
+                    context, f"provided with unexpected {child_kind} '{name}'"
+                )
+                raise KeyError(error_msg)
+            child_validator(nested_context, child_value)
+        return None  # All children validated
+
+    return validate
+
+
+def scalar_validator(
+    error_message: ErrorMessage, options: list | None, value_type: str
+) -> Validator:
+    # Argument types are str enums, their str() is the type name
+    expected_type, type_expectation = _TYPE_CHECKS.get(str(value_type), (None, ""))
+
+    def validate(context: str, value: Any) -> None:
+        if options and value not in options:
+            error_msg = error_message(context, f"must be one of {options}", value)
+            raise ValueError(error_msg)
+
+        if expected_type is not None and not isinstance(value, expected_type):
+            error_msg = error_message(context, type_expectation, value)
+            raise TypeError(error_msg)
+        return None
+
+    return validate
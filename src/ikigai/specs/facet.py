@@ -5,7 +5,7 @@
 from __future__ import annotations
 
 from collections import ChainMap
-from collections.abc import Generator, Mapping
+from collections.abc import Generator
 from itertools import chain
 from typing import Any, Literal, cast
 
@@ -20,6 +20,14 @@ from pydantic import (
 )
 
 from ikigai.client import datax
+from ikigai.specs._validators import (
+    CompiledValidatorModel,
+    Validator,
+    list_validator,
+    mapping_validator,
+    optional_validator,
+    scalar_validator,
+)
 from ikigai.typing import Helpful
 from ikigai.typing.pydantic_extensions import LowercaseStr
 from ikigai.utils import CustomFacetArgumentType, FacetArgumentType
@@ -34,7 +42,7 @@ class FacetRequirementSpec(BaseModel):
     min_parent_count: int
 
 
-class ArgumentSpec(BaseModel, Helpful):
+class ArgumentSpec(CompiledValidatorModel, Helpful):
     name: str
     argument_type: FacetArgumentType
     default_value: Any | None = None
@@ -62,72 +70,38 @@ class ArgumentSpec(BaseModel, Helpful):
 
         return f"Argument '{self.name}' for facet '{facet}' {expectation}{actuals_str}"
 
-    def validate_value(self, facet: str, value: Any) -> None:
-        if value is None:
-            if self.is_required:
-                error_msg = self.__validation_error_message(facet, "is required", value)
-                raise ValueError(error_msg)
-            return None  # No further validation for None values
-
-        # Value is not None, perform type checking
-        if self.is_list:
-            return self.__validate_list_value(facet, value)
-
+    @override
+    def _compile_validator(self) -> Validator:
+        error_message = self.__validation_error_message
         if self.argument_type == FacetArgumentType.MAP:
-            return self.__validate_dict_value(facet, value)
-
-        # Not a dict or list, so it must be a scalar value
-        return self.__validate_scalar_value(facet, value)
-
-    def __validate_list_value(self, facet: str, value: Any) -> None:
-        if not isinstance(value, list):
-            error_msg = self.__validation_error_message(facet, "must be list", value)
-            raise TypeError(error_msg)
-
-        scalar_argument_spec = self.model_copy(update={"is_list": False})
-        for item in value:
-            scalar_argument_spec.validate_value(facet, item)
-        return None  # All items validated
-
-    def __validate_dict_value(self, facet: str, value: Any) -> None:
-        if not isinstance(value, Mapping):
-            error_msg = self.__validation_error_message(facet, "must be mapping", value)
-            raise TypeError(error_msg)
-
-        for name, child_value in value.items():
-            if name not in self.children:
-                error_msg = self.__validation_error_message(
-                    facet, f"provided with unexpected child argument '{name}'"
-                )
-                raise KeyError(error_msg)
-            child_spec = self.children[name]
-            child_spec.validate_value(facet=f"{facet}:{self.name}", value=child_value)
-        return None  # All child arguments validated
-
-    def __validate_scalar_value(self, facet: str, value: Any) -> None:
-        # Basic type checking based on argument_type
-
-        if self.options and value not in self.options:
-            error_msg = self.__validation_error_message(
-                facet, f"must be one of {self.options}", value
+            name = self.name
+            value_validator = mapping_validator(
+                error_message,
+                children={
+                    child_name: child_spec._validator
+                    for child_name, child_spec in self.children.items()
+                },
+                child_kind="child argument",
+                child_context=lambda facet: f"{facet}:{name}",
+            )
+        else:
+            value_validator = scalar_validator(
+                error_message, options=self.options, value_type=self.argument_type
             )
-            raise ValueError(error_msg)
 
-        if self.argument_type == FacetArgumentType.BOOLEAN and not isinstance(
-            value, bool
-        ):
-            error_msg = self.__validation_error_message(facet, "must be boolean", value)
-            raise TypeError(error_msg)
-
-        if self.argument_type == FacetArgumentType.TEXT and not isinstance(value, str):
-            error_msg = self.__validation_error_message(facet, "must be string", value)
-            raise TypeError(error_msg)
-
-        if self.argument_type == FacetArgumentType.NUMBER and not isinstance(
-            value, int | float
-        ):
-            error_msg = self.__validation_error_message(facet, "must be numeric", value)
-            raise TypeError(error_msg)
+        item_validator = optional_validator(
+            error_message, is_required=self.is_required, validator=value_validator
+        )
+        if not self.is_list:
+            return item_validator
+        return optional_validator(
+            error_message,
+            is_required=self.is_required,
+            validator=list_validator(error_message, item_validator=item_validator),
+        )
+
+    def validate_value(self, facet: str, value: Any) -> None:
+        return self._validator(facet, value)
 
     @override
     def _help(self) -> Generator[str]:
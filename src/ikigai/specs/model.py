@@ -19,12 +19,17 @@ from pydantic import (
 )
 
 from ikigai.client import datax
+from ikigai.specs._validators import (
+    CompiledValidatorModel,
+    Validator,
+    list_validator,
+    mapping_validator,
+    optional_validator,
+    scalar_validator,
+)
 from ikigai.typing import Helpful
 from ikigai.typing.pydantic_extensions import LowercaseStr
-from ikigai.utils import (
-    ModelHyperparameterType,
-    ModelParameterType,
-)
+from ikigai.utils import ModelHyperparameterType
 from ikigai.utils.compatibility import Self, override
 from ikigai.utils.missing import MISSING, MissingType
 
@@ -63,7 +68,7 @@ class ModelMetricsSpec(RootModel, Helpful):
             yield f"  {metric}: {value}"
 
 
-class ModelParameterSpec(BaseModel, Helpful):
+class ModelParameterSpec(CompiledValidatorModel, Helpful):
     name: str
     default_value: Any | None = None
     have_options: bool
@@ -90,53 +95,26 @@ class ModelParameterSpec(BaseModel, Helpful):
 
         return f"Parameter '{self.name}' for {model} {expectation}{actuals_str}"
 
+    @override
+    def _compile_validator(self) -> Validator:
+        error_message = self.__validation_error_message
+        item_validator = optional_validator(
+            error_message,
+            is_required=self.is_required,
+            validator=scalar_validator(
+                error_message, options=self.options, value_type=self.parameter_type
+            ),
+        )
+        if not self.is_list:
+            return item_validator
+        return optional_validator(
+            error_message,
+            is_required=self.is_required,
+            validator=list_validator(error_message, item_validator=item_validator),
+        )
+
     def validate_value(self, model: str, value: Any) -> None:
-        if value is None:
-            if not self.is_required:
-                return None
-            error_msg = self.__validation_error_message(model, "is required", value)
-            raise ValueError(error_msg)
-
-        if self.is_list:
-            return self.__validate_list_value(model, value)
-
-        # Not a list or dict, so it must be a scalar value
-        return self.__validate_scalar_value(model, value)
-
-    def __validate_list_value(self, model: str, value: Any) -> None:
-        if not isinstance(value, list):
-            error_msg = self.__validation_error_message(model, "must be list", value)
-            raise TypeError(error_msg)
-
-        scalar_parameter_spec = self.model_copy(update={"is_list": False})
-        for item in value:
-            scalar_parameter_spec.validate_value(model, item)
-        return None  # All items validated
-
-    def __validate_scalar_value(self, model: str, value: Any) -> None:
-        if self.options and value not in self.options:
-            error_msg = self.__validation_error_message(
-                model, "must be one of {self.options}", value
-            )
-            raise ValueError(error_msg)
-
-        if self.parameter_type == ModelParameterType.BOOLEAN and not isinstance(
-            value, bool
-        ):
-            error_msg = self.__validation_error_message(model, "must be boolean", value)
-            raise TypeError(error_msg)
-
-        if self.parameter_type == ModelParameterType.TEXT and not isinstance(
-            value, str
-        ):
-            error_msg = self.__validation_error_message(model, "must be string", value)
-            raise TypeError(error_msg)
-
-        if self.parameter_type == ModelParameterType.NUMBER and not isinstance(
-            value, int | float
-        ):
-            error_msg = self.__validation_error_message(model, "must be numeric", value)
-            raise TypeError(error_msg)
+        return self._validator(model, value)
 
     @override
     def _help(self) -> Generator[str]:
@@ -155,7 +133,7 @@ class ModelParameterSpec(BaseModel, Helpful):
         yield f"{self.name}: {parameter_type}{parameter_value}"
 
 
-class ModelHyperparameterSpec(BaseModel, Helpful):
+class ModelHyperparameterSpec(CompiledValidatorModel, Helpful):
     name: str
     default_value: Any | None = None
     have_options: bool
@@ -209,73 +187,38 @@ class ModelHyperparameterSpec(BaseModel, Helpful):
 
         return f"Hyperparameter '{self.name}' for {model} {expectation}{actuals_str}"
 
-    def validate_value(self, model: str, value: Any) -> None:
-        if value is None:
-            if not self.is_required:
-                return None
-            error_msg = self.__validation_error_message(model, "is required", value)
-            raise ValueError(error_msg)
-
-        if self.is_list:
-            return self.__validate_list_value(model, value)
-
+    @override
+    def _compile_validator(self) -> Validator:
+        error_message = self.__validation_error_message
         if self.hyperparameter_type == ModelHyperparameterType.MAP:
-            return self.__validate_dict_value(model, value)
-
-        # Not a list or dict, so it must be a scalar value
-        return self.__validate_scalar_value(model, value)
-
-    def __validate_list_value(self, model: str, value: Any) -> None:
-        if not isinstance(value, list):
-            error_msg = self.__validation_error_message(model, "must be list", value)
-            raise TypeError(error_msg)
-
-        scalar_hyperparameter_spec = self.model_copy(update={"is_list": False})
-        for item in value:
-            scalar_hyperparameter_spec.validate_value(model, item)
-        return None  # All items validated
-
-    def __validate_dict_value(self, model: str, value: Any) -> None:
-        if not isinstance(value, Mapping):
-            error_msg = self.__validation_error_message(model, "must be mapping", value)
-            raise TypeError(error_msg)
-
-        for name, child_value in value.items():
-            if name not in self.children:
-                error_msg = self.__validation_error_message(
-                    model, f"provided with unexpected child hyperparameter '{name}'"
-                )
-                raise KeyError(error_msg)
-            child_spec = self.children[name]
-            child_spec.validate_value(model, child_value)
-        return None  # All child hyperparameters validated
-
-    def __validate_scalar_value(self, model: str, value: Any) -> None:
-        if self.options and value not in self.options:
-            error_msg = self.__validation_error_message(
-                model, f"must be one of {self.options}", value
+            value_validator = mapping_validator(
+                error_message,
+                children={
+                    child_name: child_spec._validator
+                    for child_name, child_spec in self.children.items()
+                },
+                child_kind="child hyperparameter",
             )
-            raise ValueError(error_msg)
-
-        if (
-            self.hyperparameter_type == ModelHyperparameterType.BOOLEAN
-            and not isinstance(value, bool)
-        ):
-            error_msg = self.__validation_error_message(model, "must be boolean", value)
-            raise TypeError(error_msg)
-
-        if self.hyperparameter_type == ModelHyperparameterType.TEXT and not isinstance(
-            value, str
-        ):
-            error_msg = self.__validation_error_message(model, "must be string", value)
-            raise TypeError(error_msg)
-
-        if (
-            self.hyperparameter_type == ModelHyperparameterType.NUMBER
-            and not isinstance(value, int | float)
-        ):
-            error_msg = self.__validation_error_message(model, "must be numeric", value)
-            raise TypeError(error_msg)
+        else:
+            value_validator = scalar_validator(
+                error_message,
+                options=self.options,
+                value_type=self.hyperparameter_type,
+            )
+
+        item_validator = optional_validator(
+            error_message, is_required=self.is_required, validator=value_validator
+        )
+        if not self.is_list:
+            return item_validator
+        return optional_validator(
+            error_message,
+            is_required=self.is_required,
+            validator=list_validator(error_message, item_validator=item_validator),
+        )
+
+    def validate_value(self, model: str, value: Any) -> None:
+        return self._validator(model, value)
 
     @override
     def _help(self) -> Generator[str]:
@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import abc
+from collections.abc import Iterator
 from typing import Generic, TypeVar
 
 from ikigai.typing.named_mapping import Named, NamedMapping
@@ -29,6 +30,25 @@ class ComponentBrowser(Generic[T], abc.ABC):
             A mapping of component names to components
         """
 
+    @abc.abstractmethod
+    def iter(self) -> Iterator[T]:
+        """
+        Iterate over as many components as possible
+
+        Components are yielded while the listing is received, so the first
+        ones are available before the whole listing is loaded.
+
+        Note
+        ----
+            The platform may truncate the list of components returned if it
+            exceeds a certain limit, a warning is logged when it does.
+
+        Yields
+        ------
+        T
+            The components, one at a time
+        """
+
     @abc.abstractmethod
     def __getitem__(self, name: str) -> T:
         """
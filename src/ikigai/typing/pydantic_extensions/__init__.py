@@ -2,6 +2,7 @@
 #
 # SPDX-License-Identifier: MIT
 
+from ikigai.typing.pydantic_extensions.lazy_model import LazyModel
 from ikigai.typing.pydantic_extensions.types import (
     CronStr,
     LowercaseStr,
@@ -12,6 +13,7 @@ from ikigai.typing.pydantic_extensions.types import (
 
 __all__: list[str] = [
     "CronStr",
+    "LazyModel",
     "LowercaseStr",
     "OptionalStr",
     "TimestampSerializableDatetime",
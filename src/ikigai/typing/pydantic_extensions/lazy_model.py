@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from pydantic import BaseModel, PrivateAttr
+
+from ikigai.utils.compatibility import Self, override
+
+logger = logging.getLogger("ikigai.typing")
+
+Loader = Callable[[], Mapping[str, Any]]
+
+
+class LazyModel(BaseModel):
+    """
+    Base model that can be created from a subset of its fields.
+
+    Models created with `_construct_partial` hold only the fields that are already
+    known, the remaining fields are fetched with the loader the first time any
+    of them is accessed, or when the model is dumped or compared.
+    """
+
+    __loader: Loader | None = PrivateAttr(default=None)
+
+    @classmethod
+    def _construct_partial(cls, data: Mapping[str, Any], loader: Loader) -> Self:
+        """
+        Create the model from known field values without validating them.
+
+        Parameters
+        ----------
+        data: Mapping[str, Any]
+            Known field values keyed by field name (not alias).
+
+        loader: Callable[[], Mapping[str, Any]]
+            Fetches the complete data for the model, it is called at most once.
+
+        Returns
+        -------
+        Self
+            The partially populated model.
+        """
+        self = cls.model_construct(**data)
+        if any(name not in self.__dict__ for name in cls.model_fields):
+            self.__loader = loader
+        return self
+
+    @property
+    def _is_loaded(self) -> bool:
+        return self.__loader is None
+
+    def _load(self) -> None:
+        loader = self.__loader
+        if loader is None:
+            return None
+        self.__loader = None
+
+        data = loader()
+        logger.debug("Loading remaining fields of a %s from %s", type(self), data)
+        loaded = type(self).model_validate(data)
+        for name in type(self).model_fields:
+            # Prefer the locally known values, they may be more recent
+            self.__dict__.setdefault(name, loaded.__dict__[name])
+        return None
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called when regular attribute lookup fails,
+        #   i.e. for private attributes and fields that are not loaded yet
+        private = object.__getattribute__(self, "__pydantic_private__")
+        if (
+            private
+            and private.get("_LazyModel__loader") is not None
+            and name in type(self).model_fields
+        ):
+            self._load()
+            return self.__dict__[name]
+        return super().__getattr__(name)  # type: ignore[misc]
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        # Compare all fields, not only the ones known so far
+        self._load()
+        if isinstance(other, LazyModel):
+            other._load()
+        return super().__eq__(other)
+
+    # Defining __eq__ drops the inherited __hash__, keep pydantic's behaviour
+    __hash__ = BaseModel.__hash__
+
+    @override
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:
+        self._load()
+        return super().model_dump(**kwargs)
+
+    @override
+    def model_dump_json(self, **kwargs: Any) -> str:
+        self._load()
+        return super().model_dump_json(**kwargs)
@@ -4,6 +4,7 @@
 
 from ikigai.utils.enums import (
     AppAccessLevel,
+    BaseUrlValidation,
     CustomFacetAccessLevel,
     CustomFacetArgumentType,
     DatasetDataType,
@@ -13,10 +14,12 @@ from ikigai.utils.enums import (
     FlowStatus,
     ModelHyperparameterType,
     ModelParameterType,
+    RequestCompression,
 )
 
 __all__: list[str] = [
     "AppAccessLevel",
+    "BaseUrlValidation",
     "CustomFacetAccessLevel",
     "CustomFacetArgumentType",
     "DatasetDataType",
@@ -26,4 +29,5 @@ __all__: list[str] = [
     "FlowStatus",
     "ModelHyperparameterType",
     "ModelParameterType",
+    "RequestCompression",
 ]
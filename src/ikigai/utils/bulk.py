@@ -0,0 +1,266 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Generic, TypeVar, overload
+
+logger = logging.getLogger("ikigai.utils.bulk")
+
+T = TypeVar("T")
+
+
+class RateLimiter:
+    """
+    Token bucket limiting how frequently operations may start.
+
+    Parameters
+    ----------
+    rate: float
+        Number of operations allowed to start per second.
+
+    burst: int
+        Number of operations that may start back-to-back before the rate applies.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0:
+            error_msg = f"Rate must be positive, got {rate}"
+            raise ValueError(error_msg)
+        if burst < 1:
+            error_msg = f"Burst must be at least 1, got {burst}"
+            raise ValueError(error_msg)
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Block until an operation is allowed to start.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._burst, self._tokens + (now - self._updated_at) * self._rate
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return None
+                wait_time = (1 - self._tokens) / self._rate
+            time.sleep(wait_time)
+
+
+@dataclass(frozen=True)
+class BulkResult(Generic[T]):
+    """
+    Outcome of a single operation executed by a `BulkExecutor`.
+    """
+
+    index: int
+    """Position of the operation in submission order."""
+    value: T | None = None
+    """Value returned by the operation, None if it failed."""
+    error: BaseException | None = None
+    """Exception raised by the operation, None if it succeeded."""
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class BulkResults(Sequence[BulkResult[T]]):
+    """
+    Results of a bulk run in submission order.
+    """
+
+    def __init__(self, results: Iterable[BulkResult[T]]) -> None:
+        self._results = sorted(results, key=lambda result: result.index)
+
+    @overload
+    def __getitem__(self, index: int) -> BulkResult[T]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[BulkResult[T]]: ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> BulkResult[T] | Sequence[BulkResult[T]]:
+        return self._results[index]
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __iter__(self) -> Iterator[BulkResult[T]]:
+        return iter(self._results)
+
+    def __repr__(self) -> str:
+        return (
+            f"BulkResults(succeeded={len(self.succeeded)}, failed={len(self.failed)})"
+        )
+
+    @property
+    def succeeded(self) -> list[BulkResult[T]]:
+        return [result for result in self._results if result.ok]
+
+    @property
+    def failed(self) -> list[BulkResult[T]]:
+        return [result for result in self._results if not result.ok]
+
+    def values(self) -> list[T | None]:
+        """
+        Values returned by the operations, None for operations that failed.
+
+        Returns
+        -------
+        list[T | None]
+            Returned values in submission order.
+        """
+        return [result.value for result in self._results]
+
+    def raise_on_error(self) -> None:
+        """
+        Raise if any of the operations failed.
+
+        Raises
+        ------
+        RuntimeError
+            If at least one operation failed, chained from the first failure.
+        """
+        failed = self.failed
+        if not failed:
+            return None
+        error_msg = (
+            f"{len(failed)} of {len(self)} operations failed, "
+            f"failed operations: {[result.index for result in failed]}"
+        )
+        raise RuntimeError(error_msg) from failed[0].error
+
+
+class BulkExecutor:
+    """
+    Execute many independent operations on a bounded thread pool.
+
+    Operations are queued with `submit` (or `map`) and executed by `run`,
+    which waits for all of them to finish. A failing operation does not stop
+    the others, its exception is captured in the corresponding `BulkResult`.
+
+    Parameters
+    ----------
+    max_workers: int
+        Maximum number of operations running at the same time.
+
+    rate_limit: float | None
+        Maximum number of operations started per second, None for no limit.
+
+    Examples
+    --------
+    Delete all datasets of an app, at most 8 at a time
+
+    >>> bulk = app.bulk(max_workers=8)
+    >>> for dataset in app.datasets().values():
+    ...     bulk.submit(dataset.delete)
+    >>> results = bulk.run()
+    >>> results.failed
+    []
+    """
+
+    def __init__(self, max_workers: int = 8, rate_limit: float | None = None) -> None:
+        if max_workers < 1:
+            error_msg = f"max_workers must be at least 1, got {max_workers}"
+            raise ValueError(error_msg)
+        self._max_workers = max_workers
+        self._rate_limiter = (
+            RateLimiter(rate=rate_limit) if rate_limit is not None else None
+        )
+        self._operations: list[Callable[[], Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> int:
+        """
+        Queue an operation to be executed by `run`.
+
+        Parameters
+        ----------
+        fn: Callable
+            Operation to execute.
+
+        *args, **kwargs
+            Arguments the operation is called with.
+
+        Returns
+        -------
+        int
+            Index of the operation's result in the results of `run`.
+        """
+        self._operations.append(partial(fn, *args, **kwargs))
+        return len(self._operations) - 1
+
+    def map(self, fn: Callable[[T], Any], items: Iterable[T]) -> list[int]:
+        """
+        Queue `fn(item)` for every item.
+
+        Parameters
+        ----------
+        fn: Callable
+            Operation to execute for each item.
+
+        items: Iterable
+            Items the operation is called with.
+
+        Returns
+        -------
+        list[int]
+            Indices of the operations' results in the results of `run`.
+        """
+        return [self.submit(fn, item) for item in items]
+
+    def run(self) -> BulkResults[Any]:
+        """
+        Execute all queued operations and wait for them to finish.
+
+        Returns
+        -------
+        BulkResults
+            Per-operation results in submission order.
+        """
+        operations, self._operations = self._operations, []
+        if not operations:
+            return BulkResults([])
+
+        # Operations run in the caller's context, e.g. within its tracing span
+        contexts = [contextvars.copy_context() for _ in operations]
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(operations)),
+            thread_name_prefix="ikigai-bulk",
+        ) as executor:
+            results = executor.map(
+                self.__execute, range(len(operations)), operations, contexts
+            )
+            return BulkResults(list(results))
+
+    def __execute(
+        self, index: int, operation: Callable[[], T], context: contextvars.Context
+    ) -> BulkResult[T]:
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+        try:
+            value = context.run(operation)
+        except Exception as error:
+            logger.debug("Bulk operation %d failed: %r", index, error)
+            return BulkResult(index=index, error=error)
+        return BulkResult(index=index, value=value)
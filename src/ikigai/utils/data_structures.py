@@ -2,7 +2,7 @@
 #
 # SPDX-License-Identifier: MIT
 
-
+from collections.abc import Mapping
 from typing import Any
 
 from ikigai.utils.missing import MISSING
@@ -76,3 +76,93 @@ def merge_dicts(obj_1: dict, obj_2: dict, *, sentinel: Any = MISSING) -> dict:
             )
         return result
     return obj_2
+
+
+def merge_dicts_in_place(
+    target: dict, source: Mapping, *, sentinel: Any = MISSING
+) -> dict:
+    """
+    Merge source into target recursively, updating target in place.
+
+    Same merge rules as `merge_dicts`, but only the merged-in values are
+    visited, so repeatedly merging small updates into a large dictionary stays
+    linear in the size of the updates. Nested dictionaries taken from source are
+    copied, so later merges never modify the caller's objects.
+
+    Parameters
+    ----------
+
+    target : dict
+        The dictionary to merge into, it is modified in place.
+
+    source : Mapping
+        The dictionary to merge (takes precedence in conflicts).
+
+    sentinel: Any
+        Sentinel value, when present in source will remove
+        the corresponding key from target.
+
+    Returns
+    -------
+
+    dict
+        The updated target dictionary.
+
+    Examples
+    --------
+
+    >>> arguments = {'a': {'b': 1}}
+    >>> merge_dicts_in_place(arguments, {'a': {'c': 2}})
+    {'a': {'b': 1, 'c': 2}}
+    >>> arguments
+    {'a': {'b': 1, 'c': 2}}
+    """
+    use_sentinel = sentinel is not MISSING
+    for k, v in source.items():
+        if use_sentinel and v is sentinel:
+            target.pop(k, None)
+            continue
+
+        if isinstance(v, dict):
+            existing = target.get(k)
+            if not isinstance(existing, dict):
+                existing = target[k] = {}
+            merge_dicts_in_place(existing, v, sentinel=sentinel)
+            continue
+        target[k] = v
+    return target
+
+
+def copy_containers(obj: Any) -> Any:
+    """
+    Copy the dictionaries and lists nested in an object recursively.
+
+    Other values (e.g. strings, numbers or models) are shared with the copy,
+    so this is cheaper than `copy.deepcopy` for decoded JSON like structures.
+
+    Parameters
+    ----------
+
+    obj : Any
+        The object to copy.
+
+    Returns
+    -------
+
+    Any
+        The copy, sharing no dictionary or list with obj.
+
+    Examples
+    --------
+
+    >>> arguments = {'a': {'b': [1, 2]}}
+    >>> copied = copy_containers(arguments)
+    >>> copied['a']['b'].append(3)
+    >>> arguments
+    {'a': {'b': [1, 2]}}
+    """
+    if isinstance(obj, dict):
+        return {k: copy_containers(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [copy_containers(v) for v in obj]
+    return obj
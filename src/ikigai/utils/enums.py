@@ -17,6 +17,25 @@ class AppAccessLevel(StrEnum):
     VIEWER = "VIEWER"
 
 
+# -------------------------------------------------------------------------------------
+# Client Related Enums
+
+
+class BaseUrlValidation(StrEnum):
+    EAGER = "eager"
+    """Validate the base URL when the client is created."""
+    LAZY = "lazy"
+    """Validate the base URL before the first request is sent."""
+    BACKGROUND = "background"
+    """Validate the base URL in a background thread, requests wait for it."""
+
+
+class RequestCompression(StrEnum):
+    GZIP = "gzip"
+    BROTLI = "br"
+    """Requires the brotli package."""
+
+
 # -------------------------------------------------------------------------------------
 # Custom Facet Related Enums
 
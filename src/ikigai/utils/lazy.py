@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, tuple[str, ...]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Create the module `__getattr__` and `__dir__` of a package whose exports
+    are imported on first access.
+
+    Parameters
+    ----------
+
+    package: str
+        Name of the package, i.e. `__name__` of its `__init__` module.
+
+    exports: Mapping[str, tuple[str, ...]]
+        Names exported by the package, keyed by the module defining them.
+
+    Returns
+    -------
+
+    tuple[Callable[[str], Any], Callable[[], list[str]]]
+        The `__getattr__` and `__dir__` functions of the package.
+    """
+    modules = {name: module for module, names in exports.items() for name in names}
+
+    def getattr_(name: str) -> Any:
+        module = modules.get(name)
+        if module is None:
+            error_msg = f"module {package!r} has no attribute {name!r}"
+            raise AttributeError(error_msg)
+
+        value = getattr(importlib.import_module(module), name)
+        # Cache on the package, later accesses do not go through __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def dir_() -> list[str]:
+        return sorted({*vars(sys.modules[package]), *modules})
+
+    return getattr_, dir_
@@ -91,6 +91,32 @@ def test_app_directory(
     assert fetched_app_directory.directory_id == app_directory.directory_id
 
 
+def test_app_bulk_operations(ikigai: Ikigai, app_name: str, cleanup: ExitStack) -> None:
+    app = ikigai.app.new(name=app_name).description("A test app").build()
+    cleanup.callback(app.delete)
+
+    num_flows = 5
+    bulk = app.bulk(max_workers=4, rate_limit=10)
+    for idx in range(num_flows):
+        bulk.submit(app.flow.new(name=f"flow-{idx}").build)
+    failing_idx = bulk.submit(app.flows.__getitem__, f"missing-{app_name}")
+    results = bulk.run()
+
+    assert len(results) == num_flows + 1
+    assert len(results.succeeded) == num_flows
+    assert [result.index for result in results.failed] == [failing_idx]
+    with pytest.raises(RuntimeError):
+        results.raise_on_error()
+
+    flows = app.flows()
+    assert len(flows) == num_flows
+
+    bulk.map(lambda flow: flow.delete(), flows.values())
+    delete_results = bulk.run()
+    delete_results.raise_on_error()
+    assert len(app.flows()) == 0
+
+
 def test_app_browser_1(ikigai: Ikigai, app_name: str, cleanup: ExitStack) -> None:
     app = ikigai.app.new(name=app_name).description("Get by name").build()
     cleanup.callback(app.delete)
@@ -3,14 +3,25 @@
 # SPDX-License-Identifier: MIT
 
 
+import time
 from contextlib import ExitStack
 from datetime import datetime, timedelta
+from functools import partial
+from typing import Any
 
 import pandas as pd
 import pytest
 
 from ikigai import FlowStatus, Ikigai
-from ikigai.components import Schedule
+from ikigai.components import Flow, Schedule
+from tests.standin import (
+    StandInPlatform,
+    StandInRequest,
+    StandInResponse,
+    StandInServer,
+)
+
+NUM_OLD_LOGS = 12
 
 
 def test_flow_creation(
@@ -43,6 +54,41 @@ def test_flow_creation(
     assert flow.flow_id not in flows_after_deletion
 
 
+def test_flow_lazy_creation(
+    ikigai: Ikigai,
+    app_name: str,
+    flow_name: str,
+    cleanup: ExitStack,
+) -> None:
+    app = ikigai.app.new(name=app_name).description("A test app").build()
+    cleanup.callback(app.delete)
+
+    flow = app.flow.new(name=flow_name).build(lazy=True)
+    assert flow.name == flow_name
+    assert flow.schedule is None
+
+    flow_after_creation = app.flows().get_id(flow.flow_id)
+    assert flow.created_at == flow_after_creation.created_at
+    assert flow.to_dict() == flow_after_creation.to_dict()
+
+
+def test_flow_lazy_loading(
+    standin: StandInServer, standin_ikigai: partial[Ikigai]
+) -> None:
+    app = standin_ikigai().app.new("lazy-app").build()
+
+    flow = app.flow.new("lazy-flow").build(lazy=True)
+    assert flow.name == "lazy-flow"
+    assert standin.requests_to("/component/get-pipeline") == []
+
+    # The missing fields are fetched once, on first access
+    assert flow.created_at == flow.modified_at
+    assert len(standin.requests_to("/component/get-pipeline")) == 1
+
+    other_flow = app.flow.new("other-lazy-flow").build(lazy=True)
+    assert other_flow == app.flows["other-lazy-flow"]
+
+
 def test_flow_renaming(
     ikigai: Ikigai,
     app_name: str,
@@ -62,6 +108,37 @@ def test_flow_renaming(
     assert flow_after_edit.name == f"updated {flow_name}"
 
 
+def test_flow_batched_edit(
+    ikigai: Ikigai,
+    app_name: str,
+    flow_name: str,
+    cleanup: ExitStack,
+) -> None:
+    app = ikigai.app.new(name=app_name).description("A test app").build()
+    cleanup.callback(app.delete)
+
+    flow = app.flow.new(name=flow_name).build()
+
+    with flow.edit() as edit:
+        edit.rename(f"updated {flow_name}")
+        edit.update_high_volume_preference(optimize=True)
+    assert flow.name == f"updated {flow_name}"
+
+    flow_after_edit = app.flows().get_id(flow.flow_id)
+    assert flow_after_edit.name == f"updated {flow_name}"
+    assert flow_after_edit.describe()["high_volume_preference"]
+
+    def abort_edit() -> None:
+        with flow.edit() as edit:
+            edit.rename(f"discarded {flow_name}")
+            error_msg = "Abort edit"
+            raise RuntimeError(error_msg)
+
+    with pytest.raises(RuntimeError):
+        abort_edit()
+    assert app.flows().get_id(flow.flow_id).name == f"updated {flow_name}"
+
+
 def test_flow_definition_update(
     ikigai: Ikigai,
     app_name: str,
@@ -118,6 +195,176 @@ def test_flow_definition_update(
     assert success_log.status == FlowStatus.SUCCESS, success_log.data
 
 
+def test_flow_definition_diff(
+    ikigai: Ikigai,
+    app_name: str,
+    dataset_name: str,
+    df1: pd.DataFrame,
+    flow_name: str,
+    cleanup: ExitStack,
+) -> None:
+    app = ikigai.app.new(name=app_name).description("A test app").build()
+    cleanup.callback(app.delete)
+
+    dataset = app.dataset.new(name=dataset_name).df(df1).build()
+
+    facet_types = ikigai.facet_types
+    input_facet = ikigai.builder.facet(
+        facet_type=facet_types.INPUT.IMPORTED, name=dataset.name
+    ).arguments(
+        dataset_id=dataset.dataset_id,
+        file_type="csv",
+        header=True,
+        use_raw_file=False,
+    )
+    initial_flow_definition = input_facet.build()
+
+    flow = app.flow.new(name=flow_name).definition(initial_flow_definition).build()
+    assert not flow.diff_definition(initial_flow_definition)
+
+    updated_flow_definition = (
+        input_facet.facet(facet_type=facet_types.OUTPUT.EXPORTED, name="output")
+        .arguments(
+            dataset_name=f"output-{flow_name}",
+            file_type="csv",
+            header=True,
+        )
+        .build()
+    )
+    assert updated_flow_definition.content_hash() != (
+        initial_flow_definition.content_hash()
+    )
+
+    diff = flow.diff_definition(updated_flow_definition)
+    assert diff.added_facets == [updated_flow_definition.facets[1].facet_id]
+    assert len(diff.added_arrows) == 1
+    assert not diff.removed_facets
+
+    flow.update_definition(updated_flow_definition)
+    assert not flow.diff_definition(updated_flow_definition)
+
+
+def test_flow_run_many(
+    ikigai: Ikigai,
+    app_name: str,
+    dataset_name: str,
+    df1: pd.DataFrame,
+    flow_name: str,
+    cleanup: ExitStack,
+) -> None:
+    app = ikigai.app.new(name=app_name).description("A test app").build()
+    cleanup.callback(app.delete)
+
+    dataset = app.dataset.new(name=dataset_name).df(df1).build()
+
+    facet_types = ikigai.facet_types
+    flow_definition = (
+        ikigai.builder.facet(facet_type=facet_types.INPUT.IMPORTED, name=dataset.name)
+        .arguments(
+            dataset_id=dataset.dataset_id,
+            file_type="csv",
+            header=True,
+            use_raw_file=False,
+        )
+        .facet(facet_type=facet_types.OUTPUT.EXPORTED, name="output")
+        .arguments(
+            dataset_name=f"output-{flow_name}",
+            file_type="csv",
+            header=True,
+        )
+        .variables(output_name="dataset_name")
+        .build()
+    )
+    flow = app.flow.new(name=flow_name).definition(flow_definition).build()
+
+    variable_sets = [{"output_name": f"output-{idx}-{flow_name}"} for idx in range(2)]
+    results = flow.run_many(variable_sets)
+
+    assert len(results) == len(variable_sets)
+    assert list(results["variables"]) == variable_sets
+    assert (results["status"] == FlowStatus.SUCCESS).all(), results["data"]
+    assert results["log_id"].is_unique
+    assert (results["finished_at"] >= results["submitted_at"]).all()
+
+
+def _standin_flow_logs(
+    standin: StandInServer,
+    flow: Flow,
+    *,
+    create_logs: bool = True,
+    external_runs: bool = False,
+) -> list[dict[str, Any]]:
+    # Logs are listed newest first, each run adds its log when submitted
+    logs: list[dict[str, Any]] = []
+
+    def log(timestamp: float) -> dict[str, Any]:
+        return {
+            "log_id": f"log-{len(logs):03d}",
+            "status": "SUCCESS",
+            "user": "user@example.com",
+            "erroneous_facet_id": "",
+            "message": "",
+            "timestamp": str(int(timestamp)),
+        }
+
+    def run_flow(_: StandInRequest) -> StandInResponse:
+        if external_runs:
+            # A run started elsewhere, finished before this submission
+            logs.insert(0, log(time.time() - 10))
+        if create_logs:
+            logs.insert(0, log(time.time()))
+        return StandInResponse(body={"pipeline_id": flow.flow_id})
+
+    def get_flow_log(request: StandInRequest) -> StandInResponse:
+        return StandInResponse(
+            body={"pipeline_log": logs[: int(request.params["limit"])]}
+        )
+
+    for idx in range(NUM_OLD_LOGS):
+        logs.insert(0, log(time.time() - 3600 + idx))
+    standin.route("POST", "/component/run-pipeline", run_flow)
+    standin.route("GET", "/component/get-pipeline-log", get_flow_log)
+    return logs
+
+
+def test_flow_run_many_ignores_old_logs(
+    standin: StandInServer, standin_ikigai: partial[Ikigai]
+) -> None:
+    flow = standin_ikigai().app.new("sweep-app").build().flow.new("sweep").build()
+    logs = _standin_flow_logs(standin, flow)
+
+    variable_sets = [{"region": region} for region in ("north", "south", "east")]
+    results = flow.run_many(variable_sets, max_concurrency=2)
+
+    # Only the logs of the new runs are matched, in submission order
+    assert list(results["log_id"]) == [log["log_id"] for log in logs[2::-1]]
+    assert (results["finished_at"] >= results["submitted_at"].dt.floor("s")).all()
+
+
+def test_flow_run_many_skips_earlier_logs(
+    standin: StandInServer, standin_ikigai: partial[Ikigai]
+) -> None:
+    flow = standin_ikigai().app.new("sweep-app").build().flow.new("sweep").build()
+    logs = _standin_flow_logs(standin, flow, external_runs=True)
+
+    results = flow.run_many([{"region": "north"}, {"region": "south"}])
+
+    # Logs created before a run was submitted are not its results
+    assert list(results["log_id"]) == [logs[2]["log_id"], logs[0]["log_id"]]
+
+
+def test_flow_run_many_timeout(
+    standin: StandInServer, standin_ikigai: partial[Ikigai]
+) -> None:
+    flow = standin_ikigai().app.new("sweep-app").build().flow.new("sweep").build()
+    _standin_flow_logs(standin, flow, create_logs=False)
+
+    results = flow.run_many([{"region": "north"}], timeout=0.5)
+
+    assert results["log_id"].isna().all()
+    assert results["error"].str.startswith("No run log within").all()
+
+
 def test_flow_status(
     ikigai: Ikigai,
     app_name: str,
@@ -135,6 +382,27 @@ def test_flow_status(
     assert not status_report.message
 
 
+def test_flow_log_cursor(
+    ikigai: Ikigai,
+    app_name: str,
+    flow_name: str,
+    cleanup: ExitStack,
+) -> None:
+    app = ikigai.app.new(name=app_name).description("A test app").build()
+    cleanup.callback(app.delete)
+
+    flow = app.flow.new(name=flow_name).build()
+    log_cursor = flow.log_cursor()
+    assert log_cursor.fetch() == []
+
+    run_log = flow.run()
+    assert log_cursor.fetch() == [run_log]
+    assert log_cursor.fetch() == []
+
+    second_run_log = flow.run()
+    assert log_cursor.fetch() == [second_run_log]
+
+
 def test_flow_clone(
     ikigai: Ikigai,
     app_name: str,
@@ -604,6 +872,120 @@ def test_flow_schedule_update_3(
     assert schedule.end_time == new_schedule.end_time, schedule.end_time
 
 
+class _FakeClock:
+    # Stands in for the time module in ikigai.components.flow, sleeps advance
+    #   the clock instantly
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _standin_scheduled_flow(
+    standin: StandInServer,
+    standin_platform: StandInPlatform,
+    standin_ikigai: partial[Ikigai],
+    *,
+    scheduled_polls: int,
+) -> Flow:
+    app = standin_ikigai().app.new("scheduled-app").build()
+    flow = app.flow.new("scheduled-flow").schedule("0 0 * * *").build()
+    schedule = standin_platform.flows[flow.flow_id]["schedule"]
+    polls: list[StandInRequest] = []
+
+    def get_flow(request: StandInRequest) -> StandInResponse:
+        # The platform reports the removed schedule for a while
+        polls.append(request)
+        pipeline = dict(standin_platform.flows[request.params["pipeline_id"]])
+        pipeline.pop("schedule", None)
+        if len(polls) <= scheduled_polls:
+            pipeline["schedule"] = schedule
+        return StandInResponse(body={"pipeline": pipeline})
+
+    standin.route("GET", "/component/get-pipeline", get_flow)
+    return flow
+
+
+def test_flow_schedule_removal_polling(
+    standin: StandInServer,
+    standin_platform: StandInPlatform,
+    standin_ikigai: partial[Ikigai],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    flow = _standin_scheduled_flow(
+        standin, standin_platform, standin_ikigai, scheduled_polls=5
+    )
+    clock = _FakeClock()
+    monkeypatch.setattr("ikigai.components.flow.time", clock)
+    num_requests = len(standin.requests_to("/component/get-pipeline"))
+
+    flow.update_schedule(None)
+
+    assert flow.schedule is None
+    # Polled until the removal is observed, backing off up to the max interval
+    assert clock.sleeps == [1.0, 2.0, 4.0, 8.0, 10.0]
+    polls = standin.requests_to("/component/get-pipeline")[num_requests:]
+    assert len(polls) == len(clock.sleeps) + 1
+
+
+def test_flow_schedule_removal_timeout(
+    standin: StandInServer,
+    standin_platform: StandInPlatform,
+    standin_ikigai: partial[Ikigai],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    flow = _standin_scheduled_flow(
+        standin, standin_platform, standin_ikigai, scheduled_polls=1000
+    )
+    schedule = flow.schedule
+    clock = _FakeClock()
+    monkeypatch.setattr("ikigai.components.flow.time", clock)
+
+    with pytest.raises(TimeoutError, match="Could not verify schedule removal"):
+        flow.update_schedule(None)
+
+    # The flow keeps the schedule the platform still reports
+    assert flow.schedule == schedule
+    assert sum(clock.sleeps) == pytest.approx(120.0)
+
+
+def test_flow_schedule_removal(
+    ikigai: Ikigai,
+    app_name: str,
+    flow_name: str,
+    cleanup: ExitStack,
+) -> None:
+    """
+    Test to remove the schedules of scheduled flows concurrently.
+    """
+    app = (
+        ikigai.app.new(name=app_name)
+        .description("Test to remove the schedules of scheduled flows")
+        .build()
+    )
+    cleanup.callback(app.delete)
+
+    num_flows = 3
+    flows = [
+        app.flow.new(name=f"{flow_name}-{idx}").schedule("0 0 * * *").build()
+        for idx in range(num_flows)
+    ]
+
+    bulk = app.bulk(max_workers=num_flows)
+    bulk.map(lambda flow: flow.update_schedule(None), flows)
+    bulk.run().raise_on_error()
+
+    for flow in flows:
+        assert flow.schedule is None
+        assert app.flows().get_id(flow.flow_id).schedule is None
+
+
 def test_flow_schedule_build_3(
     ikigai: Ikigai,
     app_name: str,
@@ -4,11 +4,40 @@
 
 
 from contextlib import ExitStack
+from copy import deepcopy
 
 import pandas as pd
 import pytest
 
 from ikigai import FlowStatus, Ikigai
+from ikigai.components import FlowDefinitionBuilder
+from ikigai.components.flow_definition import (
+    Facet,
+    FlowDefinition,
+    FlowVariable,
+    diff_flow_definitions,
+)
+from ikigai.specs import FacetType, SubModelSpec
+
+
+def _spec_flags(**flags: bool) -> dict[str, bool]:
+    return {
+        "is_deprecated": False,
+        "is_hidden": False,
+        "is_list": False,
+        "is_required": False,
+        **flags,
+    }
+
+
+def _argument_spec(name: str, argument_type: str = "TEXT") -> dict:
+    return {
+        "name": name,
+        "argument_type": argument_type,
+        "children": {},
+        "have_sub_arguments": False,
+        **_spec_flags(),
+    }
 
 
 def test_flow_definition_builder_facet_types(
@@ -313,3 +342,120 @@ def test_flow_definition_variables_check_3(
         builder.facet(facet_type=facet_types.INPUT.IMPORTED, name="input").variables(
             dataset="bad_arg_name",
         )
+
+
+def test_flow_definition_builder_reuse() -> None:
+    facet_type = FacetType.model_validate(
+        {
+            "facet_info": {
+                "facet_uid": "M_000",
+                "chain_group": "MID",
+                "facet_group": "MACHINE_LEARNING",
+                "facet_type": "PREDICT",
+            },
+            "is_deprecated": False,
+            "is_hidden": False,
+            "facet_requirement": {
+                "max_child_count": 1,
+                "min_child_count": 1,
+                "max_parent_count": 1,
+                "min_parent_count": 1,
+            },
+            "facet_arguments": [
+                _argument_spec("model_name"),
+                _argument_spec("hyperparameters", "MAP"),
+            ],
+            "in_arrow_arguments": [],
+            "out_arrow_arguments": [],
+        }
+    )
+    model_type = SubModelSpec.model_validate(
+        {
+            "name": "ridge",
+            "model_type": "linear",
+            "is_deprecated": False,
+            "is_hidden": False,
+            "keywords": [],
+            "metrics": {},
+            "parameters": {},
+            "hyperparameters": {
+                "alpha": {
+                    "name": "alpha",
+                    "default_value": None,
+                    "have_options": False,
+                    "have_sub_hyperparameters": False,
+                    "hyperparameter_group": None,
+                    "hyperparameter_type": "NUMBER",
+                    "children": {},
+                    "options": None,
+                    "sub_hyperparameter_requirements": [],
+                    **_spec_flags(),
+                }
+            },
+        }
+    )
+
+    facet = (
+        FlowDefinitionBuilder()
+        .model_facet(facet_type, model_type, args={"model_name": "churn"})
+        .hyperparameters(alpha=1)
+    )
+    flow_definition = facet.build()
+    facet.hyperparameters(alpha=2)
+
+    # The built definition does not share its arguments with the builder
+    assert flow_definition.facets[0].arguments == {
+        "model_name": "churn",
+        "hyperparameters": {"alpha": 1},
+    }
+
+
+def test_flow_definition_diff_variables() -> None:
+    flow_definition = FlowDefinition(
+        facets=[
+            Facet(
+                facet_id="0",
+                facet_uid="O_000",
+                name="output",
+                arguments={"dataset_name": "sales"},
+            )
+        ],
+        variables={
+            "output_name": FlowVariable(
+                facet_name="output", argument_name="dataset_name"
+            )
+        },
+    )
+    # Variables as returned by the platform, with the targeted argument's details
+    platform_definition = flow_definition.to_dict()
+    platform_definition["variables"] = {
+        "output_name": {
+            "name": "dataset_name",
+            "value": "sales",
+            "facet_name": "output",
+            "type": "TEXT",
+            "is_list": False,
+        }
+    }
+
+    assert not diff_flow_definitions(
+        old=platform_definition, new=flow_definition.to_dict()
+    )
+
+    renamed = flow_definition.model_copy(
+        update={
+            "variables": {
+                "dataset": FlowVariable(
+                    facet_name="output", argument_name="dataset_name"
+                )
+            }
+        }
+    )
+    diff = diff_flow_definitions(old=platform_definition, new=renamed.to_dict())
+    assert diff.variables_changed
+
+    # Details given on both sides are compared, e.g. the variable's value
+    updated_definition = deepcopy(platform_definition)
+    updated_definition["variables"]["output_name"]["value"] = "returns"
+    diff = diff_flow_definitions(old=platform_definition, new=updated_definition)
+    assert diff.variables_changed
@@ -0,0 +1,134 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+from collections.abc import Iterator
+
+import pytest
+from pydantic import HttpUrl
+
+from ikigai import FlowStatus
+from ikigai.client import Client
+from ikigai.client.sse import ServerSentEvent, iter_events
+from ikigai.components import Flow
+from tests.standin import StandInRequest, StandInResponse, StandInServer
+
+
+@pytest.fixture()
+def standin_flow(standin_base_url: HttpUrl) -> Flow:
+    client = Client(
+        user_email="user@example.com",
+        api_key="api-key",
+        base_url=standin_base_url,
+        ssl=False,
+    )
+    return Flow.from_dict(
+        data={
+            "project_id": "app-id",
+            "pipeline_id": "flow-id",
+            "name": "flow",
+            "created_at": "1700000000",
+            "modified_at": "1700000000",
+        },
+        client=client,
+    )
+
+
+def _polled_statuses(statuses: list[dict]) -> Iterator[StandInResponse]:
+    for status in statuses:
+        yield StandInResponse(body=status)
+    while True:
+        yield StandInResponse(body={"status": False, "progress": {"message": ""}})
+
+
+def test_sse_event_parsing() -> None:
+    lines = [
+        ": keep-alive",
+        "event: status",
+        "id: 1",
+        "data: {",
+        'data: "status": "RUNNING"}',
+        "",
+        "data:no space",
+        "retry: 100",
+        "",
+        "event: empty",
+        "",
+    ]
+    events = list(iter_events(lines))
+    assert events == [
+        ServerSentEvent(event="status", data='{\n"status": "RUNNING"}', id="1"),
+        ServerSentEvent(event="message", data="no space", id="1", retry=100),
+    ]
+
+
+def test_flow_status_pushed(standin: StandInServer, standin_flow: Flow) -> None:
+    def stream(request: StandInRequest) -> StandInResponse:
+        assert request.params == {"project_id": "app-id", "pipeline_id": "flow-id"}
+        assert request.headers["Accept"] == "text/event-stream"
+        return StandInResponse(
+            events=[
+                ("status", {"status": "SCHEDULED"}),
+                ("ping", ""),
+                ("status", {"status": "RUNNING", "progress": 10}),
+                ("status", {"status": "RUNNING", "progress": 10}),
+                ("status", {"status": "RUNNING", "progress": 60}),
+                ("status", {"status": "SUCCESS", "message": "done"}),
+            ]
+        )
+
+    standin.route("GET", "/component/stream-pipeline-status", stream)
+
+    status_reports = list(standin_flow.watch_status(timeout=5))
+    assert [(report.status, report.progress) for report in status_reports] == [
+        (FlowStatus.SCHEDULED, None),
+        (FlowStatus.RUNNING, 10),
+        (FlowStatus.RUNNING, 60),
+        (FlowStatus.SUCCESS, None),
+    ]
+    assert status_reports[-1].message == "done"
+    assert not standin.requests_to("/component/is-pipeline-running")
+
+
+def test_flow_status_polling_fallback(
+    standin: StandInServer, standin_flow: Flow
+) -> None:
+    # No stream endpoint is registered, the stand-in answers it with 404
+    running = {
+        "status": True,
+        "progress": {"status": "RUNNING", "progress": 50, "message": ""},
+    }
+    for _ in range(2):
+        responses = _polled_statuses([running])
+        standin.route(
+            "GET", "/component/is-pipeline-running", lambda _: next(responses)
+        )
+
+        status_reports = list(standin_flow.watch_status(timeout=5))
+        assert [report.status for report in status_reports] == [
+            FlowStatus.RUNNING,
+            FlowStatus.IDLE,
+        ]
+    # The missing stream endpoint is only requested once
+    assert len(standin.requests_to("/component/stream-pipeline-status")) == 1
+
+
+def test_flow_status_stream_interrupted(
+    standin: StandInServer, standin_flow: Flow
+) -> None:
+    standin.route(
+        "GET",
+        "/component/stream-pipeline-status",
+        lambda _: StandInResponse(
+            events=[("status", {"status": "RUNNING", "progress": 20})]
+        ),
+    )
+    responses = _polled_statuses([])
+    standin.route("GET", "/component/is-pipeline-running", lambda _: next(responses))
+
+    # Stream closes while the flow is running, the status is then polled
+    status_reports = list(standin_flow.watch_status(timeout=5))
+    assert [report.status for report in status_reports] == [
+        FlowStatus.RUNNING,
+        FlowStatus.IDLE,
+    ]
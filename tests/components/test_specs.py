@@ -1,9 +1,26 @@
 # SPDX-FileCopyrightText: 2025-present ikigailabs.io <harsh@ikigailabs.io>
 #
 # SPDX-License-Identifier: MIT
+import pickle
 
+import pytest
 
 from ikigai import Ikigai
+from ikigai.specs.facet import ArgumentSpec
+
+
+def _argument_spec(name: str, argument_type: str = "TEXT", **spec: object) -> dict:
+    return {
+        "name": name,
+        "argument_type": argument_type,
+        "children": {},
+        "have_sub_arguments": False,
+        "is_deprecated": False,
+        "is_hidden": False,
+        "is_list": False,
+        "is_required": False,
+        **spec,
+    }
 
 
 def test_facet_types_property_access(ikigai: Ikigai) -> None:
@@ -47,3 +64,24 @@ def test_iplt_10504_multi_word_facet_type_access(ikigai: Ikigai) -> None:
     assert facet_types.MID.drop_columns
     assert facet_types.MID.DropColumns
     assert facet_types.MID["Drop Columns"]
+
+
+def test_argument_spec_pickle_after_validation() -> None:
+    spec = ArgumentSpec.model_validate(
+        _argument_spec(
+            "columns",
+            "MAP",
+            is_list=True,
+            children={"column": _argument_spec("column", is_required=True)},
+        )
+    )
+    spec.validate_value("aggregate", [{"column": "price"}])
+
+    restored = pickle.loads(pickle.dumps(spec))  # noqa: S301 -- trusted data
+    copied = spec.model_copy(deep=True)
+
+    assert restored == spec
+    for validated_spec in (restored, copied):
+        validated_spec.validate_value("aggregate", [{"column": "price"}])
+        with pytest.raises(ValueError, match="is required"):
+            validated_spec.validate_value("aggregate", [{"column": None}])
@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+from functools import partial
+from pathlib import Path
+
+import pandas as pd
+import pytest
+import requests
+
+from ikigai import FlowStatus, Ikigai
+from ikigai.client import Cassette, RecordingTransport, ReplayTransport
+from tests.standin import StandInPlatform, StandInServer
+
+
+def test_standin_platform_dataset_roundtrip(
+    standin: StandInServer,
+    standin_platform: StandInPlatform,
+    standin_ikigai: partial[Ikigai],
+    df1: pd.DataFrame,
+) -> None:
+    ikigai = standin_ikigai()
+    app = ikigai.app.new("standin-app").description("Offline app").build()
+    dataset = app.dataset.new("events").df(df1).build()
+
+    assert dataset.size == len(standin_platform.data[dataset.dataset_id])
+    assert len(standin.requests_to("/storage/upload")) == standin_platform.upload_parts
+    assert "traceparent" not in standin.requests_to("/storage/upload")[0].headers
+    pd.testing.assert_frame_equal(app.datasets["events"].df(), df1)
+
+    flow = app.flow.new("refresh").build()
+    run_log = flow.run()
+    assert run_log.status == FlowStatus.SUCCESS
+
+
+def test_record_and_replay(
+    standin: StandInServer,
+    standin_ikigai: partial[Ikigai],
+    df1: pd.DataFrame,
+    tmp_path: Path,
+) -> None:
+    cassette_path = tmp_path / "cassette.json"
+    recording = RecordingTransport(cassette_path)
+    ikigai = standin_ikigai(transport=recording)
+    app = ikigai.app.new("recorded-app").build()
+    app.dataset.new("events").df(df1).build()
+    recorded_df = ikigai.apps["recorded-app"].datasets["events"].df()
+    recording.save()
+
+    cassette = Cassette.load(cassette_path)
+    assert len(cassette) == len(standin.requests)
+    assert "api-key" not in cassette_path.read_text()
+
+    # Replay without the platform
+    standin.stop()
+    replay = standin_ikigai(transport=ReplayTransport(cassette))
+    replayed_app = replay.apps["recorded-app"]
+    assert replayed_app.app_id == app.app_id
+    pd.testing.assert_frame_equal(replayed_app.datasets["events"].df(), recorded_df)
+
+    with pytest.raises(requests.ConnectionError, match="No recorded response"):
+        replay.apps["unknown-app"]
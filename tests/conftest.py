@@ -7,12 +7,17 @@ import random
 import sys
 from collections.abc import Generator
 from contextlib import ExitStack
+from functools import partial
 from pathlib import Path
 from typing import Any, cast
 
 import pytest
 from _pytest.fixtures import FixtureRequest
 from faker import Faker
+from pydantic import HttpUrl
+
+from ikigai import Ikigai
+from tests.standin import StandInPlatform, StandInServer
 
 # Multiple python version compatible import for reading toml
 if sys.version_info >= (3, 11):
@@ -22,6 +27,9 @@ else:
 
 
 def _read_credentials(env_file: Path) -> dict[str, Any]:
+    if not env_file.exists():
+        # Without credentials only the offline tests (using the stand-in) run
+        return {"ids": [], "params": []}
     with env_file.open("rb") as env:
         users: dict[str, dict[str, str]] = tomllib.load(env)["credentials"]["users"]
     return {"ids": users.keys(), "params": users.values()}
@@ -71,3 +79,35 @@ def cleanup() -> Generator[ExitStack, None, None]:
         yield exit_stack
     finally:
         exit_stack.close()
+
+
+@pytest.fixture()
+def standin() -> Generator[StandInServer, None, None]:
+    with StandInServer() as server:
+        yield server
+
+
+@pytest.fixture()
+def standin_platform(standin: StandInServer) -> StandInPlatform:
+    return StandInPlatform(server=standin)
+
+
+@pytest.fixture()
+def standin_base_url(standin: StandInServer) -> HttpUrl:
+    return HttpUrl(standin.base_url)
+
+
+@pytest.fixture()
+def standin_ikigai(
+    standin_platform: StandInPlatform, standin_base_url: HttpUrl
+) -> partial[Ikigai]:
+    """
+    Create clients of the stand-in platform, other options of `Ikigai` are
+    passed through, e.g. `standin_ikigai(coalesce_requests=False)`.
+    """
+    return partial(
+        Ikigai,
+        user_email=standin_platform.user_email,
+        api_key="api-key",
+        base_url=standin_base_url,
+    )
@@ -0,0 +1,557 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Local stand-in for the Ikigai platform, used by tests that run offline.
+
+The server listens on an ephemeral port of the loopback interface and answers
+requests with the handlers registered for their method and path. Requests
+without a registered handler are answered with 404, which lets tests exercise
+the client's handling of endpoints the platform does not provide.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import itertools
+import json
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+
+@dataclass(frozen=True)
+class StandInRequest:
+    method: str
+    path: str
+    params: dict[str, str]
+    headers: dict[str, str]
+    body: bytes
+    """Body of the request, decompressed if it was sent compressed."""
+    wire_size: int = 0
+    """Size of the body as it was sent."""
+
+    def json(self) -> Any:
+        return json.loads(self.body) if self.body else None
+
+
+@dataclass
+class StandInResponse:
+    status: int = HTTPStatus.OK
+    body: Any = field(default_factory=dict)
+    """JSON serializable body, or bytes to send as is."""
+    headers: dict[str, str] = field(default_factory=dict)
+    events: Iterable[tuple[str, Any]] | None = None
+    """(event, data) pairs to stream as server-sent events instead of a body."""
+
+
+Handler = Callable[[StandInRequest], StandInResponse]
+
+
+class StandInServer:
+    """
+    HTTP server standing in for the Ikigai platform.
+
+    Examples
+    --------
+    >>> with StandInServer() as server:
+    ...     server.route("GET", "/component/get-project", lambda request: ...)
+    ...     ikigai = Ikigai(user_email=..., api_key=..., base_url=server.base_url)
+    """
+
+    def __init__(self) -> None:
+        self.gzip_responses = False
+        """Compress response bodies for clients accepting gzip."""
+        self.__routes: dict[tuple[str, str], Handler] = {}
+        self.__requests: list[StandInRequest] = []
+        self.__lock = threading.Lock()
+        self.__server = ThreadingHTTPServer(("127.0.0.1", 0), self.__handler_class())
+        self.__server.daemon_threads = True
+        self.__thread = threading.Thread(
+            target=self.__server.serve_forever, name="ikigai-standin", daemon=True
+        )
+        # The client checks the search service heartbeat on creation
+        self.route("GET", "/search/heartbeat", lambda _: StandInResponse())
+
+    def __enter__(self) -> StandInServer:
+        self.start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.stop()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.__server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    @property
+    def requests(self) -> list[StandInRequest]:
+        with self.__lock:
+            return list(self.__requests)
+
+    def requests_to(self, path: str) -> list[StandInRequest]:
+        return [request for request in self.requests if request.path == path]
+
+    def route(self, method: str, path: str, handler: Handler) -> None:
+        self.__routes[(method.upper(), path)] = handler
+
+    def start(self) -> None:
+        self.__thread.start()
+
+    def stop(self) -> None:
+        self.__server.shutdown()
+        self.__server.server_close()
+        self.__thread.join()
+
+    def _handle(self, request: StandInRequest) -> StandInResponse:
+        with self.__lock:
+            self.__requests.append(request)
+        handler = self.__routes.get((request.method, request.path))
+        if handler is None:
+            return StandInResponse(
+                status=HTTPStatus.NOT_FOUND, body={"error": "Not Found"}
+            )
+        return handler(request)
+
+    def __handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class _RequestHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                self.__dispatch()
+
+            def do_POST(self) -> None:
+                self.__dispatch()
+
+            def do_PUT(self) -> None:
+                self.__dispatch()
+
+            def log_message(self, *_: Any) -> None:
+                return None  # Keep test output quiet
+
+            def __dispatch(self) -> None:
+                url = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length) if length else b""
+                request = StandInRequest(
+                    method=self.command,
+                    path=url.path,
+                    params={
+                        key: values[-1] for key, values in parse_qs(url.query).items()
+                    },
+                    headers=dict(self.headers.items()),
+                    body=(
+                        gzip.decompress(body)
+                        if self.headers.get("Content-Encoding") == "gzip"
+                        else body
+                    ),
+                    wire_size=len(body),
+                )
+                response = server._handle(request)
+                if response.events is not None:
+                    self.__send_events(response)
+                else:
+                    self.__send_body(request, response)
+
+            def __send_body(
+                self, request: StandInRequest, response: StandInResponse
+            ) -> None:
+                body = (
+                    response.body
+                    if isinstance(response.body, bytes)
+                    else json.dumps(response.body).encode()
+                )
+                self.send_response(response.status)
+                headers = {"Content-Type": "application/json", **response.headers}
+                if (
+                    server.gzip_responses
+                    and body
+                    and "gzip" in request.headers.get("Accept-Encoding", "")
+                ):
+                    body = gzip.compress(body)
+                    headers["Content-Encoding"] = "gzip"
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def __send_events(self, response: StandInResponse) -> None:
+                assert response.events is not None
+                self.send_response(response.status)
+                headers = {"Content-Type": "text/event-stream", **response.headers}
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                for event, data in response.events:
+                    payload = data if isinstance(data, str) else json.dumps(data)
+                    lines = [f"event: {event}"]
+                    lines.extend(f"data: {line}" for line in payload.splitlines())
+                    self.wfile.write(("\n".join(lines) + "\n\n").encode())
+                    self.wfile.flush()
+                self.close_connection = True
+
+        return _RequestHandler
+
+
+def _now() -> str:
+    return str(int(time.time()))
+
+
+def _ok(**body: Any) -> StandInResponse:
+    return StandInResponse(body=body)
+
+
+def _not_found(kind: str) -> StandInResponse:
+    return StandInResponse(
+        status=HTTPStatus.BAD_REQUEST, body={"error": f"{kind} not found"}
+    )
+
+
+class StandInPlatform:
+    """
+    In-memory emulation of the Ikigai platform served by a `StandInServer`.
+
+    Implements the `/component/*` and `/search/*` endpoints for apps, datasets
+    and flows, and the presigned storage URLs datasets are uploaded to and
+    downloaded from. Flow runs succeed after `run_duration` seconds.
+
+    Parameters
+    ----------
+    server: StandInServer
+        Server to register the endpoints on.
+
+    user_email: str
+        Email of the user owning the created components.
+
+    upload_parts: int
+        Number of parts multipart uploads are split into.
+
+    run_duration: float
+        Seconds a flow run takes.
+    """
+
+    def __init__(
+        self,
+        server: StandInServer,
+        user_email: str = "user@example.com",
+        upload_parts: int = 4,
+        run_duration: float = 1.0,
+    ) -> None:
+        self.server = server
+        self.user_email = user_email
+        self.upload_parts = upload_parts
+        self.run_duration = run_duration
+        self.facet_specs: dict[str, Any] = {}
+        self.model_specs: dict[str, Any] = {}
+        self.apps: dict[str, dict[str, Any]] = {}
+        self.datasets: dict[str, dict[str, Any]] = {}
+        self.flows: dict[str, dict[str, Any]] = {}
+        self.data: dict[str, bytes] = {}
+        self.__uploads: dict[str, dict[int, bytes]] = {}
+        self.__dataset_logs: dict[str, list[dict[str, str]]] = {}
+        self.__flow_logs: dict[str, list[dict[str, str]]] = {}
+        self.__runs: dict[str, float] = {}
+        self.__ids = itertools.count(1)
+        self.__lock = threading.Lock()
+
+        routes: dict[tuple[str, str], Handler] = {
+            ("POST", "/component/create-project"): self.__create_app,
+            ("GET", "/component/get-project"): self.__get_app,
+            ("GET", "/component/get-projects-for-user"): self.__get_apps,
+            ("GET", "/search/search-projects-for-user"): self.__search_apps,
+            ("POST", "/component/delete-project"): self.__delete_app,
+            ("GET", "/component/get-facet-specs"): lambda _: _ok(**self.facet_specs),
+            ("GET", "/component/get-model-specs"): lambda _: _ok(**self.model_specs),
+            ("POST", "/component/create-dataset"): self.__create_dataset,
+            ("GET", "/component/get-dataset"): self.__get_dataset,
+            ("GET", "/component/get-datasets-for-project"): self.__get_datasets,
+            ("GET", "/search/search-datasets-for-project"): self.__search_datasets,
+            ("POST", "/component/delete-dataset"): self.__delete_dataset,
+            (
+                "GET",
+                "/component/get-dataset-multipart-upload-urls",
+            ): self.__get_upload_urls,
+            ("PUT", "/storage/upload"): self.__upload_part,
+            (
+                "POST",
+                "/component/complete-dataset-multipart-upload",
+            ): self.__complete_upload,
+            ("GET", "/component/verify-dataset-upload"): lambda _: _ok(),
+            ("GET", "/component/confirm-dataset-upload"): self.__confirm_upload,
+            ("GET", "/component/get-dataset-log"): self.__get_dataset_log,
+            ("GET", "/component/get-dataset-download-url"): self.__get_download_url,
+            ("GET", "/storage/download"): self.__download,
+            ("POST", "/component/create-pipeline"): self.__create_flow,
+            ("GET", "/component/get-pipeline"): self.__get_flow,
+            ("GET", "/component/get-pipelines-for-project"): self.__get_flows,
+            ("GET", "/search/search-pipelines-for-project"): self.__search_flows,
+            ("POST", "/component/edit-pipeline"): self.__edit_flow,
+            ("POST", "/component/delete-pipeline"): self.__delete_flow,
+            ("POST", "/component/run-pipeline"): self.__run_flow,
+            ("GET", "/component/is-pipeline-running"): self.__is_flow_running,
+            ("GET", "/component/get-pipeline-log"): self.__get_flow_log,
+        }
+        for (method, path), handler in routes.items():
+            server.route(method, path, handler)
+
+    def __new_id(self) -> str:
+        return f"{next(self.__ids):08d}"
+
+    @staticmethod
+    def __listing(key: str, components: list[dict[str, Any]]) -> StandInResponse:
+        return StandInResponse(body={key: components, "limit_warning": ""})
+
+    # Apps
+
+    def __create_app(self, request: StandInRequest) -> StandInResponse:
+        project = request.json()["project"]
+        app_id, now = self.__new_id(), _now()
+        self.apps[app_id] = {
+            "project_id": app_id,
+            "name": project["name"],
+            "owner": self.user_email,
+            "description": project.get("description", ""),
+            "icon": "",
+            "images": [],
+            "directory": project.get("directory") or {},
+            "created_at": now,
+            "modified_at": now,
+            "last_used_at": now,
+        }
+        return _ok(project_id=app_id)
+
+    def __get_app(self, request: StandInRequest) -> StandInResponse:
+        for app in self.apps.values():
+            if (
+                request.params.get("project_id", app["project_id"]) == app["project_id"]
+                and request.params.get("name", app["name"]) == app["name"]
+            ):
+                return _ok(project=app)
+        return _not_found("App")
+
+    def __get_apps(self, _: StandInRequest) -> StandInResponse:
+        return self.__listing("projects", list(self.apps.values()))
+
+    def __search_apps(self, request: StandInRequest) -> StandInResponse:
+        query = request.params.get("query", "")
+        apps = [app for app in self.apps.values() if query in app["name"]]
+        return self.__listing("projects", apps)
+
+    def __delete_app(self, request: StandInRequest) -> StandInResponse:
+        app_id = request.json()["project"]["project_id"]
+        self.apps.pop(app_id, None)
+        return _ok(project_id=app_id)
+
+    # Datasets
+
+    def __create_dataset(self, request: StandInRequest) -> StandInResponse:
+        dataset = request.json()["dataset"]
+        dataset_id, now = self.__new_id(), _now()
+        self.datasets[dataset_id] = {
+            "project_id": dataset["project_id"],
+            "dataset_id": dataset_id,
+            "name": dataset["name"],
+            "filename": "",
+            "data_types": {},
+            "directory": dataset.get("directory") or {},
+            "is_optimized": False,
+            "file_extension": "csv",
+            "size": 0,
+            "is_visible": True,
+            "created_at": now,
+            "modified_at": now,
+        }
+        self.__dataset_logs[dataset_id] = []
+        return _ok(dataset_id=dataset_id)
+
+    def __find(
+        self,
+        components: dict[str, dict[str, Any]],
+        id_key: str,
+        request: StandInRequest,
+    ) -> dict[str, Any] | None:
+        for component in components.values():
+            if (
+                request.params.get("project_id", component["project_id"])
+                == component["project_id"]
+                and request.params.get(id_key, component[id_key]) == component[id_key]
+                and request.params.get("name", component["name"]) == component["name"]
+            ):
+                return component
+        return None
+
+    def __in_app(
+        self, components: dict[str, dict[str, Any]], request: StandInRequest
+    ) -> list[dict[str, Any]]:
+        query = request.params.get("query", "")
+        return [
+            component
+            for component in components.values()
+            if component["project_id"] == request.params["project_id"]
+            and query in component["name"]
+        ]
+
+    def __get_dataset(self, request: StandInRequest) -> StandInResponse:
+        dataset = self.__find(self.datasets, "dataset_id", request)
+        return _ok(dataset=dataset) if dataset else _not_found("Dataset")
+
+    def __get_datasets(self, request: StandInRequest) -> StandInResponse:
+        return self.__listing("datasets", self.__in_app(self.datasets, request))
+
+    def __search_datasets(self, request: StandInRequest) -> StandInResponse:
+        return self.__listing("datasets", self.__in_app(self.datasets, request))
+
+    def __delete_dataset(self, request: StandInRequest) -> StandInResponse:
+        dataset_id = request.json()["dataset"]["dataset_id"]
+        self.datasets.pop(dataset_id, None)
+        self.data.pop(dataset_id, None)
+        return _ok(dataset_id=dataset_id)
+
+    def __get_upload_urls(self, request: StandInRequest) -> StandInResponse:
+        dataset_id = request.params["dataset_id"]
+        upload_id = f"upload-{self.__new_id()}"
+        self.__uploads[upload_id] = {}
+        urls = {
+            str(part): (
+                f"{self.server.base_url}/storage/upload"
+                f"?upload_id={upload_id}&part={part}&dataset_id={dataset_id}"
+            )
+            for part in range(1, self.upload_parts + 1)
+        }
+        return _ok(upload_id=upload_id, content_type="text/csv", urls=urls)
+
+    def __upload_part(self, request: StandInRequest) -> StandInResponse:
+        upload = self.__uploads[request.params["upload_id"]]
+        with self.__lock:
+            upload[int(request.params["part"])] = request.body
+        etag = hashlib.md5(request.body, usedforsecurity=False).hexdigest()
+        return StandInResponse(body=b"", headers={"ETag": f'"{etag}"'})
+
+    def __complete_upload(self, request: StandInRequest) -> StandInResponse:
+        payload = request.json()
+        upload = self.__uploads.pop(payload["upload_id"])
+        if payload["abort"]:
+            return _ok()
+
+        dataset_id = payload["dataset"]["dataset_id"]
+        data = b"".join(part for _, part in sorted(upload.items()))
+        self.data[dataset_id] = data
+        self.datasets[dataset_id].update(
+            filename=payload["dataset"]["filename"], size=len(data)
+        )
+        return _ok()
+
+    def __confirm_upload(self, request: StandInRequest) -> StandInResponse:
+        dataset_id = request.params["dataset_id"]
+        self.__dataset_logs[dataset_id].insert(
+            0, {"status": "SUCCESS", "timestamp": _now(), "job_type": "UPLOAD_DATASET"}
+        )
+        return _ok(status="SUCCESS")
+
+    def __get_dataset_log(self, request: StandInRequest) -> StandInResponse:
+        logs = self.__dataset_logs.get(request.params["dataset_id"], [])
+        return _ok(dataset_log=logs[: int(request.params.get("limit", 5))])
+
+    def __get_download_url(self, request: StandInRequest) -> StandInResponse:
+        url = (
+            f"{self.server.base_url}/storage/download"
+            f"?dataset_id={request.params['dataset_id']}"
+        )
+        return _ok(status="SUCCESS", url=url)
+
+    def __download(self, request: StandInRequest) -> StandInResponse:
+        data = self.data.get(request.params["dataset_id"])
+        if data is None:
+            return StandInResponse(status=HTTPStatus.NOT_FOUND, body=b"")
+        return StandInResponse(body=data, headers={"Content-Type": "text/csv"})
+
+    # Flows
+
+    def __create_flow(self, request: StandInRequest) -> StandInResponse:
+        pipeline = request.json()["pipeline"]
+        flow_id, now = self.__new_id(), _now()
+        flow = {
+            "project_id": pipeline["project_id"],
+            "pipeline_id": flow_id,
+            "name": pipeline["name"],
+            "directory": pipeline.get("directory") or {},
+            "definition": pipeline.get("definition") or {"facets": [], "arrows": []},
+            "trigger_downstream_pipelines": False,
+            "high_volume_preference": pipeline.get("high_volume_preference", False),
+            "created_at": now,
+            "modified_at": now,
+        }
+        if pipeline.get("schedule"):
+            flow["schedule"] = pipeline["schedule"]
+        self.flows[flow_id] = flow
+        self.__flow_logs[flow_id] = []
+        return _ok(pipeline_id=flow_id)
+
+    def __get_flow(self, request: StandInRequest) -> StandInResponse:
+        flow = self.__find(self.flows, "pipeline_id", request)
+        return _ok(pipeline=flow) if flow else _not_found("Pipeline")
+
+    def __get_flows(self, request: StandInRequest) -> StandInResponse:
+        return self.__listing("pipelines", self.__in_app(self.flows, request))
+
+    def __search_flows(self, request: StandInRequest) -> StandInResponse:
+        return self.__listing("pipelines", self.__in_app(self.flows, request))
+
+    def __edit_flow(self, request: StandInRequest) -> StandInResponse:
+        pipeline = request.json()["pipeline"]
+        flow = self.flows[pipeline["pipeline_id"]]
+        flow.update(pipeline)
+        flow["modified_at"] = _now()
+        return _ok(pipeline_id=flow["pipeline_id"])
+
+    def __delete_flow(self, request: StandInRequest) -> StandInResponse:
+        flow_id = request.json()["pipeline"]["pipeline_id"]
+        self.flows.pop(flow_id, None)
+        return _ok(pipeline_id=flow_id)
+
+    def __run_flow(self, request: StandInRequest) -> StandInResponse:
+        flow_id = request.json()["pipeline"]["pipeline_id"]
+        with self.__lock:
+            self.__runs[flow_id] = time.time() + self.run_duration
+        return _ok(pipeline_id=flow_id)
+
+    def __is_flow_running(self, request: StandInRequest) -> StandInResponse:
+        flow_id = request.params["pipeline_id"]
+        with self.__lock:
+            finishes_at = self.__runs.get(flow_id)
+            if finishes_at is not None and finishes_at <= time.time():
+                del self.__runs[flow_id]
+                self.__flow_logs[flow_id].insert(
+                    0,
+                    {
+                        "log_id": self.__new_id(),
+                        "status": "SUCCESS",
+                        "user": self.user_email,
+                        "erroneous_facet_id": "",
+                        "message": "",
+                        "timestamp": _now(),
+                    },
+                )
+                finishes_at = None
+        if finishes_at is None:
+            return _ok(status=False, progress={"message": ""})
+        return _ok(
+            status=True, progress={"status": "RUNNING", "progress": 50, "message": ""}
+        )
+
+    def __get_flow_log(self, request: StandInRequest) -> StandInResponse:
+        logs = self.__flow_logs.get(request.params["pipeline_id"], [])
+        return _ok(pipeline_log=logs[: int(request.params.get("limit", 5))])
@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+import time
+from collections.abc import Generator
+
+import pytest
+from pydantic import HttpUrl
+
+from ikigai import BaseUrlValidation, Ikigai
+from ikigai.client import client
+from tests.standin import StandInResponse, StandInServer
+
+
+@pytest.fixture(autouse=True)
+def _forget_validated_base_urls() -> Generator[None, None, None]:
+    # Ephemeral ports are reused, earlier tests must not validate the base URL
+    client._validated_base_urls.clear()
+    yield
+    client._validated_base_urls.clear()
+
+
+@pytest.fixture()
+def standin_search(standin: StandInServer) -> StandInServer:
+    standin.route(
+        "GET",
+        "/search/search-projects-for-user",
+        lambda _: StandInResponse(body={"projects": [], "limit_warning": ""}),
+    )
+    return standin
+
+
+def test_lazy_base_url_validation(
+    standin_search: StandInServer, standin_base_url: HttpUrl
+) -> None:
+    ikigai = Ikigai(
+        user_email="user@example.com",
+        api_key="api-key",
+        base_url=standin_base_url,
+        validate_base_url=BaseUrlValidation.LAZY,
+    )
+    assert standin_search.requests == []
+
+    ikigai.apps.search("app")
+    ikigai.apps.search("app")
+    assert [request.path for request in standin_search.requests] == [
+        "/search/heartbeat",
+        "/search/search-projects-for-user",
+        "/search/search-projects-for-user",
+    ]
+
+    # Validated base URLs are not validated again within the process
+    Ikigai(user_email="user@example.com", api_key="api-key", base_url=standin_base_url)
+    assert len(standin_search.requests_to("/search/heartbeat")) == 1
+
+
+def test_lazy_base_url_validation_failure(
+    standin: StandInServer, standin_base_url: HttpUrl
+) -> None:
+    standin.stop()
+    ikigai = Ikigai(
+        user_email="user@example.com",
+        api_key="api-key",
+        base_url=standin_base_url,
+        validate_base_url=BaseUrlValidation.LAZY,
+    )
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Could not find Ikigai SearchAPI"):
+            ikigai.apps.search("app")
+
+
+def test_background_base_url_validation(
+    standin_search: StandInServer, standin_base_url: HttpUrl
+) -> None:
+    ikigai = Ikigai(
+        user_email="user@example.com",
+        api_key="api-key",
+        base_url=standin_base_url,
+        validate_base_url=BaseUrlValidation.BACKGROUND,
+    )
+    deadline = time.monotonic() + 5
+    while not standin_search.requests and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert standin_search.requests_to("/search/heartbeat")
+
+    ikigai.apps.search("app")
+    assert len(standin_search.requests_to("/search/heartbeat")) == 1
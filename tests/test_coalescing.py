@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import pytest
+from pydantic import HttpUrl
+
+from ikigai import Ikigai
+from ikigai.client.session import Session
+from ikigai.components import App
+from tests.standin import (
+    StandInPlatform,
+    StandInRequest,
+    StandInResponse,
+    StandInServer,
+)
+
+NUM_THREADS = 8
+RESPONSE_DELAY = 0.5
+
+
+@pytest.mark.parametrize(
+    ("coalesce_requests", "expected_requests"),
+    [(True, 1), (False, NUM_THREADS)],
+)
+def test_concurrent_lookups(
+    standin: StandInServer,
+    standin_platform: StandInPlatform,
+    standin_ikigai: partial[Ikigai],
+    coalesce_requests: bool,
+    expected_requests: int,
+) -> None:
+    ikigai = standin_ikigai(coalesce_requests=coalesce_requests)
+    app_id = ikigai.app.new("events-app").build().app_id
+
+    def slow_get_app(_: object) -> StandInResponse:
+        time.sleep(RESPONSE_DELAY)
+        return StandInResponse(body={"project": standin_platform.apps[app_id]})
+
+    standin.route("GET", "/component/get-project", slow_get_app)
+    start = threading.Barrier(NUM_THREADS)
+
+    def lookup(_: int) -> App:
+        start.wait()
+        return ikigai.apps["events-app"]
+
+    with ThreadPoolExecutor(max_workers=NUM_THREADS) as executor:
+        apps = list(executor.map(lookup, range(NUM_THREADS)))
+
+    lookups = [
+        request
+        for request in standin.requests_to("/component/get-project")
+        if "name" in request.params
+    ]
+    assert len(lookups) == expected_requests
+    assert {app.app_id for app in apps} == {app_id}
+    # Each caller gets its own component
+    assert len({id(app) for app in apps}) == NUM_THREADS
+
+
+def test_lookup_after_write(standin: StandInServer, standin_base_url: HttpUrl) -> None:
+    session = Session(
+        user_email="user@example.com",
+        api_key="api-key",
+        ssl=True,
+        base_url=standin_base_url,
+    )
+    project = {"name": "app"}
+    read_started = threading.Event()
+
+    def slow_get_app(_: object) -> StandInResponse:
+        # Reads the project before it is renamed
+        body = {"project": dict(project)}
+        read_started.set()
+        time.sleep(RESPONSE_DELAY)
+        return StandInResponse(body=body)
+
+    def edit_app(request: StandInRequest) -> StandInResponse:
+        project.update(request.json()["project"])
+        return StandInResponse(body={})
+
+    standin.route("GET", "/component/get-project", slow_get_app)
+    standin.route("POST", "/component/edit-project", edit_app)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        stale = executor.submit(session.get_json, "/component/get-project")
+        read_started.wait()
+        session.post_json("/component/edit-project", json={"project": {"name": "x"}})
+        # The lookup started before the edit, its response is not shared
+        assert session.get_json("/component/get-project") == {"project": {"name": "x"}}
+        assert stale.result() == {"project": {"name": "app"}}
+
+    _stale_lookup, _lookup = standin.requests_to("/component/get-project")
+    session.close()
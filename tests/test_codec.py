@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+from pydantic import BaseModel, HttpUrl, TypeAdapter, ValidationError
+
+from ikigai.client import codec
+from ikigai.client.session import Session
+from ikigai.utils import FlowStatus
+from tests.standin import StandInRequest, StandInResponse, StandInServer
+
+
+class _Project(BaseModel):
+    project_id: str
+    name: str
+
+
+def test_codec_roundtrip() -> None:
+    data = {"name": "app", "sizes": [1, 2.5, None], "status": FlowStatus.SUCCESS}
+    encoded = codec.dumps(data)
+
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == {**data, "status": "SUCCESS"}
+    assert codec.BACKEND in {"orjson", "json"}
+
+
+def test_session_json(standin: StandInServer, standin_base_url: HttpUrl) -> None:
+    def echo(request: StandInRequest) -> StandInResponse:
+        assert request.headers["Content-Type"] == "application/json"
+        return StandInResponse(body={"project": request.json()})
+
+    standin.route("POST", "/component/echo", echo)
+    standin.route(
+        "GET",
+        "/component/get-projects",
+        lambda _: StandInResponse(
+            body={"projects": [{"project_id": "1", "name": "app"}, {"name": "x"}]}
+        ),
+    )
+    session = Session(
+        user_email="user@example.com",
+        api_key="api-key",
+        ssl=True,
+        base_url=standin_base_url,
+    )
+
+    project = {"project_id": "1", "name": "app"}
+    assert session.post_json("/component/echo", json=project) == {"project": project}
+
+    # Validate straight from the response bytes
+    adapter = TypeAdapter(dict[str, list[_Project]])
+    with pytest.raises(ValidationError, match="project_id"):
+        session.get_json("/component/get-projects", adapter=adapter)
+    standin.route(
+        "GET",
+        "/component/get-projects",
+        lambda _: StandInResponse(body={"projects": [project]}),
+    )
+    projects = session.get_json("/component/get-projects", adapter=adapter)
+    assert projects == {"projects": [_Project(**project)]}
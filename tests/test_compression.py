@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+from functools import partial
+
+import pytest
+from pydantic import HttpUrl, ValidationError
+
+from ikigai import Ikigai, RequestCompression
+from ikigai.client import MetricsCollector, compression
+from tests.standin import StandInPlatform, StandInServer
+
+NUM_APPS = 50
+
+
+def test_request_compression(
+    standin: StandInServer,
+    standin_platform: StandInPlatform,
+    standin_ikigai: partial[Ikigai],
+) -> None:
+    ikigai = standin_ikigai(
+        request_compression=RequestCompression.GZIP, compression_threshold=1024
+    )
+    metrics = MetricsCollector()
+    metrics.attach(ikigai.hooks)
+
+    description = "Sales of every store, refreshed nightly. " * 100
+    app = ikigai.app.new("compressed-app").description(description).build()
+    ikigai.app.new("small-app").build()
+
+    large, small = standin.requests_to("/component/create-project")
+    assert large.headers["Content-Encoding"] == "gzip"
+    assert large.wire_size < len(large.body)
+    assert "Content-Encoding" not in small.headers
+    assert standin_platform.apps[app.app_id]["description"] == description
+
+    create_metrics = metrics.to_dict()["POST /component/create-project"]
+    assert create_metrics["wire_bytes_sent"] < create_metrics["bytes_sent"]
+
+
+def test_response_decompression(
+    standin: StandInServer, standin_ikigai: partial[Ikigai]
+) -> None:
+    standin.gzip_responses = True
+    ikigai = standin_ikigai()
+    metrics = MetricsCollector()
+    metrics.attach(ikigai.hooks)
+    for idx in range(NUM_APPS):
+        ikigai.app.new(f"app-{idx}").description("Compressible " * 20).build()
+
+    apps = ikigai.apps.search("app-")
+
+    assert len(apps) == NUM_APPS
+    (search,) = standin.requests_to("/search/search-projects-for-user")
+    assert "gzip" in search.headers["Accept-Encoding"]
+    search_metrics = metrics.to_dict()["GET /search/search-projects-for-user"]
+    assert 0 < search_metrics["wire_bytes_received"] < search_metrics["bytes_received"]
+
+
+@pytest.mark.skipif(compression.brotli is not None, reason="brotli is installed")
+def test_brotli_compression_unavailable(standin_base_url: HttpUrl) -> None:
+    with pytest.raises(ValidationError, match="requires the brotli package"):
+        Ikigai(
+            user_email="user@example.com",
+            api_key="api-key",
+            base_url=standin_base_url,
+            request_compression=RequestCompression.BROTLI,
+        )
@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+from functools import partial
+from http import HTTPStatus
+
+from ikigai import Ikigai
+from ikigai.client import MetricsCollector
+from tests.standin import (
+    StandInPlatform,
+    StandInRequest,
+    StandInResponse,
+    StandInServer,
+)
+
+INITIAL_SIZE = 1024
+UPDATED_SIZE = 2048
+
+
+def test_conditional_dataset_lookups(
+    standin: StandInServer,
+    standin_platform: StandInPlatform,
+    standin_ikigai: partial[Ikigai],
+) -> None:
+    ikigai = standin_ikigai()
+    app = ikigai.app.new("polled-app").build()
+    dataset = {
+        "project_id": app.app_id,
+        "dataset_id": "polled-dataset",
+        "name": "events",
+        "filename": "events.csv",
+        "data_types": {},
+        "directory": {},
+        "is_optimized": False,
+        "file_extension": "csv",
+        "size": INITIAL_SIZE,
+        "is_visible": True,
+        "created_at": "1700000000",
+        "modified_at": "1700000000",
+    }
+    etag = {"value": '"v1"'}
+
+    def get_dataset(request: StandInRequest) -> StandInResponse:
+        if request.headers.get("If-None-Match") == etag["value"]:
+            return StandInResponse(status=HTTPStatus.NOT_MODIFIED, body=b"")
+        return StandInResponse(
+            body={"dataset": dataset}, headers={"ETag": etag["value"]}
+        )
+
+    standin.route("GET", "/component/get-dataset", get_dataset)
+    metrics = MetricsCollector()
+    metrics.attach(ikigai.hooks)
+
+    assert app.datasets["events"].size == INITIAL_SIZE
+    # Not modified, served from the cache
+    assert app.datasets["events"].size == INITIAL_SIZE
+    dataset["size"], etag["value"] = UPDATED_SIZE, '"v2"'
+    assert app.datasets["events"].size == UPDATED_SIZE
+
+    first, revalidated, modified = standin.requests_to("/component/get-dataset")
+    assert "If-None-Match" not in first.headers
+    assert revalidated.headers["If-None-Match"] == '"v1"'
+    assert modified.headers["If-None-Match"] == '"v1"'
+    lookup_metrics = metrics.to_dict()["GET /component/get-dataset"]
+    assert lookup_metrics["status_codes"] == {
+        HTTPStatus.OK: 2,
+        HTTPStatus.NOT_MODIFIED: 1,
+    }
@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+import subprocess
+import sys
+
+# Modules that are slow to import, they must only be imported on first use
+DEFERRED_MODULES = (
+    "pandas",
+    "tqdm",
+    "ikigai.specs.facet",
+    "ikigai.specs.model",
+    "ikigai.components.app",
+    "ikigai.components.dataset",
+    "ikigai.components.flow",
+)
+
+# Generous budget, `import ikigai` took ~0.8s before the heavy imports were deferred
+IMPORT_TIME_BUDGET = 0.6
+
+
+def _import_times(statement: str) -> dict[str, float]:
+    """
+    Cumulative import time in seconds of every module imported by a statement,
+    measured with `python -X importtime` in a fresh interpreter.
+    """
+    result = subprocess.run(  # noqa: S603 -- runs the current interpreter
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times: dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, module = line.removeprefix("import time:").split("|")
+        import_times[module.strip()] = int(cumulative) / 1e6
+    return import_times
+
+
+def test_import_defers_heavy_modules() -> None:
+    import_times = _import_times("import ikigai")
+
+    assert "ikigai" in import_times
+    imported = [module for module in DEFERRED_MODULES if module in import_times]
+    assert imported == []
+    # Fastest of a few measurements, to be robust against a busy machine
+    fastest = min(_import_times("import ikigai")["ikigai"] for _ in range(3))
+    assert fastest < IMPORT_TIME_BUDGET
+
+
+def test_deferred_modules_import_on_first_use() -> None:
+    # Lazily imported modules are not reported by -X importtime
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, ikigai; ikigai.components.Dataset; ikigai.specs.FacetTypes; "
+            "print(*sorted(sys.modules), sep='\\n')",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = set(result.stdout.splitlines())
+
+    assert "ikigai.components.dataset" in modules
+    assert "ikigai.specs.facet" in modules
+    assert "pandas" not in modules
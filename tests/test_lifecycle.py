@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+import gc
+import warnings
+from functools import partial
+from pathlib import Path
+
+import pytest
+from pydantic import HttpUrl
+
+from ikigai import Ikigai
+from ikigai.client.session import Session
+from ikigai.client.transport import RecordingTransport
+
+
+def test_context_manager(standin_ikigai: partial[Ikigai], tmp_path: Path) -> None:
+    cassette_path = tmp_path / "cassette.json"
+    with standin_ikigai(transport=RecordingTransport(cassette_path)) as ikigai:
+        ikigai.app.new("closed-app").build()
+
+    # Closing the client closes its transport, saving the cassette
+    assert cassette_path.exists()
+    with pytest.raises(RuntimeError, match="session is closed"):
+        ikigai.apps["closed-app"]
+    ikigai.close()
+
+
+def test_transfer_session(standin_base_url: HttpUrl) -> None:
+    session = Session(
+        user_email="user@example.com",
+        api_key="api-key",
+        ssl=True,
+        base_url=standin_base_url,
+    )
+
+    transfer_session = session.transfer_session()
+    assert session.transfer_session() is transfer_session
+    assert "api-key" not in transfer_session.headers
+    session.close()
+
+
+def test_unclosed_client_warns(standin_ikigai: partial[Ikigai]) -> None:
+    ikigai = standin_ikigai()
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always", ResourceWarning)
+        del ikigai
+        gc.collect()
+
+    assert any(
+        issubclass(warning.category, ResourceWarning)
+        and "Unclosed Ikigai session" in str(warning.message)
+        for warning in caught
+    )
@@ -0,0 +1,88 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import pytest
+
+from ikigai import Ikigai
+from ikigai.components import App
+from tests.standin import StandInServer
+
+NUM_APPS = 4
+
+
+def _flow_names(app: App) -> list[str]:
+    # Makes a request from the worker process
+    return [flow.name for flow in app.flows.iter()]
+
+
+@pytest.fixture()
+def ikigai(standin_ikigai: partial[Ikigai]) -> Ikigai:
+    return standin_ikigai()
+
+
+def test_pickle_client(ikigai: Ikigai, standin: StandInServer) -> None:
+    app = ikigai.app.new("pickled-app").build()
+    app.flow.new("pickled-flow").build()
+    heartbeats = len(standin.requests_to("/search/heartbeat"))
+
+    restored_ikigai = pickle.loads(pickle.dumps(ikigai))  # noqa: S301 -- trusted data
+    restored_app = pickle.loads(pickle.dumps(app))  # noqa: S301 -- trusted data
+
+    assert restored_ikigai.apps["pickled-app"].app_id == app.app_id
+    assert restored_app.app_id == app.app_id
+    assert _flow_names(restored_app) == ["pickled-flow"]
+    # The restored client is not validated again
+    assert len(standin.requests_to("/search/heartbeat")) == heartbeats
+
+
+def test_pickle_lazy_components(ikigai: Ikigai, standin: StandInServer) -> None:
+    app = ikigai.app.new("lazy-app").build(lazy=True)
+    flow = app.flow.new("lazy-flow").build(lazy=True)
+
+    restored_app = pickle.loads(pickle.dumps(app))  # noqa: S301 -- trusted data
+    restored_flow = pickle.loads(pickle.dumps(flow))  # noqa: S301 -- trusted data
+    assert standin.requests_to("/component/get-project") == []
+    assert standin.requests_to("/component/get-pipeline") == []
+
+    # The remaining fields are loaded by the restored components
+    assert restored_app.created_at == app.created_at
+    assert restored_flow.created_at == flow.created_at
+
+
+def test_process_pool(ikigai: Ikigai) -> None:
+    apps = [ikigai.app.new(f"app-{idx}").build() for idx in range(NUM_APPS)]
+    for idx, app in enumerate(apps):
+        app.flow.new(f"flow-{idx}").build()
+
+    with ProcessPoolExecutor(
+        max_workers=2, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        flow_names = list(executor.map(_flow_names, apps))
+
+    assert flow_names == [[f"flow-{idx}"] for idx in range(NUM_APPS)]
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="fork unavailable"
+)
+def test_forked_process(ikigai: Ikigai) -> None:
+    # The parent has an open connection when forking
+    app = ikigai.app.new("forked-app").build()
+    app.flow.new("forked-flow").build()
+
+    # The child inherits the app as is, without pickling it
+    context = multiprocessing.get_context("fork")
+    results = context.SimpleQueue()
+    child = context.Process(target=lambda: results.put(_flow_names(app)))
+    child.start()
+    child.join(timeout=30)
+    assert child.exitcode == 0
+    assert results.get() == ["forked-flow"]
+
+    assert _flow_names(app) == ["forked-flow"]
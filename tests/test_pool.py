@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from ikigai import IkigaiPool
+from tests.standin import StandInPlatform, StandInServer
+
+USERS = [(f"user-{idx}@example.com", f"api-key-{idx}") for idx in range(3)]
+
+
+def test_pool_shares_specs(
+    standin: StandInServer, standin_platform: StandInPlatform
+) -> None:
+    with IkigaiPool(base_url=standin.base_url) as pool:
+        for user_email, api_key in USERS:
+            with pool.client(user_email=user_email, api_key=api_key) as ikigai:
+                ikigai.app.new(f"app-of-{user_email}").build()
+                assert ikigai.model_types is not None
+
+    # Every user sent their own credentials
+    creations = standin.requests_to("/component/create-project")
+    assert [
+        (request.headers["user"], request.headers["api-key"]) for request in creations
+    ] == USERS
+    # The specs are fetched once for all users
+    assert len(standin.requests_to("/component/get-model-specs")) == 1
+
+
+def test_pool_evicts_idle_clients(
+    standin: StandInServer, standin_platform: StandInPlatform
+) -> None:
+    (first_email, first_key), (second_email, second_key), _ = USERS
+    pool = IkigaiPool(base_url=standin.base_url, max_idle_clients=1)
+
+    with pool.client(user_email=first_email, api_key=first_key) as first:
+        # Leased clients are not evicted
+        for user_email, api_key in USERS[1:]:
+            with pool.client(user_email=user_email, api_key=api_key):
+                pass
+        assert len(pool) == 2  # noqa: PLR2004 -- the leased and one idle client
+        first.app.new("still-open").build()
+
+    with pool.client(user_email=second_email, api_key=second_key) as second:
+        second.app.new("reused").build()
+    assert len(pool) == 1
+    # The least recently used idle client was closed
+    with pytest.raises(RuntimeError, match="session is closed"):
+        first.apps["still-open"]
+
+    pool.close()
+    with (
+        pytest.raises(RuntimeError, match="pool is closed"),
+        pool.client(user_email=first_email, api_key=first_key),
+    ):
+        pass
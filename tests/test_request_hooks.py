@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+from functools import partial
+from http import HTTPStatus
+
+import pytest
+
+from ikigai import Ikigai
+from ikigai.client import ErrorEvent, MetricsCollector, RequestEvent, ResponseEvent
+from tests.standin import StandInResponse, StandInServer
+
+_SEARCHES = 3
+
+
+@pytest.fixture()
+def ikigai(standin: StandInServer, standin_ikigai: partial[Ikigai]) -> Ikigai:
+    standin.route(
+        "GET",
+        "/search/search-projects-for-user",
+        lambda _: StandInResponse(body={"projects": [], "limit_warning": ""}),
+    )
+    standin.route(
+        "GET",
+        "/component/get-project",
+        lambda _: StandInResponse(status=HTTPStatus.INTERNAL_SERVER_ERROR),
+    )
+    return standin_ikigai()
+
+
+def test_request_hooks(standin: StandInServer, ikigai: Ikigai) -> None:
+    events: list[RequestEvent | ResponseEvent | ErrorEvent] = []
+
+    def before_request(event: RequestEvent) -> None:
+        event.headers["x-test"] = "hooked"
+        events.append(event)
+
+    unregister = ikigai.hooks.register(
+        before_request=before_request,
+        after_response=events.append,
+        error=events.append,
+    )
+
+    assert not ikigai.apps.search("app")
+    with pytest.raises(RuntimeError):
+        ikigai.apps["missing"]
+
+    request, response, *failed_events = events
+    failed_request, failed_response, error = failed_events
+    assert isinstance(request, RequestEvent)
+    assert request.path == "/search/search-projects-for-user"
+    assert isinstance(response, ResponseEvent)
+    assert response.request is request
+    assert response.status_code == HTTPStatus.OK
+    assert response.bytes_received > 0
+    assert isinstance(failed_response, ResponseEvent)
+    assert failed_response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+    assert isinstance(error, ErrorEvent)
+    assert error.request is failed_request
+    assert isinstance(error.error, RuntimeError)
+    assert all(
+        request.headers["x-test"] == "hooked"
+        for request in standin.requests_to("/search/search-projects-for-user")
+    )
+
+    event_count = len(events)
+    unregister()
+    ikigai.apps.search("app")
+    assert len(events) == event_count
+
+
+def test_request_hook_failure_is_isolated(ikigai: Ikigai) -> None:
+    def failing_hook(event: ResponseEvent) -> None:
+        raise ValueError(event)
+
+    ikigai.hooks.register(after_response=failing_hook)
+    assert not ikigai.apps.search("app")
+
+
+def test_metrics_collector(ikigai: Ikigai) -> None:
+    metrics = MetricsCollector(buckets=(0.001, 60))
+    metrics.attach(ikigai.hooks)
+
+    for _ in range(_SEARCHES):
+        ikigai.apps.search("app")
+    with pytest.raises(RuntimeError):
+        ikigai.apps["missing"]
+
+    collected = metrics.to_dict()
+    listing = collected["GET /search/search-projects-for-user"]
+    assert listing["requests"] == listing["count"] == _SEARCHES
+    assert listing["status_codes"] == {200: _SEARCHES}
+    assert listing["latency"]["buckets"]["60"] == _SEARCHES
+    assert listing["latency"]["buckets"]["+Inf"] == _SEARCHES
+    assert listing["bytes_received"] > 0
+
+    failed = collected["GET /component/get-project"]
+    assert failed["status_codes"] == {500: 1}
+    assert failed["errors"] == {"RuntimeError": 1}
+
+    prometheus = metrics.to_prometheus()
+    assert "# TYPE ikigai_request_duration_seconds histogram" in prometheus
+    assert (
+        'ikigai_request_duration_seconds_count{method="GET",'
+        f'endpoint="/search/search-projects-for-user"}} {_SEARCHES}'
+    ) in prometheus
+    assert (
+        'ikigai_responses_total{method="GET",'
+        'endpoint="/component/get-project",status="500"} 1'
+    ) in prometheus
+
+    metrics.reset()
+    assert metrics.to_dict() == {}
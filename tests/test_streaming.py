@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+import json
+import logging
+from functools import partial
+
+import pytest
+
+from ikigai import Ikigai
+from ikigai.client.streaming import iter_array_items
+from tests.standin import StandInPlatform, StandInResponse, StandInServer
+
+NUM_DATASETS = 300
+
+
+def test_iter_array_items() -> None:
+    items = [
+        {"name": "Ventes été", "size": 12345678901234, "ratio": -1.5e-3},
+        {"nested": {"values": [1, [2, 3], {"4": None}]}, "flag": True},
+        "plain ✓",
+        42,
+        12.5,
+        1.5e3,
+        -0.25e-12,
+    ]
+    document = json.dumps(
+        {"limit_warning": "", "items": items, "total": 7, "ratio": -1.5e-3},
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+    # Every value and multi-byte character is split across chunks
+    envelope: dict = {}
+    chunks = (document[idx : idx + 1] for idx in range(len(document)))
+    assert list(iter_array_items(chunks, key="items", envelope=envelope)) == items
+    assert envelope == {"limit_warning": "", "total": 7, "ratio": -1.5e-3}
+
+    # Numbers split within their digits, fraction and exponent
+    envelope = {}
+    split_numbers = [b'{"items":[12.', b"5, 1.5e", b"3]", b', "total": 1', b"2}"]
+    assert list(iter_array_items(split_numbers, key="items", envelope=envelope)) == [
+        12.5,
+        1.5e3,
+    ]
+    assert envelope == {"total": 12}
+
+    assert list(iter_array_items([b'{"items": []}'], key="items")) == []
+    with pytest.raises(ValueError, match="to be an array"):
+        list(iter_array_items([b'{"items": {}}'], key="items"))
+    with pytest.raises(ValueError, match="end of document"):
+        list(iter_array_items([b'{"items": [1, 2'], key="items"))
+
+
+def test_iter_datasets(
+    standin: StandInServer,
+    standin_platform: StandInPlatform,
+    standin_ikigai: partial[Ikigai],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    ikigai = standin_ikigai()
+    app = ikigai.app.new("streamed-app").build()
+    for idx in range(NUM_DATASETS):
+        dataset_id = f"streamed-{idx:06d}"
+        standin_platform.datasets[dataset_id] = {
+            "project_id": app.app_id,
+            "dataset_id": dataset_id,
+            "name": f"dataset-{idx}",
+            "filename": f"dataset-{idx}.csv",
+            "data_types": {},
+            "directory": {},
+            "is_optimized": False,
+            "file_extension": "csv",
+            "size": 1024,
+            "is_visible": True,
+            "created_at": "1700000000",
+            "modified_at": "1700000000",
+        }
+
+    datasets = app.datasets.iter()
+    first = next(datasets)
+    assert first.name == "dataset-0"
+    assert [dataset.name for dataset in datasets] == [
+        f"dataset-{idx}" for idx in range(1, NUM_DATASETS)
+    ]
+
+    standin.route(
+        "GET",
+        "/component/get-projects-for-user",
+        lambda _: StandInResponse(
+            body={"projects": [], "limit_warning": "Too many projects"}
+        ),
+    )
+    with caplog.at_level(logging.WARNING, logger="ikigai.client.api"):
+        assert list(ikigai.apps.iter()) == []
+    assert "Too many projects" in caplog.text
@@ -0,0 +1,47 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from ikigai import Ikigai
+from tests.standin import StandInServer
+
+NUM_APPS = 8
+NUM_LOOKUPS = 64
+NUM_WORKERS = 16
+
+
+def test_shared_client_across_threads(
+    standin: StandInServer, standin_ikigai: partial[Ikigai]
+) -> None:
+    # Every lookup is sent, instead of sharing the response of a concurrent one
+    ikigai = standin_ikigai(coalesce_requests=False)
+    app_ids = {
+        ikigai.app.new(f"app-{idx}").build().app_id: f"app-{idx}"
+        for idx in range(NUM_APPS)
+    }
+
+    def lookup(idx: int) -> tuple[str, str]:
+        app = ikigai.apps[f"app-{idx % NUM_APPS}"]
+        return app.app_id, app.name
+
+    with ThreadPoolExecutor(max_workers=NUM_WORKERS) as executor:
+        found = list(executor.map(lookup, range(NUM_LOOKUPS)))
+
+    assert found == [
+        (app_id, name)
+        for idx in range(NUM_LOOKUPS)
+        for app_id, name in app_ids.items()
+        if name == f"app-{idx % NUM_APPS}"
+    ]
+    # Every thread sends the credentials of the shared client
+    lookups = [
+        request
+        for request in standin.requests_to("/component/get-project")
+        if "name" in request.params
+    ]
+    assert len(lookups) == NUM_LOOKUPS
+    assert {request.headers["api-key"] for request in lookups} == {"api-key"}
+    assert len(standin.requests_to("/search/heartbeat")) <= 1
@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: 2026-present ikigailabs.io <harsh@ikigailabs.io>
+#
+# SPDX-License-Identifier: MIT
+
+import json
+from functools import partial
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+
+from ikigai import Ikigai
+from ikigai.client import FileSpanExporter, OTLPSpanExporter, Tracer
+from tests.standin import StandInResponse, StandInServer
+
+
+@pytest.fixture()
+def ikigai(standin: StandInServer, standin_ikigai: partial[Ikigai]) -> Ikigai:
+    standin.route(
+        "GET",
+        "/search/search-projects-for-user",
+        lambda _: StandInResponse(body={"projects": [], "limit_warning": ""}),
+    )
+    return standin_ikigai()
+
+
+def test_tracing_spans(standin: StandInServer, ikigai: Ikigai, tmp_path: Path) -> None:
+    spans_file = tmp_path / "spans.jsonl"
+    tracer = Tracer(exporter=FileSpanExporter(spans_file))
+    ikigai.set_tracer(tracer)
+
+    with tracer.span("search-twice", query="app") as root:
+        ikigai.apps.search("app")
+        bulk = ikigai.bulk(max_workers=2)
+        bulk.submit(ikigai.apps.search, "app")
+        bulk.run().raise_on_error()
+
+    def fail() -> None:
+        error_msg = "failed"
+        raise ValueError(error_msg)
+
+    with pytest.raises(ValueError, match="failed"), tracer.span("failing"):
+        fail()
+
+    tracer.flush()
+    spans = [json.loads(line) for line in spans_file.read_text().splitlines()]
+    spans_by_name: dict[str, list[dict]] = {}
+    for span in spans:
+        spans_by_name.setdefault(span["name"], []).append(span)
+
+    (root_span,) = spans_by_name["search-twice"]
+    assert root_span["span_id"] == root.span_id
+    assert root_span["parent_span_id"] is None
+    assert root_span["attributes"] == {"query": "app"}
+
+    request_spans = spans_by_name["GET /search/search-projects-for-user"]
+    assert [span["parent_span_id"] for span in request_spans] == [root.span_id] * 2
+    assert {span["trace_id"] for span in request_spans} == {root.trace_id}
+    assert all(span["kind"] == "CLIENT" for span in request_spans)
+    assert all(
+        span["attributes"]["http.status_code"] == HTTPStatus.OK
+        for span in request_spans
+    )
+
+    traceparents = {
+        request.headers["traceparent"]
+        for request in standin.requests_to("/search/search-projects-for-user")
+    }
+    assert traceparents == {
+        f"00-{span['trace_id']}-{span['span_id']}-01" for span in request_spans
+    }
+
+    (failing_span,) = spans_by_name["failing"]
+    assert failing_span["status"] == "ERROR"
+    assert failing_span["trace_id"] != root.trace_id
+
+    # Requests are no longer traced once the tracer is removed
+    ikigai.set_tracer(None)
+    ikigai.apps.search("app")
+    tracer.flush()
+    assert len(spans_file.read_text().splitlines()) == len(spans)
+
+
+def test_tracing_otlp_export(standin: StandInServer, ikigai: Ikigai) -> None:
+    standin.route("POST", "/v1/traces", lambda _: StandInResponse())
+    tracer = Tracer(
+        exporter=OTLPSpanExporter(endpoint=f"{standin.base_url}/v1/traces"),
+        batch_size=2,
+    )
+    ikigai.set_tracer(tracer)
+
+    with tracer.span("search"):
+        ikigai.apps.search("app")
+    tracer.shutdown()
+
+    (export,) = standin.requests_to("/v1/traces")
+    (resource_spans,) = export.json()["resourceSpans"]
+    (scope_spans,) = resource_spans["scopeSpans"]
+    request_span, root_span = scope_spans["spans"]
+    assert root_span["name"] == "search"
+    assert "parentSpanId" not in root_span
+    assert request_span["parentSpanId"] == root_span["spanId"]
+    assert request_span["traceId"] == root_span["traceId"]
+    assert {"key": "http.status_code", "value": {"intValue": "200"}} in request_span[
+        "attributes"
+    ]